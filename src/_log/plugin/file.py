@@ -1,11 +1,158 @@
+"""
+Write log messages to a file.
+
+The file is kept open and messages are buffered, the buffer is written when it holds "log_file_flush_size" bytes,
+"log_file_flush_interval" seconds after the first message was buffered, or when logging is closed.
+The file is rotated when it would grow past "log_file_max_bytes" or has been open for "log_file_rotate_interval"
+seconds; the current file is renamed with a ".1" suffix, older files move up one suffix,
+and only "log_file_backups" of them are kept. A value of 0 disables either kind of rotation.
+Each message is written on its own line.
+"""
+
+DEFAULTS = {
+    "log_file": "~/.pns/pns.log",
+    "log_file_flush_interval": 1.0,
+    "log_file_flush_size": 65536,
+    "log_file_max_bytes": 0,
+    "log_file_rotate_interval": 0.0,
+    "log_file_backups": 5,
+}
+
+
+async def __init__(hub):
+    hub.log.file.HANDLE = None
+    hub.log.file.PATH = None
+    hub.log.file.OPENED = 0
+    hub.log.file.BUFFER = []
+    hub.log.file.BUFFERED = 0
+    hub.log.file.TIMER = None
+    hub.log.file.TASK = None
+    # The lock that serializes flushes, and the loop it was created on
+    hub.log.file.LOCK = None
+    hub.log.file.LOOP = None
+
+
+def _opt(hub, name: str):
+    """
+    The value of a file logging option, converted to the type of its default.
+    """
+    value = hub.log.OPTS.get(name)
+    if value is None or value == "":
+        return DEFAULTS[name]
+    return type(DEFAULTS[name])(value)
+
+
+def _lock(hub):
+    """
+    The lock that serializes flushes, created on the running loop.
+    With a "thread" log worker the buffer is flushed on the worker's loop instead of the hub's.
+    """
+    loop = hub.lib.asyncio.get_running_loop()
+    if hub.log.file.LOOP is not loop:
+        hub.log.file.LOCK = hub.lib.asyncio.Lock()
+        hub.log.file.LOOP = loop
+    return hub.log.file.LOCK
+
+
 async def process(hub, msg: str):
     """
-    Asynchronously append a log message to a file.
+    Buffer a log message to be appended to the file.
+    """
+    await hub.log.file.process_batch([msg])
+
+
+async def process_batch(hub, msgs: list[str]):
+    """
+    Buffer log messages to be appended to the file, writing the buffer once it is full.
     """
-    path = hub.lib.aiopath.Path(hub.OPT.log.log_file).expanduser()
-    if not await path.parent.exists():
-        await path.parent.mkdir(parents=True, exist_ok=True)
-    await path.touch(exist_ok=True)
+    for msg in msgs:
+        hub.log.file.BUFFER.append(f"{msg}\n")
+        hub.log.file.BUFFERED += len(msg) + 1
+
+    if hub.log.file.BUFFERED >= _opt(hub, "log_file_flush_size"):
+        await hub.log.file.flush()
+    elif hub.log.file.TIMER is None:
+        # Write whatever is buffered once the flush interval has passed
+        hub.log.file.TIMER = hub.lib.asyncio.get_running_loop().call_later(
+            _opt(hub, "log_file_flush_interval"), _flush_later, hub
+        )
 
-    async with path.open("a") as f:
-        await f.write(msg)
+
+def _flush_later(hub):
+    """
+    Flush the buffer from a timer, keeping a reference to the task until it is done.
+    """
+    hub.log.file.TIMER = None
+    hub.log.file.TASK = hub.lib.asyncio.get_running_loop().create_task(
+        hub.log.file.flush()
+    )
+
+
+async def flush(hub):
+    """
+    Write the buffered log messages to the file, rotating it first if it is due.
+    """
+    if hub.log.file.TIMER is not None:
+        hub.log.file.TIMER.cancel()
+        hub.log.file.TIMER = None
+
+    async with _lock(hub):
+        if not hub.log.file.BUFFER:
+            return
+        data = "".join(hub.log.file.BUFFER).encode()
+        hub.log.file.BUFFER = []
+        hub.log.file.BUFFERED = 0
+        await hub.lib.asyncio.to_thread(_write, hub, data)
+
+
+def _write(hub, data: bytes):
+    """
+    Append data to the log file, opening and rotating it as needed.
+    This runs in a worker thread so the event loop isn't blocked on disk I/O.
+    """
+    f = hub.log.file
+    if f.HANDLE is None:
+        f.PATH = hub.lib.pathlib.Path(_opt(hub, "log_file")).expanduser()
+        f.PATH.parent.mkdir(parents=True, exist_ok=True)
+        f.HANDLE = open(f.PATH, "ab")
+        f.OPENED = hub.lib.time.monotonic()
+
+    max_bytes = _opt(hub, "log_file_max_bytes")
+    rotate_interval = _opt(hub, "log_file_rotate_interval")
+    size = f.HANDLE.tell()
+    if max_bytes and size and size + len(data) > max_bytes:
+        _rotate(hub)
+    elif rotate_interval and hub.lib.time.monotonic() - f.OPENED >= rotate_interval:
+        _rotate(hub)
+
+    f.HANDLE.write(data)
+    f.HANDLE.flush()
+
+
+def _rotate(hub):
+    """
+    Move the log file aside and start a new one.
+    """
+    f = hub.log.file
+    f.HANDLE.close()
+    backups = _opt(hub, "log_file_backups")
+    if backups > 0:
+        for i in range(backups - 1, 0, -1):
+            src = f.PATH.with_name(f"{f.PATH.name}.{i}")
+            if src.exists():
+                src.replace(f.PATH.with_name(f"{f.PATH.name}.{i + 1}"))
+        f.PATH.replace(f.PATH.with_name(f"{f.PATH.name}.1"))
+    else:
+        f.PATH.unlink(missing_ok=True)
+    f.HANDLE = open(f.PATH, "ab")
+    f.OPENED = hub.lib.time.monotonic()
+
+
+async def close(hub):
+    """
+    Write the buffered log messages and close the file.
+    """
+    await hub.log.file.flush()
+    if hub.log.file.HANDLE is not None:
+        hub.log.file.HANDLE.close()
+        hub.log.file.HANDLE = None
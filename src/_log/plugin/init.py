@@ -1,6 +1,39 @@
 import asyncio
+import collections
 import logging
 import functools
+import queue
+import threading
+
+# The level numbers of the names the logging functions are aliased by
+LEVELS = {
+    "trace": 5,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+# The policies for records that don't fit in a full queue
+OVERFLOW = ("block", "drop_oldest", "drop_level", "sample")
+# Where records are formatted and passed to the log plugin
+WORKERS = ("loop", "thread")
+
+
+class _Done:
+    """
+    An awaitable that is already complete, one instance is shared by every call to log.
+    """
+
+    __slots__ = ()
+
+    def __await__(self):
+        return iter(())
+
+
+DONE = _Done()
 
 
 async def __init__(hub):
@@ -10,6 +43,12 @@ async def __init__(hub):
     hub.log.INT_LEVEL = hub.lib.logging.INFO
     hub.log.QUEUE = hub.lib.asyncio.Queue()
     hub.log.LISTENER = None
+    # The most records the listener takes from the queue at once
+    hub.log.BATCH_SIZE = 1000
+    # The options given to setup for the log plugins, i.e. "log_file"
+    hub.log.OPTS = {}
+    # The number of records dropped from a full queue, by level name
+    hub.log.DROPPED = collections.Counter()
 
     # Set up aliases for each log function
     hub.log.trace = hub.log.init.trace
@@ -34,30 +73,89 @@ async def close(hub):
     Shut down the logging listener.
     This allows all remaining logs to be processed before the program exits.
     """
-    if hub.log.LISTENER:
-        hub.log.QUEUE.put_nowait(None)
+    if isinstance(hub.log.LISTENER, threading.Thread):
+        await hub.lib.asyncio.to_thread(hub.log.QUEUE.put, None)
+        await hub.lib.asyncio.to_thread(hub.log.LISTENER.join)
+        hub.log.LISTENER = None
+    elif hub.log.LISTENER:
+        await hub.log.QUEUE.put(None)
         await hub.log.LISTENER
+        hub.log.LISTENER = None
+
+    # Stop sending records to this hub's queue, the root logger outlives it
+    if hub.log.HANDLER:
+        hub.log.LOGGER.removeHandler(hub.log.HANDLER)
+        hub.log.HANDLER = None
+        hub.log.LOGGER = None
 
 
 def log(hub, level: str, *args, **kwargs):
     """
     Log a message with the given name and arguments.
     """
-    # This makes the logging functions awaitable but it isn't necessary
-    awaitable = hub.lib.asyncio.create_task(hub.lib.asyncio.sleep(0))
+    # The returned awaitable makes the logging functions awaitable but it isn't necessary
     if not hub.log.LOGGER:
-        return awaitable
-    int_level = hub.lib.logging.getLevelName(level.upper())
+        return DONE
+    int_level = LEVELS.get(level)
+    if int_level is None:
+        int_level = hub.lib.logging.getLevelName(level.upper())
+    # Skip building a record for messages below the level of the logger
+    if not hub.log.LOGGER.isEnabledFor(int_level):
+        return DONE
     hub.log.LOGGER.log(int_level, *args, extra={"hub": hub}, **kwargs)
-    return awaitable
+
+    # Awaiting a message that is waiting for room in a full queue blocks the caller
+    return hub.log.HANDLER.take_pending()
 
 
 class QueueHandler(logging.Handler):
-    """A custom logging handler that puts log messages into a shared queue."""
+    """
+    A custom logging handler that puts log messages into a shared queue.
+    The queue is an asyncio.Queue for a listener on the event loop, or a queue.Queue or queue.SimpleQueue
+    for a listener in a worker thread.
 
-    def __init__(self, queue: asyncio.Queue):
+    When the queue is full, the overflow policy decides what happens to a new record:
+        - block: The record waits for room in a task, callers that await the log call wait with it.
+            At most as many records as the queue holds wait at once, past that the oldest record
+            in the queue is dropped to make room, as with drop_oldest.
+            An asyncio.Queue can only be waited on from its own loop, records logged on another loop,
+            i.e. the bridge loop of pns.loop.run, make room as with drop_oldest.
+        - drop_oldest: The oldest record in the queue is dropped to make room.
+        - drop_level: The record is dropped if it is below the overflow level,
+            otherwise the oldest record in the queue is dropped to make room.
+        - sample: One of every "overflow_sample" records replaces the oldest record in the queue,
+            the others are dropped.
+    Dropped records are counted by level name.
+    """
+
+    def __init__(
+        self,
+        queue: asyncio.Queue | queue.Queue | queue.SimpleQueue,
+        overflow: str = "block",
+        overflow_level: int = logging.WARNING,
+        overflow_sample: int = 10,
+        dropped: collections.Counter = None,
+        loop: asyncio.AbstractEventLoop = None,
+    ):
         super().__init__()
+        if overflow not in OVERFLOW:
+            msg = (
+                f"Unknown log overflow policy '{overflow}', expected one of {OVERFLOW}"
+            )
+            raise ValueError(msg)
         self.queue = queue
+        # The loop an asyncio.Queue belongs to, records only wait for room in it on that loop
+        self.loop = loop
+        self.overflow = overflow
+        self.overflow_level = overflow_level
+        self.overflow_sample = max(int(overflow_sample), 1)
+        self.dropped = collections.Counter() if dropped is None else dropped
+        # The task of the record this thread just logged through the hub, if it is waiting for room in the queue
+        self._pending = threading.local()
+        # The number of records waiting for room in the queue, and how many can wait at once
+        self.waiting = 0
+        self.max_waiting = max(getattr(queue, "maxsize", 0), 1)
+        self._overflowed = 0
 
     def emit(self, record):
         """Put log record into the queue."""
@@ -65,7 +163,89 @@ class QueueHandler(logging.Handler):
             hub = record.hub
             ref = hub._last_ref or "hub"
             record.name = ref
-        self.queue.put_nowait(record)
+        try:
+            self.queue.put_nowait(record)
+        except (asyncio.QueueFull, queue.Full):
+            pending = self.handle_overflow(record)
+            # Only the log call that made this record gets to wait on it
+            if pending is not None and hasattr(record, "hub"):
+                self._pending.task = pending
+
+    def take_pending(self):
+        """
+        The task of the record this thread just logged through the hub, if it is waiting for room in the queue,
+        otherwise an awaitable that is already done.
+        """
+        pending = getattr(self._pending, "task", None)
+        if pending is None:
+            return DONE
+        self._pending.task = None
+        return pending
+
+    def handle_overflow(self, record):
+        """
+        Apply the overflow policy to a record that didn't fit in the queue.
+        Returns the task of the record if it is waiting for room in the queue.
+        """
+        if self.overflow == "block":
+            threaded = not isinstance(self.queue, asyncio.Queue)
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # There is no loop in this thread to wait on, only a thread queue can block this thread
+                if threaded:
+                    self.queue.put(record)
+                else:
+                    self.drop(record)
+                return
+            own_loop = threaded or self.loop is None or loop is self.loop
+            if self.waiting < self.max_waiting and own_loop:
+                self.waiting += 1
+                if threaded:
+                    pending = loop.run_in_executor(None, self.queue.put, record)
+                else:
+                    pending = loop.create_task(self.queue.put(record))
+                pending.add_done_callback(self._put_done)
+                return pending
+            # Too many records are already waiting, make room instead of piling up more tasks,
+            # or this loop can't wait on the queue of another loop
+
+        if self.overflow == "drop_level" and record.levelno < self.overflow_level:
+            self.drop(record)
+            return
+
+        if self.overflow == "sample":
+            self._overflowed += 1
+            if self._overflowed % self.overflow_sample:
+                self.drop(record)
+                return
+
+        try:
+            oldest = self.queue.get_nowait()
+        except (asyncio.QueueEmpty, queue.Empty):
+            # A listener in a worker thread made room in the meantime
+            oldest = False
+        if oldest is None:
+            # Keep the signal to shut down the listener
+            self.queue.put_nowait(oldest)
+            self.drop(record)
+            return
+        if oldest is not False:
+            self.drop(oldest)
+        try:
+            self.queue.put_nowait(record)
+        except (asyncio.QueueFull, queue.Full):
+            # Producers in other threads filled the room that was made
+            self.drop(record)
+
+    def _put_done(self, _):
+        """A record that was waiting for room is in the queue."""
+        with self.lock:
+            self.waiting -= 1
+
+    def drop(self, record):
+        """Count a record that won't be logged."""
+        self.dropped[record.levelname] += 1
 
 
 async def setup(
@@ -75,23 +255,44 @@ async def setup(
     log_level: str,
     log_fmt: str = None,
     log_datefmt: str = None,
+    log_queue_size: int = 0,
+    log_overflow: str = "block",
+    log_overflow_level: str = "warning",
+    log_overflow_sample: int = 10,
+    log_worker: str = "loop",
     **kwargs,
 ):
     """
-    Initialize the logger with the named plugin
+    Initialize the logger with the named plugin.
+    A log_queue_size above 0 bounds the queue of records waiting for the plugin,
+    log_overflow selects what happens to records that don't fit, see QueueHandler.
+    With a log_worker of "thread", records are formatted and passed to the plugin on a dedicated thread
+    with its own event loop, instead of on the hub's event loop.
     """
+    if log_worker not in WORKERS:
+        msg = f"Unknown log worker '{log_worker}', expected one of {WORKERS}"
+        raise ValueError(msg)
+    hub.log.OPTS = kwargs
+
     # Set up trace logger
     hub.lib.logging.addLevelName(5, "TRACE")
-    log_level = log_level.split(" ")[-1].upper()
+    hub.log.INT_LEVEL = _int_level(hub, log_level)
 
-    # Convert log level to integer
-    if str(log_level).isdigit():
-        hub.log.INT_LEVEL = int(log_level)
+    maxsize = int(log_queue_size or 0)
+    if log_worker == "thread":
+        # Producers hand records to the worker without taking a lock unless the queue is bounded
+        hub.log.QUEUE = queue.Queue(maxsize) if maxsize else queue.SimpleQueue()
     else:
-        hub.log.INT_LEVEL = hub.lib.logging.getLevelName(log_level)
-
+        hub.log.QUEUE = hub.lib.asyncio.Queue(maxsize=maxsize)
     hub.log.FORMATTER = logging.Formatter(fmt=log_fmt, datefmt=log_datefmt)
-    hub.log.HANDLER = QueueHandler(hub.log.QUEUE)
+    hub.log.HANDLER = QueueHandler(
+        hub.log.QUEUE,
+        overflow=log_overflow,
+        overflow_level=_int_level(hub, log_overflow_level),
+        overflow_sample=log_overflow_sample,
+        dropped=hub.log.DROPPED,
+        loop=hub._loop,
+    )
     hub.log.HANDLER.setFormatter(hub.log.FORMATTER)
     hub.log.LOGGER = logging.getLogger()
     hub.log.LOGGER.setLevel(hub.log.INT_LEVEL)
@@ -99,19 +300,99 @@ async def setup(
 
     # Create a listener for the new logger
     listener = hub.log.init.listener(log_plugin)
-    hub.log.LISTENER = hub._loop.create_task(listener)
+    if log_worker == "thread":
+        hub.log.LISTENER = threading.Thread(
+            target=asyncio.run, args=(listener,), name="pns-log", daemon=True
+        )
+        hub.log.LISTENER.start()
+    else:
+        hub.log.LISTENER = hub._loop.create_task(listener)
+
+
+def _int_level(hub, level: str) -> int:
+    """
+    Convert the name or number of a log level to its number.
+    """
+    level = str(level).split(" ")[-1].upper()
+    if level.isdigit():
+        return int(level)
+    return hub.lib.logging.getLevelName(level)
 
 
 async def listener(hub, log_plugin: str):
     """
-    As messages come in, pass them through the log plugin
+    As messages come in, pass them through the log plugin.
+    Records that are already waiting are taken together and passed to the plugin's
+    process_batch function, if it has one, so it can write them at once.
+    A plugin with a process_records function is passed the records themselves, without formatting them.
+    When the listener is shut down, the plugin's close function is called, if it has one.
+    """
+    log_queue = hub.log.QUEUE
+    threaded = not isinstance(log_queue, asyncio.Queue)
+    plugin = hub.log[log_plugin]
+    process_batch = getattr(plugin, "process_batch", None)
+    process_records = getattr(plugin, "process_records", None)
+    if threaded:
+        # Wait for records in a daemon thread, so the plugin's callbacks keep running on this loop
+        # and a listener that is never closed doesn't hold up the interpreter's exit
+        wanted = threading.Event()
+        inbox = asyncio.Queue()
+        threading.Thread(
+            target=_read,
+            args=(log_queue, asyncio.get_running_loop(), wanted, inbox),
+            name="pns-log-reader",
+            daemon=True,
+        ).start()
+    running = True
+    while running:
+        if threaded:
+            wanted.set()
+            records = [await inbox.get()]
+        else:
+            records = [await log_queue.get()]
+        while len(records) < hub.log.BATCH_SIZE and not log_queue.empty():
+            records.append(log_queue.get_nowait())
+        if None in records:
+            # Process what came in before the shut down
+            records = records[: records.index(None)]
+            running = False
+
+        if not records:
+            continue
+        if process_records is not None:
+            await process_records(records)
+            continue
+
+        msgs = [hub.log.FORMATTER.format(record) for record in records]
+        if process_batch is not None:
+            await process_batch(msgs)
+        else:
+            for msg in msgs:
+                await plugin.process(msg)
+
+    # The init plugin's close is what shuts down this listener
+    if log_plugin != "init" and hasattr(plugin, "close"):
+        await plugin.close()
+
+
+def _read(
+    log_queue: queue.Queue | queue.SimpleQueue,
+    loop: asyncio.AbstractEventLoop,
+    wanted: threading.Event,
+    inbox: asyncio.Queue,
+):
+    """
+    Pass records from a thread queue to the listener on the worker's loop, until it is shut down.
+    A record is only taken from the queue when the listener wants one, so the queue still bounds
+    the records waiting for the plugin and the listener can take the rest of a batch itself.
     """
     while True:
-        record = await hub.log.QUEUE.get()
+        wanted.wait()
+        wanted.clear()
+        record = log_queue.get()
+        loop.call_soon_threadsafe(inbox.put_nowait, record)
         if record is None:
-            break
-        msg = hub.log.FORMATTER.format(record)
-        await hub.log[log_plugin].process(msg)
+            return
 
 
 async def process(hub, msg: str):
@@ -0,0 +1,95 @@
+"""
+Call metrics for the functions on the hub.
+
+While call metrics are enabled, every call made through the hub records the number of calls, the cumulative
+and own wall time, the number of calls that raised an exception, and the most calls that were in progress at once,
+for the function that was called. Call metrics are enabled with the "pns.call_metrics" config option,
+the 'PNS_CALL_METRICS' environment variable, or `enable`; while they are disabled calls don't record anything.
+"""
+
+import pns.contract
+
+SORT_KEYS = ("calls", "errors", "peak", "total_ms", "own_ms", "mean_ms")
+
+
+def enable(hub, enabled: bool = True):
+    """
+    Start or stop recording call metrics.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+        enabled (bool): Whether call metrics should be recorded.
+    """
+    pns.contract.call_metrics(enabled)
+
+
+def reset(hub):
+    """
+    Discard the call metrics recorded so far.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+    """
+    pns.contract.METRICS.clear()
+
+
+def get(hub, sort: str = "own_ms", limit: int = None) -> dict[str, dict]:
+    """
+    Collect the call metrics recorded so far for each function by its reference on the hub.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+        sort (str): The metric to sort by, highest first.
+        limit (int): The number of functions to include, defaults to all of them.
+
+    Returns:
+        dict: The calls, errors, peak concurrency, and total, own, and mean milliseconds of each function.
+    """
+    if sort not in SORT_KEYS:
+        msg = f"Unknown metric '{sort}', expected one of {SORT_KEYS}"
+        raise ValueError(msg)
+
+    collected = {}
+    for metrics in list(pns.contract.METRICS.values()):
+        # A function that was reloaded is reported under the same reference
+        ref = metrics.contract.__ref__
+        ret = collected.setdefault(
+            ref, {"calls": 0, "errors": 0, "peak": 0, "total_ns": 0, "own_ns": 0}
+        )
+        ret["calls"] += metrics.calls
+        ret["errors"] += metrics.errors
+        ret["peak"] = max(ret["peak"], metrics.peak)
+        ret["total_ns"] += metrics.total_ns
+        ret["own_ns"] += metrics.own_ns
+
+    for ret in collected.values():
+        total_ns = ret.pop("total_ns")
+        own_ns = ret.pop("own_ns")
+        ret["total_ms"] = round(total_ns / 1e6, 3)
+        ret["own_ms"] = round(own_ns / 1e6, 3)
+        ret["mean_ms"] = round(total_ns / 1e6 / ret["calls"], 3) if ret["calls"] else 0
+
+    ordered = sorted(collected.items(), key=lambda item: item[1][sort], reverse=True)
+    return dict(ordered[:limit])
+
+
+async def dump(
+    hub, outputter: str = "json", path: str = None, sort: str = "own_ms"
+) -> str:
+    """
+    Render the call metrics recorded so far with an outputter.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+        outputter (str): The name of the outputter on hub.output, i.e. "json" or "yaml".
+        path (str): A file to write the rendered metrics to.
+        sort (str): The metric to sort by, highest first.
+
+    Returns:
+        str: The rendered metrics.
+    """
+    formatted = await hub.output[outputter].display(hub.pop.metrics.get(sort=sort))
+    if path:
+        async with hub.lib.aiofiles.open(hub.lib.os.path.expanduser(path), "w") as fh:
+            await fh.write(formatted)
+    return formatted
@@ -0,0 +1,65 @@
+"""
+Sample the stacks of the calls made through the hub to find where wall time goes.
+
+The samples are stacks of hub references, exported in the folded stack format that flame graph tools read,
+see `pns.sampler`. A whole run can be sampled with the "pns.sample" config option
+or the 'PNS_SAMPLE' environment variable, which name the file the samples are written to at exit.
+"""
+
+import pns.sampler
+
+
+def start(hub, interval: float = pns.sampler.INTERVAL):
+    """
+    Start sampling the active calls in a background thread.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+        interval (float): Seconds between samples.
+    """
+    pns.sampler.start(interval)
+
+
+def stop(hub):
+    """
+    Stop sampling, the samples taken so far are kept.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+    """
+    pns.sampler.stop()
+
+
+def reset(hub):
+    """
+    Discard the samples taken so far.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+    """
+    pns.sampler.reset()
+
+
+def folded(hub) -> str:
+    """
+    Export the samples taken so far in the folded stack format.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+
+    Returns:
+        str: A line of "outer;inner count" for each sampled stack.
+    """
+    return pns.sampler.folded()
+
+
+async def dump(hub, path: str):
+    """
+    Write the samples taken so far in the folded stack format to a file.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub instance.
+        path (str): The file to write.
+    """
+    async with hub.lib.aiofiles.open(hub.lib.os.path.expanduser(path), "w") as fh:
+        await fh.write(pns.sampler.folded())
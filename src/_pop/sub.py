@@ -19,6 +19,7 @@ async def add(
     sub: pns.hub.Sub = None,
     locations: list[pathlib.Path] = (),
     contract_locations: list[pathlib.Path] = (),
+    lazy: bool = False,
 ):
     """
     Adds a new subsystem to the hub or extends an existing subsystem with additional directories.
@@ -33,6 +34,8 @@ async def add(
         sub (pns.hub.Sub, optional): The root subsystem under which the new subsystem is added. Defaults to the main hub.
         locations (list[pathlib.Path]): A list of directory paths where the subsystem's resources are located.
         contract_locations (list[pathlib.Path]): A list of directory paths containing contracts for the subsystem.
+        lazy (bool, optional): Register the subsystem's modules without loading them, each module is loaded
+            when it is first accessed or when the subsystem is loaded with `load`.
 
     Returns:
         None: This function does not return a value but modifies the hub instance by adding or extending subsystems.
@@ -53,9 +56,10 @@ async def add(
 
     try:
         new_sub = await root.add_sub(
-            name, locations=static, contract_locations=contract_locations
+            name, locations=static, contract_locations=contract_locations, lazy=lazy
         )
-        await new_sub._load_all(hard_fail=True)
+        if not lazy:
+            await new_sub._load_all(hard_fail=True)
     except Exception as e:
         await hub.log.error(f"Failed to load subsystem {name}: {e}")
 
@@ -64,7 +68,33 @@ SPECIAL = ["contracts", "rcontracts"]
 OMIT_START = ["_", "."]
 
 
-async def load_subdirs(hub: pns.hub.Hub, sub: pns.hub.Sub, *, recurse: bool = False):
+async def load(hub: pns.hub.Hub, sub: pns.hub.Sub, *, recurse: bool = False):
+    """
+    Loads every module of a subsystem that was added lazily and hasn't been loaded yet.
+
+    Parameters:
+        hub (pns.hub.Hub): The central hub where the subsystems are managed.
+        sub (pns.hub.Sub): The subsystem to load.
+        recurse (bool, optional): If true, also load the subsystems nested under it.
+
+    Returns:
+        None: This function does not return a value but loads the modules onto the subsystem.
+    """
+    await sub._load_all()
+    if not recurse:
+        return
+    for child in list(sub._nest.values()):
+        if isinstance(child, pns.hub.Sub):
+            await hub.pop.sub.load(child, recurse=recurse)
+
+
+async def load_subdirs(
+    hub: pns.hub.Hub,
+    sub: pns.hub.Sub,
+    *,
+    recurse: bool = False,
+    lazy: bool = False,
+):
     """
     Loads all subdirectories found under the specified sub into a lower namespace on the hub.
 
@@ -75,6 +105,7 @@ async def load_subdirs(hub: pns.hub.Hub, sub: pns.hub.Sub, *, recurse: bool = Fa
         hub (pns.hub.Hub): The central hub where the subsystems are managed.
         sub (pns.hub.Sub): The subsystem under which subdirectories will be loaded.
         recurse (bool, optional): If true, recursively load subdirectories as nested subs.
+        lazy (bool, optional): Register the modules of the nested subs without loading them.
 
     Returns:
         None: This function does not return a value but modifies the hub instance by loading subdirectories.
@@ -99,10 +130,13 @@ async def load_subdirs(hub: pns.hub.Hub, sub: pns.hub.Sub, *, recurse: bool = Fa
             name=name,
             sub=sub,
             locations=sub_dirs,
+            lazy=lazy,
         )
         if recurse:
             if isinstance(getattr(sub, name), pns.hub.Sub):
-                await hub.pop.sub.load_subdirs(getattr(sub, name), recurse=recurse)
+                await hub.pop.sub.load_subdirs(
+                    getattr(sub, name), recurse=recurse, lazy=lazy
+                )
 
 
 async def reload(hub: pns.hub.Hub, name: str) -> bool:
@@ -125,7 +159,7 @@ async def reload(hub: pns.hub.Hub, name: str) -> bool:
     except KeyError as e:
         return False
 
-    hub._nest.pop(name)
+    hub._pop_nest(name)
     await hub.pop.sub.add(
         name=name, locations=locations, contract_locations=contract_locations
     )
@@ -9,9 +9,21 @@ to entire namespaces.
 
 Classes:
     - Context: Manages the function execution context, providing access to arguments, return values, and a cache.
+    - LeanContext: A slotted Context with a lazily created cache, used in lean call mode.
     - ContractType: Enumerates the types of contracts and provides utilities to associate functions with contract types.
+    - ContractList: A list of contracts that recompiles the chains of its Contracted when it is changed in place.
+    - ContractMap: Maps contract types to ContractLists, recompiling the chains of its Contracted when they change.
     - Contracted: A dynamic namespace wrapper that manages the execution of associated contracts.
     - CallStack: Manages the execution stack for contracted functions, ensuring context integrity across calls.
+    - LeanCallStack: A CallStack that pushes and resets a single contextvar, used in lean call mode.
+    - CallMetrics: The call count, timings, errors, and concurrency of a contracted function.
+    - MeteredCall: Records the metrics of each call, mixed into the CallStacks used while call metrics are enabled.
+    - SampledCall: Tracks the innermost call of each task in ACTIVE, mixed into the CallStacks used while sampling.
+
+Functions:
+    - lean_call: Switches lean call mode on or off for every contracted call.
+    - call_metrics: Switches the recording of call metrics on or off for every contracted call.
+    - sampling: Switches the tracking of active calls for the sampler on or off for every contracted call.
 
 The contract system is integral to maintaining consistency and enforcing security and operational policies across
 modular components in complex systems. It is particularly suited to applications where components are loaded dynamically
@@ -19,12 +31,99 @@ and need to interact seamlessly while adhering to strict operational protocols.
 """
 
 import pns.data
+import pns._debug
+import asyncio
+import contextvars
 import enum
 import inspect
+import threading
+import time
 from collections.abc import Callable
 from collections import defaultdict
 from collections.abc import AsyncGenerator, Generator
 
+# The coroutine-local ref and CallStack of the contracted function being executed
+LAST_REF = contextvars.ContextVar("_last_ref", default=None)
+LAST_CALL = contextvars.ContextVar("_last_call", default=None)
+
+# Whether contracted calls allocate lean contexts and call stacks
+LEAN_CALL = pns._debug.LEAN_CALL
+
+# Whether contracted calls record metrics, and the metrics of each contracted function that has been called by its id
+CALL_METRICS = pns._debug.CALL_METRICS
+METRICS = {}
+
+# Whether contracted calls are tracked for the sampler, and the innermost call of each task or thread
+SAMPLING = False
+ACTIVE = {}
+
+
+def lean_call(enabled: bool = True):
+    """
+    Switch lean call mode on or off for every contracted call.
+
+    In lean mode each call allocates a slotted LeanContext whose cache is only created when it is used,
+    and the call stack is tracked with a single contextvar that is pushed and reset with a token.
+    Contracts can't set arbitrary attributes on a LeanContext, which is why the mode is opt-in.
+    Switch modes before any contracted calls are in flight.
+
+    Args:
+        enabled (bool): Whether lean call mode should be used.
+    """
+    global LEAN_CALL
+    LEAN_CALL = bool(enabled)
+    _select_call_stack()
+
+
+def call_metrics(enabled: bool = True):
+    """
+    Switch the recording of call metrics on or off for every contracted call.
+
+    While enabled, each call made through a Contracted updates the CallMetrics of that Contracted in METRICS.
+    While disabled, calls don't pay for any of the bookkeeping.
+
+    Args:
+        enabled (bool): Whether call metrics should be recorded.
+    """
+    global CALL_METRICS
+    CALL_METRICS = bool(enabled)
+    _select_call_stack()
+
+
+def sampling(enabled: bool = True):
+    """
+    Switch the tracking of active calls on or off for every contracted call.
+
+    While enabled, ACTIVE maps each task, or thread outside of an event loop,
+    to the innermost contracted call it is running, see `pns.sampler`.
+
+    Args:
+        enabled (bool): Whether active calls should be tracked.
+    """
+    global SAMPLING
+    SAMPLING = bool(enabled)
+    _select_call_stack()
+
+
+def _select_call_stack():
+    """
+    Pick the CallStack that contracted calls use for the current combination of modes,
+    so that calls don't have to check the modes themselves.
+    """
+    global CALL_STACK
+    CALL_STACK = CALL_STACKS[LEAN_CALL, CALL_METRICS, SAMPLING]
+
+
+def last_ref() -> str:
+    """
+    Get the coroutine-local ref of the contracted function being executed.
+    """
+    if LEAN_CALL:
+        call = LAST_CALL.get()
+        if call is not None:
+            return call.ref
+    return LAST_REF.get()
+
 
 class Context:
     """
@@ -53,6 +152,40 @@ class Context:
         self.return_value = None
 
 
+class LeanContext:
+    """
+    A slotted Context used in lean call mode.
+
+    The cache is only created when a contract uses it and no other attributes can be set.
+
+    Attributes:
+        func (Callable): The function to be executed.
+        args (list): The arguments passed to the function.
+        kwargs (dict): The keyword arguments passed to the function.
+        cache (dict): A cache used to store data that might be reused during the function call lifecycle.
+        return_value (any): The value returned by the function, which can be modified by post contracts.
+    """
+
+    __slots__ = ("func", "__", "args", "kwargs", "_cache", "return_value")
+
+    def __init__(
+        self, hub, __func__: Callable, __parent__: "Contracted", *args, **kwargs
+    ):
+        self.func = __func__
+        self.__ = __parent__
+        # Implicitly add the hub as the first argument of the Contracted call
+        self.args = [hub, *args]
+        self.kwargs = kwargs
+        self._cache = None
+        self.return_value = None
+
+    @property
+    def cache(self) -> dict:
+        if self._cache is None:
+            self._cache = {}
+        return self._cache
+
+
 class ContractType(enum.Enum):
     """
     Enumerates the types of contracts that can be applied to functions within the namespace.
@@ -67,6 +200,8 @@ class ContractType(enum.Enum):
     Methods:
         recursive: Property that indicates if the contract type applies recursively to nested sub-modules
         from_func: Class method that determines the contract type from a function name.
+        classify: Class method that determines the contract type of a function and the function it targets.
+        parse: Class method that determines the contract type and target from a function name.
     """
 
     SIG = "sig"
@@ -90,12 +225,118 @@ class ContractType(enum.Enum):
         """
         Inspect the function name and assign it the appropriate contract type.
         """
-        name = func.__name__
+        return cls.classify(func)[0]
+
+    @classmethod
+    def classify(cls, func: Callable) -> tuple["ContractType", str]:
+        """
+        Determine the contract type of a function and the name of the function it targets.
+        Contracted functions are classified once when they are wrapped.
+        """
+        classified = getattr(func, "_contract_class", None)
+        if classified is None:
+            classified = cls.parse(func.__name__)
+        return classified
+
+    @classmethod
+    def parse(cls, name: str) -> tuple["ContractType", str]:
+        """
+        Split a function name like "r_pre_func" into its contract type and the function it targets.
+
+        Returns:
+            tuple: The contract type and the target function name, an empty string for universal contracts;
+                (None, None) if the name isn't a contract.
+        """
+        parts = name.split("_", 2)
+        ctype = CONTRACT_TYPES.get(parts[0])
+        if ctype is None and len(parts) > 1:
+            ctype = CONTRACT_TYPES.get(f"{parts[0]}_{parts[1]}")
+        if ctype is None:
+            return None, None
+        return ctype, name[len(ctype.value) + 1 :]
+
+
+# Contract types by their function name prefix
+CONTRACT_TYPES = {ctype.value: ctype for ctype in ContractType}
+
+
+class ContractList(list):
+    """
+    A list of contracts that recompiles the chains of its Contracted whenever it is changed in place.
+
+    Attributes:
+        owner (Contracted): The contracted function whose chains are compiled from this list.
+    """
+
+    def __init__(self, owner: "Contracted", funcs=()):
+        super().__init__(funcs)
+        self.owner = owner
+
+
+def _recompiles(name: str):
+    """
+    Wrap a list method so that it recompiles the chains of the owner after changing the list.
+    """
+    method = getattr(list, name)
+
+    def wrapper(self, *args):
+        ret = method(self, *args)
+        self.owner.__compile_contracts__()
+        return ret
+
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(ContractList, _name, _recompiles(_name))
+
+
+class ContractMap(defaultdict):
+    """
+    A mapping of contract types to lists of contracts that keeps the precompiled chains of its Contracted current.
+
+    Contracts are kept in a ContractList, so assigning or removing a contract list and changing a list in place,
+    i.e. `func.contracts[ContractType.PRE].append(f)`, both recompile the chains.
+    Assigned lists are copied, later changes to the original list don't apply.
+
+    Attributes:
+        owner (Contracted): The contracted function whose chains are compiled from this mapping.
+    """
+
+    def __init__(self, owner: "Contracted", contracts: dict = None):
+        super().__init__(list)
+        self.owner = owner
+        if contracts:
+            for contract_type, funcs in contracts.items():
+                super().__setitem__(contract_type, ContractList(owner, funcs))
+
+    def __missing__(self, contract_type: ContractType) -> ContractList:
+        funcs = ContractList(self.owner)
+        super().__setitem__(contract_type, funcs)
+        return funcs
+
+    def __setitem__(self, contract_type: ContractType, funcs: list[Callable]):
+        super().__setitem__(contract_type, ContractList(self.owner, funcs))
+        self.owner.__compile_contracts__()
 
-        # Try to match the remaining portion
-        for ctype in cls:
-            if (ctype.value == name) or name.startswith(f"{ctype.value}_"):
-                return ctype
+    def __delitem__(self, contract_type: ContractType):
+        super().__delitem__(contract_type)
+        self.owner.__compile_contracts__()
 
 
 class Contracted(pns.data.Namespace):
@@ -104,10 +345,14 @@ class Contracted(pns.data.Namespace):
 
     This class acts as a container for contracted functions, ensuring that any associated contracts are executed
     in the correct order and that the function context is managed appropriately.
+    The pre, call, and post chains are compiled into tuples whenever the contracts change,
+    and functions without any contracts are called directly.
 
     Attributes:
         func (Callable): The wrapped function.
-        contracts (dict): A mapping of contract types to lists of callables representing the contracts.
+        contracts (ContractMap): A mapping of contract types to lists of callables representing the contracts.
+        _contract_class (tuple): The contract type of the wrapped function itself and the function it targets,
+            see `ContractType.parse`.
 
     Methods:
         __call__: Asynchronously executes the wrapped function along with its contracts.
@@ -122,7 +367,8 @@ class Contracted(pns.data.Namespace):
     ):
         super().__init__(name, **kwargs)
         self.func = func
-        self.contracts = contracts or defaultdict(list)
+        self.contracts = contracts
+        self._contract_class = ContractType.parse(self.__name__)
 
     def __new__(cls, name: str, func: Callable, contracts=None, **kwargs):
         """
@@ -137,12 +383,52 @@ class Contracted(pns.data.Namespace):
         else:
             return super().__new__(Contracted)
 
+    @property
+    def contracts(self) -> ContractMap:
+        """
+        The contracts that apply to the wrapped function, by type.
+        """
+        return self._contracts
+
+    @contracts.setter
+    def contracts(self, contracts: dict[ContractType, list[Callable]]):
+        """
+        Replace the contracts of the wrapped function and recompile the chains.
+        """
+        self._contracts = ContractMap(self, contracts)
+        self.__compile_contracts__()
+
+    def __compile_contracts__(self):
+        """
+        Freeze the pre, call, and post contracts into the chains used by every call.
+        """
+        contracts = self._contracts
+        self._pre_contracts = (
+            *contracts.get(ContractType.PRE, ()),
+            *contracts.get(ContractType.R_PRE, ()),
+        )
+        self._call_contracts = (
+            *contracts.get(ContractType.CALL, ()),
+            *contracts.get(ContractType.R_CALL, ()),
+        )
+        # Post contracts run in reverse order
+        self._post_contracts = (
+            *contracts.get(ContractType.POST, ()),
+            *contracts.get(ContractType.R_POST, ()),
+        )[::-1]
+        self._uncontracted = not (
+            self._pre_contracts or self._call_contracts or self._post_contracts
+        )
+
     def __gen_ctx__(self, *args, **kwargs):
         """
         Create and prepare the function context, executing pre-call contracts.
         """
-        hub = self._
-        ctx = Context(hub, self.func, self, *args, **kwargs)
+        hub = self._root
+        if LEAN_CALL:
+            ctx = LeanContext(hub, self.func, self, *args, **kwargs)
+        else:
+            ctx = Context(hub, self.func, self, *args, **kwargs)
 
         # Pre contracts are used to validate/modify args and kwargs in the ctx
         self.__call_pre__(ctx)
@@ -152,35 +438,29 @@ class Contracted(pns.data.Namespace):
         """
         Execute all pre-call contracts.
         """
-        pre_contracts = (
-            self.contracts[ContractType.PRE] + self.contracts[ContractType.R_PRE]
-        )
-        for pre_contract in pre_contracts:
+        for pre_contract in self._pre_contracts:
             pre_contract(ctx)
 
     def __call_post__(self, ctx):
         """
         Execute all post-call contracts in reverse order.
         """
-        post_contracts = (
-            self.contracts[ContractType.POST] + self.contracts[ContractType.R_POST]
-        )
-        for post_contract in reversed(post_contracts):
+        for post_contract in self._post_contracts:
             ctx.return_value = post_contract(ctx)
 
     def __call__(self, *args, **kwargs):
         """
         Handle the execution of the wrapped function.
         """
+        if self._uncontracted:
+            with CALL_STACK(self, args=args, kwargs=kwargs):
+                return self.func(self._root, *args, **kwargs)
+
         ctx = self.__gen_ctx__(*args, **kwargs)
-        with CallStack(self, ctx):
-            call_contracts = (
-                self.contracts[ContractType.CALL] + self.contracts[ContractType.R_CALL]
-            )
-            for call_contract in call_contracts:
-                ctx.return_value = call_contract(ctx)
+        with CALL_STACK(self, ctx):
+            if self._call_contracts:
                 # Only call the first call contract
-                break
+                ctx.return_value = self._call_contracts[0](ctx)
             else:
                 # If there was no call contract, then call the function directly
                 ctx.return_value = ctx.func(*ctx.args, **ctx.kwargs)
@@ -196,7 +476,10 @@ class AsyncContracted(Contracted):
         Create and prepare the function context, executing pre-call contracts.
         """
         hub = self._root
-        ctx = Context(hub, self.func, self, *args, **kwargs)
+        if LEAN_CALL:
+            ctx = LeanContext(hub, self.func, self, *args, **kwargs)
+        else:
+            ctx = Context(hub, self.func, self, *args, **kwargs)
 
         # Pre contracts are used to validate/modify args and kwargs in the ctx
         await self.__call_pre__(ctx)
@@ -206,35 +489,29 @@ class AsyncContracted(Contracted):
         """
         Execute all pre-call contracts.
         """
-        pre_contracts = (
-            self.contracts[ContractType.PRE] + self.contracts[ContractType.R_PRE]
-        )
-        for pre_contract in pre_contracts:
+        for pre_contract in self._pre_contracts:
             await pre_contract(ctx)
 
     async def __call_post__(self, ctx):
         """
         Execute all post-call contracts in reverse order.
         """
-        post_contracts = (
-            self.contracts[ContractType.POST] + self.contracts[ContractType.R_POST]
-        )
-        for post_contract in reversed(post_contracts):
+        for post_contract in self._post_contracts:
             ctx.return_value = await post_contract(ctx)
 
     async def __call__(self, *args, **kwargs):
         """
         Handle the execution of the wrapped function.
         """
+        if self._uncontracted:
+            async with CALL_STACK(self, args=args, kwargs=kwargs):
+                return await self.func(self._root, *args, **kwargs)
+
         ctx = await self.__gen_ctx__(*args, **kwargs)
-        async with CallStack(self, ctx):
-            call_contracts = (
-                self.contracts[ContractType.CALL] + self.contracts[ContractType.R_CALL]
-            )
-            for call_contract in call_contracts:
-                ctx.return_value = await call_contract(ctx)
+        async with CALL_STACK(self, ctx):
+            if self._call_contracts:
                 # Only call the first call contract
-                break
+                ctx.return_value = await self._call_contracts[0](ctx)
             else:
                 # If there was no call contract, then call the function directly
                 ctx.return_value = await ctx.func(*ctx.args, **ctx.kwargs)
@@ -253,15 +530,17 @@ class ContractedGen(Contracted):
         """
         Handle the wrapped function for async generator functions.
         """
+        if self._uncontracted:
+            with CALL_STACK(self, args=args, kwargs=kwargs):
+                gen = self.func(self._root, *args, **kwargs)
+            yield from gen
+            return
+
         ctx = self.__gen_ctx__(*args, **kwargs)
-        with CallStack(self, ctx):
-            call_contracts = (
-                self.contracts[ContractType.CALL] + self.contracts[ContractType.R_CALL]
-            )
-            for call_contract in call_contracts:
-                coro_gen = call_contract(ctx)
+        with CALL_STACK(self, ctx):
+            if self._call_contracts:
                 # Only call the first call contract
-                break
+                coro_gen = self._call_contracts[0](ctx)
             else:
                 # If there was no call contract, then call the function directly
                 coro_gen = ctx.func(*ctx.args, **ctx.kwargs)
@@ -269,7 +548,7 @@ class ContractedGen(Contracted):
         for result in coro_gen:
             ctx.return_value = result
             # Apply post contracts to every value in the reuslt
-            with CallStack(self, ctx):
+            with CALL_STACK(self, ctx):
                 self.__call_post__(ctx)
             yield ctx.return_value
 
@@ -283,15 +562,18 @@ class AsyncContractedGen(AsyncContracted):
         """
         Handle the wrapped function for async generator functions.
         """
+        if self._uncontracted:
+            async with CALL_STACK(self, args=args, kwargs=kwargs):
+                gen = self.func(self._root, *args, **kwargs)
+            async for result in gen:
+                yield result
+            return
+
         ctx = await self.__gen_ctx__(*args, **kwargs)
-        async with CallStack(self, ctx):
-            call_contracts = (
-                self.contracts[ContractType.CALL] + self.contracts[ContractType.R_CALL]
-            )
-            for call_contract in call_contracts:
-                coro_gen = call_contract(ctx)
+        async with CALL_STACK(self, ctx):
+            if self._call_contracts:
                 # Only call the first call contract
-                break
+                coro_gen = self._call_contracts[0](ctx)
             else:
                 # If there was no call contract, then call the function directly
                 coro_gen = ctx.func(*ctx.args, **ctx.kwargs)
@@ -299,7 +581,7 @@ class AsyncContractedGen(AsyncContracted):
         async for result in coro_gen:
             ctx.return_value = result
             # Apply post contracts to every value in the reuslt
-            async with CallStack(self, ctx):
+            async with CALL_STACK(self, ctx):
                 await self.__call_post__(ctx)
             yield ctx.return_value
 
@@ -319,12 +601,24 @@ class CallStack:
         hub (Namespace): The namespace object representing the current hub.
         last_ref (str): The reference to the last function called.
         last_call (any): The last executed function call context.
+        ctx (Context): The context of the call, None for functions called without contracts.
+        args (tuple): The arguments of a call made without a context.
+        kwargs (dict): The keyword arguments of a call made without a context.
     """
 
-    def __init__(self, contract: Contracted, ctx: Context):
+    def __init__(
+        self,
+        contract: Contracted,
+        ctx: Context = None,
+        *,
+        args: tuple = (),
+        kwargs: dict = None,
+    ):
         self.last_ref = None
         self.last_call = None
         self.ctx = ctx
+        self.args = args
+        self.kwargs = kwargs
         self.contract = contract
         self.hub = contract._root
 
@@ -356,8 +650,14 @@ class CallStack:
             await self.hub.log.trace(str(self), exc_info=(exc_type, exc_value, exc_tb))
 
     def __str__(self):
-        args = [str(value) for value in self.ctx.args] + [
-            f"{key}={value}" for key, value in self.ctx.kwargs.items()
+        if self.ctx is None:
+            call_args = [self.hub, *self.args]
+            call_kwargs = self.kwargs or {}
+        else:
+            call_args = self.ctx.args
+            call_kwargs = self.ctx.kwargs
+        args = [str(value) for value in call_args] + [
+            f"{key}={value}" for key, value in call_kwargs.items()
         ]
         hub = args[0]
 
@@ -377,3 +677,246 @@ class CallStack:
         while last_call:
             yield str(last_call)
             last_call = last_call.last_call
+
+
+class LeanCallStack(CallStack):
+    """
+    A CallStack that tracks the chain of calls with a single contextvar.
+
+    Entering pushes this call onto LAST_CALL and exiting resets it with the token from the push.
+    The current and previous refs are derived from the chain instead of being stored in their own contextvar.
+
+    Attributes:
+        ref (str): The reference of the function being called.
+        token (contextvars.Token): The token that restores the previous call on exit.
+    """
+
+    def __init__(
+        self,
+        contract: Contracted,
+        ctx: Context = None,
+        *,
+        args: tuple = (),
+        kwargs: dict = None,
+    ):
+        self.last_call = None
+        self.ctx = ctx
+        self.args = args
+        self.kwargs = kwargs
+        self.contract = contract
+        self.hub = contract._root
+        self.ref = None
+        self.token = None
+
+    @property
+    def last_ref(self) -> str:
+        """The reference to the function that made this call."""
+        if self.last_call is None:
+            return LAST_REF.get()
+        return self.last_call.ref
+
+    def __enter__(self):
+        """Push this call onto the call stack."""
+        self.ref = self.contract.__ref__
+        self.last_call = LAST_CALL.get()
+        self.token = LAST_CALL.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """Pop this call off of the call stack."""
+        LAST_CALL.reset(self.token)
+
+        if exc_type:
+            self.hub.log.trace(str(self), exc_info=(exc_type, exc_value, exc_tb))
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        """Pop this call off of the call stack."""
+        LAST_CALL.reset(self.token)
+
+        if exc_type:
+            await self.hub.log.trace(str(self), exc_info=(exc_type, exc_value, exc_tb))
+
+
+class CallMetrics:
+    """
+    The metrics of the calls made to a contracted function.
+
+    Attributes:
+        contract (Contracted): The contracted function.
+        calls (int): The number of calls.
+        errors (int): The number of calls that raised an exception.
+        active (int): The number of calls in progress.
+        peak (int): The highest number of calls that were in progress at once.
+        total_ns (int): The cumulative wall time of the calls in nanoseconds.
+        own_ns (int): The wall time of the calls in nanoseconds,
+            less the time spent in contracted calls they made from the same task.
+    """
+
+    __slots__ = ("contract", "calls", "errors", "active", "peak", "total_ns", "own_ns")
+
+    def __init__(self, contract: Contracted):
+        self.contract = contract
+        self.calls = 0
+        self.errors = 0
+        self.active = 0
+        self.peak = 0
+        self.total_ns = 0
+        self.own_ns = 0
+
+
+def _current_task():
+    """
+    The task running the current call, None outside of an event loop.
+    """
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+class MeteredCall:
+    """
+    Records the metrics of a call in METRICS as it enters and exits the call stack.
+
+    The time of a call is subtracted from the own time of the call that made it when both run in the same task,
+    calls made in other tasks run concurrently and don't count against the caller.
+
+    Attributes:
+        metrics (CallMetrics): The metrics of the contracted function being called.
+        task (asyncio.Task): The task running the call.
+        child_ns (int): The time spent in contracted calls made by this call from the same task.
+        start (int): When the call started, from time.perf_counter_ns.
+    """
+
+    def __enter__(self):
+        """Push this call onto the call stack and start timing it."""
+        ret = super().__enter__()
+        metrics = METRICS.get(id(self.contract))
+        if metrics is None:
+            metrics = METRICS[id(self.contract)] = CallMetrics(self.contract)
+        metrics.calls += 1
+        metrics.active += 1
+        if metrics.active > metrics.peak:
+            metrics.peak = metrics.active
+        self.metrics = metrics
+        self.task = _current_task()
+        self.child_ns = 0
+        self.start = time.perf_counter_ns()
+        return ret
+
+    def __meter__(self, exc_type):
+        """
+        Record the end of the call.
+        """
+        elapsed = time.perf_counter_ns() - self.start
+        metrics = self.metrics
+        metrics.active -= 1
+        metrics.total_ns += elapsed
+        metrics.own_ns += elapsed - self.child_ns
+        if exc_type:
+            metrics.errors += 1
+
+        caller = self.last_call
+        if isinstance(caller, MeteredCall) and caller.task is self.task:
+            caller.child_ns += elapsed
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """Record the end of the call and pop it off of the call stack."""
+        self.__meter__(exc_type)
+        return super().__exit__(exc_type, exc_value, exc_tb)
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        """Record the end of the call and pop it off of the call stack."""
+        self.__meter__(exc_type)
+        return await super().__aexit__(exc_type, exc_value, exc_tb)
+
+
+class MeteredCallStack(MeteredCall, CallStack):
+    """
+    A CallStack that records call metrics.
+    """
+
+
+class MeteredLeanCallStack(MeteredCall, LeanCallStack):
+    """
+    A LeanCallStack that records call metrics.
+    """
+
+
+class SampledCall:
+    """
+    Tracks the innermost call of each task or thread in ACTIVE as calls enter and exit the call stack.
+
+    The sampler walks from the innermost call through each last_call to find the whole stack of a task.
+
+    Attributes:
+        sample_key (object): The task running the call, or the thread outside of an event loop.
+        sample_prev (CallStack): The call this call replaced in ACTIVE.
+    """
+
+    def __enter__(self):
+        """Push this call onto the call stack and make it the innermost call of its task."""
+        ret = super().__enter__()
+        key = _current_task() or threading.get_ident()
+        self.sample_key = key
+        self.sample_prev = ACTIVE.get(key)
+        ACTIVE[key] = self
+        return ret
+
+    def __unsample__(self):
+        """
+        Restore the call this call replaced as the innermost call of its task.
+        """
+        if self.sample_prev is None:
+            ACTIVE.pop(self.sample_key, None)
+        else:
+            ACTIVE[self.sample_key] = self.sample_prev
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        """Pop this call off of the call stack."""
+        self.__unsample__()
+        return super().__exit__(exc_type, exc_value, exc_tb)
+
+    async def __aexit__(self, exc_type, exc_value, exc_tb):
+        """Pop this call off of the call stack."""
+        self.__unsample__()
+        return await super().__aexit__(exc_type, exc_value, exc_tb)
+
+
+class SampledCallStack(SampledCall, CallStack):
+    """
+    A CallStack that is tracked for the sampler.
+    """
+
+
+class SampledLeanCallStack(SampledCall, LeanCallStack):
+    """
+    A LeanCallStack that is tracked for the sampler.
+    """
+
+
+class SampledMeteredCallStack(SampledCall, MeteredCall, CallStack):
+    """
+    A CallStack that records call metrics and is tracked for the sampler.
+    """
+
+
+class SampledMeteredLeanCallStack(SampledCall, MeteredCall, LeanCallStack):
+    """
+    A LeanCallStack that records call metrics and is tracked for the sampler.
+    """
+
+
+# The CallStack to use for each combination of (LEAN_CALL, CALL_METRICS, SAMPLING)
+CALL_STACKS = {
+    (False, False, False): CallStack,
+    (True, False, False): LeanCallStack,
+    (False, True, False): MeteredCallStack,
+    (True, True, False): MeteredLeanCallStack,
+    (False, False, True): SampledCallStack,
+    (True, False, True): SampledLeanCallStack,
+    (False, True, True): SampledMeteredCallStack,
+    (True, True, True): SampledMeteredLeanCallStack,
+}
+# The CallStack used by contracted calls, see `_select_call_stack`
+CALL_STACK = CALL_STACKS[LEAN_CALL, CALL_METRICS, SAMPLING]
@@ -13,6 +13,8 @@ Classes:
 
 Functions:
     - get_alias: Retrieves a Namespace instance from a collection based on a given name or alias.
+    - invalidate_refs: Invalidates every cached reference after the structure of a namespace changes.
+    - invalidate_ref_names: Invalidates every cached __ref__ after a namespace is renamed or re-parented.
     - update: Provides a recursive or non-recursive dictionary update functionality with support for merging lists.
 
 These classes and functions are foundational for creating a structured and dynamic namespace system, enabling
@@ -26,6 +28,18 @@ from collections.abc import Mapping
 from types import SimpleNamespace
 from collections.abc import Iterable
 
+# Bumped whenever the structure of any namespace changes, invalidating all cached references
+GENERATION = 0
+
+# Bumped whenever a namespace is renamed or re-parented, invalidating all cached __ref__ strings
+NAME_GENERATION = 0
+
+# Private attributes that still change how references resolve
+STRUCTURAL_ATTRS = frozenset(("_active", "_nest", "_mod", "__", "__name__"))
+
+# Attributes that change the __ref__ of a namespace and all of its children
+NAMING_ATTRS = frozenset(("__", "__name__"))
+
 
 class NamespaceDict(dict[str, object]):
     """
@@ -71,14 +85,23 @@ class Namespace(SimpleNamespace):
         __ (Namespace): Reference to the parent namespace.
         _root (Namespace): Reference to the root namespace.
         _alias (set): A set of aliases associated with this namespace.
+        _alias_index (dict): Maps the aliases of nested namespaces to the key they are stored under in `_nest`.
+        _mod_alias_index (dict): Maps the aliases of modules to the key they are stored under in `_mod`.
         _nest (dict): A dictionary containing nested namespaces.
+            Add and remove them with `_set_nest` and `_pop_nest`, writing to `_nest` directly
+            skips the alias index and leaves cached references stale.
+        _ref_cache (dict): Resolved dotted references, valid for the generation in `_ref_gen`.
 
     Methods:
         _add_child: Adds a new child namespace.
+        _set_nest: Stores a nested namespace, indexing its aliases and invalidating cached references.
+        _pop_nest: Removes a nested namespace, invalidating cached references.
+        _index_alias: Registers the aliases of a child so they can be found in a single lookup.
         __getitem__: Retrieves a namespace by traversing through nested namespaces based on dot notation.
         __iadd__: Adds a child namespace or a tuple describing the namespace and its paths.
         __div__, __gt__, __floordiv__, __lt__: Operators to traverse through namespaces.
         __iter__: Iterates over the nested namespaces.
+        __contains__: Checks for a nested namespace by its name or alias.
         __len__: Returns the count of nested namespaces.
         __bool__: Returns True if the namespace is active, otherwise False.
 
@@ -87,6 +110,8 @@ class Namespace(SimpleNamespace):
     """
 
     _active = True
+    # The cached __ref__ of this namespace and the NAME_GENERATION it was built for
+    _ref_name = None
 
     def __init__(
         self,
@@ -105,14 +130,56 @@ class Namespace(SimpleNamespace):
             root (Namespace, optional): The root namespace. Defaults to None.
         """
         super().__init__(*args, **kwargs)
-        self.__name__ = name
-        self.__ = parent
+        # A new namespace isn't reachable by any cached reference yet, set up its structure without invalidating them
+        object.__setattr__(self, "__name__", name)
+        object.__setattr__(self, "__", parent)
         self._root = root
         # Aliases for this namespace
         self._alias = set()
+        # Aliases of the children of this namespace mapped to the key they are stored under,
+        # nested namespaces and modules are indexed separately since they can share an alias
+        self._alias_index = {}
+        self._mod_alias_index = {}
         # Namespaces underneath this namespace
-        self._nest = {}
-        self._mod = {}
+        object.__setattr__(self, "_nest", {})
+        object.__setattr__(self, "_mod", {})
+        # Dotted references that have already been resolved from this namespace
+        self._ref_cache = {}
+        self._ref_gen = GENERATION
+
+    def __setattr__(self, name: str, value):
+        """
+        Sets an attribute, invalidating cached references if the attribute can change how they resolve.
+
+        Cached references are made up entirely of namespaces, so only assignments that add or replace a namespace,
+        shadow a child, or change the structure of this namespace can make them stale.
+        Plain state stored on a namespace, i.e. `hub.OPT` or `hub.log.LOGGER`, and private attributes leave the caches intact.
+        """
+        if name[0] == "_" and name not in STRUCTURAL_ATTRS:
+            # Private state, children are never private
+            object.__setattr__(self, name, value)
+            return
+
+        attrs = self.__dict__
+        if name in NAMING_ATTRS:
+            if name in attrs:
+                # Renaming or re-parenting changes the ref of every namespace underneath this one
+                invalidate_ref_names()
+                invalidate_refs()
+            object.__setattr__(self, name, value)
+            return
+
+        if (
+            name in STRUCTURAL_ATTRS
+            or isinstance(value, Namespace)
+            or isinstance(attrs.get(name), Namespace)
+            or name in attrs.get("_nest", ())
+            or name in attrs.get("_mod", ())
+            or name in attrs.get("_alias_index", ())
+            or name in attrs.get("_mod_alias_index", ())
+        ):
+            invalidate_refs()
+        object.__setattr__(self, name, value)
 
     @property
     def _(self):
@@ -137,7 +204,7 @@ class Namespace(SimpleNamespace):
         Raises:
             AttributeError: If the attribute or namespace is not found.
         """
-        item = get_alias(name, self._nest)
+        item = get_alias(name, self._nest, self._alias_index)
         if item:
             return item
 
@@ -154,11 +221,56 @@ class Namespace(SimpleNamespace):
         Returns:
             Namespace: The retrieved namespace.
         """
+        path = self._cached_ref(name)
+        if path is not None:
+            return path[-1]
+
+        path = []
         finder = self
         for part in name.split("."):
             finder = getattr(finder, part)
+            path.append(finder)
+        self._cache_ref(name, path)
         return finder
 
+    def _cached_ref(self, ref: str) -> tuple | None:
+        """
+        Retrieves the objects along a previously resolved dotted reference.
+
+        Args:
+            ref (str): The reference relative to this namespace.
+
+        Returns:
+            tuple: The objects along the reference, or None if it isn't cached for the current generation.
+        """
+        if self._ref_gen != GENERATION:
+            self._ref_cache.clear()
+            self._ref_gen = GENERATION
+            return None
+        return self._ref_cache.get(ref)
+
+    def _cache_ref(self, ref: str, path: list):
+        """
+        Caches the objects along a resolved dotted reference.
+
+        Only references made up entirely of namespaces are cached;
+        any other object along the way could change without the generation changing.
+        References that go through "_" aren't cached, on the hub it resolves relative to the calling module.
+
+        Args:
+            ref (str): The reference relative to this namespace.
+            path (list): The objects resolved for each part of the reference.
+        """
+        for item in path:
+            if not isinstance(item, Namespace):
+                return
+        if "_" in ref.split("."):
+            return
+        if self._ref_gen != GENERATION:
+            self._ref_cache.clear()
+            self._ref_gen = GENERATION
+        self._ref_cache[ref] = tuple(path)
+
     def __iadd__(self, other: str | tuple):
         """
         Adds a child namespace using the += operator.
@@ -234,6 +346,20 @@ class Namespace(SimpleNamespace):
             if getattr(item, "_active", True):
                 yield name
 
+    def __contains__(self, name: str) -> bool:
+        """
+        Check whether a nested namespace can be found by its name or alias.
+
+        The lookup goes through the nested collection itself, so on hub.lib a registered import is performed.
+
+        Args:
+            name (str): The name or alias to look for.
+
+        Returns:
+            bool: True if an active nested namespace is found.
+        """
+        return get_alias(name, self._nest, self._alias_index) is not None
+
     def __len__(self):
         """
         Returns the number of nested namespaces.
@@ -269,20 +395,68 @@ class Namespace(SimpleNamespace):
         parts = name.split(".")
         for part in parts:
             if part not in current._nest:
-                current._nest[part] = cls(part, root=self._root or self, parent=self)
+                current._set_nest(
+                    part, cls(part, root=self._root or self, parent=current)
+                )
 
             current = current._nest[part]
 
         return current
 
+    def _set_nest(self, name: str, child: "Namespace"):
+        """
+        Stores a nested namespace, indexing its aliases and invalidating cached references.
+
+        Args:
+            name (str): The key to store the namespace under.
+            child (Namespace): The nested namespace.
+        """
+        self._nest[name] = child
+        self._index_alias(name, *child._alias)
+        invalidate_refs()
+
+    def _pop_nest(self, name: str, *default):
+        """
+        Removes a nested namespace, invalidating cached references.
+
+        Args:
+            name (str): The key the namespace is stored under.
+            default: Returned if there is no such namespace, otherwise a KeyError is raised.
+
+        Returns:
+            Namespace: The removed namespace.
+        """
+        child = self._nest.pop(name, *default)
+        invalidate_refs()
+        return child
+
+    def _index_alias(self, key: str, *aliases: str, mod: bool = False):
+        """
+        Registers the aliases of a child so that get_alias can find it with a single lookup.
+
+        Args:
+            key (str): The key the child is stored under in this namespace.
+            *aliases (str): The aliases that should resolve to the child.
+            mod (bool): Whether the child is a module in `_mod` rather than a namespace in `_nest`.
+        """
+        index = self._mod_alias_index if mod else self._alias_index
+        for alias in aliases:
+            index[alias] = key
+
     @property
     def __ref__(self) -> str:
         """
         Constructs a reference string that traverses from the root to the current node.
 
+        The reference is built once and cached until any namespace is renamed or re-parented.
+
         Returns:
             str: The reference string representing the path from the root to this node.
         """
+        cached = self._ref_name
+        if cached is not None and cached[0] == NAME_GENERATION:
+            return cached[1]
+
         parts = []
         finder = self
         # Traverse up until we reach the root
@@ -292,7 +466,9 @@ class Namespace(SimpleNamespace):
             finder = finder.__
 
         # Reverse parts to start from the root
-        return ".".join(reversed(parts))
+        ref = ".".join(reversed(parts))
+        self._ref_name = (NAME_GENERATION, ref)
+        return ref
 
     def __repr__(self):
         """
@@ -304,32 +480,66 @@ class Namespace(SimpleNamespace):
         return f"{self.__class__.__name__.split('.')[-1]}({self.__ref__})"
 
 
-def get_alias(name: str, collection: dict[str, object]) -> Namespace:
+def invalidate_refs():
+    """
+    Invalidate every cached reference on every namespace.
+
+    This should be called whenever a namespace is added, removed, reloaded, or merged.
+    Caches compare their generation lazily, so invalidation is a single increment.
+    """
+    global GENERATION
+    GENERATION += 1
+
+
+def invalidate_ref_names():
+    """
+    Invalidate the cached __ref__ of every namespace.
+
+    This is called automatically when a namespace is renamed or re-parented.
+    """
+    global NAME_GENERATION
+    NAME_GENERATION += 1
+
+
+def get_alias(
+    name: str, collection: dict[str, object], index: dict[str, str] = None
+) -> Namespace:
     """
     Search for a Namespace object in a collection that matches a given name or its alias.
 
-    The function iterates over a dictionary of objects, returning the Namespace instance
-    corresponding to the given name if it matches directly, or any alias associated with
-    the Namespace if it's active. If a matching, active Namespace is not found, returns None.
+    A direct key match in the collection is returned first, as long as it is active.
+    Otherwise the alias index, which maps aliases to the key their namespace is stored under, is consulted.
+    The candidate found through the index is only returned if it is still stored under that key,
+    still claims the alias, and is active; this keeps stale index entries from leaking removed namespaces.
+    If no index is given, the collection is scanned for a Namespace that claims the alias.
 
     Args:
         name (str): The name or alias to search for within the collection.
         collection (dict[str, object]): A dictionary containing string keys and Namespace objects.
+        index (dict[str, str], optional): A mapping of aliases to keys in the collection.
 
     Returns:
         Namespace: The Namespace object if found, otherwise None.
     """
-    for check, ns in collection.items():
-        if name == check:
-            if isinstance(ns, Namespace):
-                if not ns._active:
-                    continue
-            return ns
-        elif not isinstance(ns, Namespace):
-            continue
-        if name in ns._alias and ns._active:
+    ns = collection.get(name)
+    if ns is not None:
+        if not isinstance(ns, Namespace) or ns._active:
             return ns
 
+    if index is None:
+        for ns in collection.values():
+            if isinstance(ns, Namespace) and ns._active and name in ns._alias:
+                return ns
+        return None
+
+    key = index.get(name)
+    if key is None:
+        return None
+
+    ns = collection.get(key)
+    if isinstance(ns, Namespace) and ns._active and name in ns._alias:
+        return ns
+
 
 def update(dest: dict, upd: dict, *, recursive: bool = True, merge_lists: bool = False):
     """
@@ -7,6 +7,26 @@ into low-level getattr calls and other namespace internals, facilitating a clean
 experience.
 
 Attributes:
+    - LEAN_CALL: A boolean flag controlled by the 'PNS_LEAN_CALL' environment variable. When set, contracted calls
+        allocate slotted contexts and track the call stack with a single contextvar, see `pns.contract.lean_call`.
+    - CALL_METRICS: A boolean flag controlled by the 'PNS_CALL_METRICS' environment variable. When set, contracted
+        calls record their count, timings, errors, and concurrency, see `pns.contract.call_metrics`.
+    - VERIFY_SIG: When function signatures are verified against their contracts, from the 'PNS_VERIFY_SIG'
+        environment variable; one of "eager" (the default), "deferred", "call", or "off",
+        see `pns.contract.verify_sig_mode`.
+    - LOAD_CONCURRENCY: The number of modules `_load_all` prepares at once, from the 'PNS_LOAD_CONCURRENCY'
+        environment variable. The default of 1 loads modules one at a time.
+    - LOAD_THREADS: A boolean flag controlled by the 'PNS_LOAD_THREADS' environment variable. When set, concurrent
+        loads execute module source in worker threads.
+    - LAZY_LOAD: A boolean flag controlled by the 'PNS_LAZY_LOAD' environment variable. When set, `pns.shim.loaded_hub`
+        registers the modules of every dyne at startup and loads each module when it is first accessed.
+    - SNAPSHOT: A boolean flag controlled by the 'PNS_SNAPSHOT' environment variable. When set, `pns.shim.loaded_hub`
+        restores the dynes from a snapshot of the last start, see `pns.snapshot`.
+    - PROFILE_STARTUP: From the 'PNS_PROFILE_STARTUP' environment variable. When set, the steps of hub startup are
+        timed and reported once the hub is loaded; a path ending in ".json" writes a Chrome trace to it instead,
+        see `pns.profile`.
+    - SAMPLE: From the 'PNS_SAMPLE' environment variable. When set, the stacks of the calls made through the hub
+        are sampled and written to the file it names in the folded stack format at exit, see `pns.sampler`.
     - DEBUG_PNS_GETATTR: A boolean flag that is controlled by the 'PNS_DEBUG' environment variable or the Python's
         built-in __debug__ condition. When set to True, this flag prompts the application to use Cython-optimized
         versions of certain classes, which streamline debugging by bypassing internal namespace operations. This
@@ -22,3 +42,30 @@ import os
 
 # Whether to skip all the internal getattrs in the debugger
 DEBUG_PNS_GETATTR = os.environ.get("PNS_DEBUG", __debug__)
+
+# Whether contracted calls should start out in lean mode
+LEAN_CALL = os.environ.get("PNS_LEAN_CALL", "").lower() in ("1", "true", "yes")
+
+# Whether contracted calls start out recording call metrics
+CALL_METRICS = os.environ.get("PNS_CALL_METRICS", "").lower() in ("1", "true", "yes")
+
+# When to verify function signatures against their contracts
+VERIFY_SIG = os.environ.get("PNS_VERIFY_SIG", "eager").lower()
+
+# How many modules to prepare at once when loading all the modules of a sub
+LOAD_CONCURRENCY = int(os.environ.get("PNS_LOAD_CONCURRENCY") or 1)
+
+# Whether concurrent loads execute module source in worker threads
+LOAD_THREADS = os.environ.get("PNS_LOAD_THREADS", "").lower() in ("1", "true", "yes")
+
+# Whether the modules of the dynes are loaded when they are first accessed instead of at startup
+LAZY_LOAD = os.environ.get("PNS_LAZY_LOAD", "").lower() in ("1", "true", "yes")
+
+# Whether the dynes are restored from a snapshot of the last start
+SNAPSHOT = os.environ.get("PNS_SNAPSHOT", "").lower() in ("1", "true", "yes")
+
+# Where to report the profile of hub startup, an empty string doesn't profile
+PROFILE_STARTUP = os.environ.get("PNS_PROFILE_STARTUP", "")
+
+# Where to write samples of the hub call stacks at exit, an empty string doesn't sample
+SAMPLE = os.environ.get("PNS_SAMPLE", "")
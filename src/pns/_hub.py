@@ -28,8 +28,11 @@ and maintainability are paramount.
 """
 
 import asyncio
+import pathlib
+import pns._debug
 import pns.data
 import pns.loop
+import pns.profile
 import pkgutil
 
 # Constants for special attributes
@@ -48,15 +51,39 @@ class DynamicNamespace(pns.data.Namespace):
     Attributes:
         _dir (iterator): An iterator over directories to search for modules.
         _mod (dict): A dictionary to store loaded modules.
+        _contract_index (tuple): When this namespace holds contracts, the classified contracts of its modules.
+            It is built on first use by `pns.contract.index` and discarded whenever a module is added.
+        _lazy_mods (dict): Modules known to exist but not loaded yet, see `pns.snapshot` and `_scan_lazy`.
+            Maps the name a module is registered under to the (name, directory, extension) of its source files.
+        _lazy_alias (dict): Maps every name and alias of a lazy module to the name it is registered under.
+        _lazy_files (set): The (name, directory) of the source files of lazy modules that haven't been loaded yet.
+        _lazy_declared (dict): Maps the __virtualname__ and __sub_alias__ names that lazy modules declare in their source
+            to the names the modules are registered under. It is read on the first lookup that misses.
+        _lazy_nest (set): The names of the nested namespaces that have lazy modules that haven't been loaded yet.
 
     Methods:
         __init__: Initializes a new DynamicNamespace instance.
         __getattr__: Provides attribute access, loading modules dynamically if necessary.
-        _load_all: Asynchronously loads all modules from the directories.
+        _load_all: Asynchronously loads all modules from the directories, optionally preparing them concurrently.
         _load_mod: Asynchronously loads a specific module from the directories.
+        _load_pending_contracts: Loads contracts that were registered lazily, before modules are prepared.
+        _add_mod: Registers a prepared module, returning its __init__ function.
+        _scan_lazy: Registers the modules in the directories without loading them.
+        _load_lazy: Asynchronously loads modules that are known to exist but haven't been loaded yet.
+        _lazy_declared_keys: Finds the lazy modules that declare a name in their source.
+        _lazy_pending: Tells the parent namespace whether this namespace has lazy modules left to load.
+        _load_declared: Loads the lazy modules that could provide a missing attribute.
+        __contains__: Checks for a nested namespace or module by its name or alias.
         __iter__: Allows iteration over all nested namespaces and modules.
     """
 
+    _contract_index = None
+    _lazy_mods = None
+    _lazy_alias = None
+    _lazy_files = None
+    _lazy_declared = None
+    _lazy_nest = None
+
     def __init__(self, locations: list[str] = (), *args, **kwargs):
         """
         Initializes the DynamicNamespace with specified locations.
@@ -66,7 +93,6 @@ class DynamicNamespace(pns.data.Namespace):
         """
         super().__init__(*args, **kwargs)
         self._dir = pns.dir.walk(locations)
-        self._mod = {}
 
     def __getattr__(self, name: str):
         """
@@ -84,33 +110,158 @@ class DynamicNamespace(pns.data.Namespace):
         try:
             return super().__getattr__(name)
         except AttributeError:
-            item = pns.data.get_alias(name, self._mod)
+            item = pns.data.get_alias(name, self._mod, self._mod_alias_index)
+
+            # Load a module that is known to exist by any of its names
+            if not item and self._lazy_mods:
+                key = self._lazy_alias.get(name)
+                if key in self._lazy_mods:
+                    pns.loop.run(self._load_lazy(key))
+                    item = pns.data.get_alias(name, self._mod, self._mod_alias_index)
 
             # If attribute not found, attempt to load the module dynamically
             if not item:
-                pns.loop.run(self._load_mod(name))
-                item = pns.data.get_alias(name, self._mod)
+                try:
+                    pns.loop.run(self._load_mod(name))
+                except AttributeError:
+                    if not self._lazy_mods:
+                        raise
+                item = pns.data.get_alias(name, self._mod, self._mod_alias_index)
 
             if item:
                 return item
 
+            # The attribute may be declared or set by a module that isn't loaded yet
+            if self._load_declared(name):
+                return self.__getattr__(name)
+
             raise
 
-    async def _load_all(self, *, merge: bool = True, hard_fail: bool = False):
+    async def _load_all(
+        self,
+        *,
+        merge: bool = True,
+        hard_fail: bool = False,
+        concurrency: int = None,
+        threads: bool = None,
+    ):
         """
         Asynchronously loads all modules from the specified directories.
 
+        With a concurrency greater than one, modules are executed and their __virtual__ functions awaited
+        concurrently, then they are registered in directory order so that aliases and merges resolve
+        exactly as they do when loading serially. Finally their __init__ functions are awaited concurrently.
+
         Args:
             merge (bool): If True, merge duplicate modules, otherwise keep them separate.
+            hard_fail (bool): If True, raise the first error instead of skipping the module.
+            concurrency (int): The number of modules to prepare at once, defaults to `pns._debug.LOAD_CONCURRENCY`.
+            threads (bool): Execute module source in worker threads, defaults to `pns._debug.LOAD_THREADS`.
         """
-        for d in self._dir:
-            for _, name, _ in pkgutil.iter_modules([d]):
+        with pns.profile.span("load_all", self):
+            await self._load_all_mods(merge, hard_fail, concurrency, threads)
+
+    async def _load_all_mods(
+        self, merge: bool, hard_fail: bool, concurrency: int, threads: bool
+    ):
+        """
+        Load all the modules from the directories, see `_load_all`.
+        """
+        if self._lazy_mods is not None:
+            # Every module is already known, only load the ones that haven't been
+            await self._load_lazy(hard_fail=hard_fail)
+            return
+
+        if concurrency is None:
+            concurrency = pns._debug.LOAD_CONCURRENCY
+        if concurrency <= 1:
+            for d in self._dir:
+                for _, name, _ in pkgutil.iter_modules([d]):
+                    # When loading ALL modules, be forgiving
+                    try:
+                        await self._load_mod(name, [d], merge=merge)
+                    except Exception as e:
+                        if hard_fail:
+                            raise e
+            return
+
+        if threads is None:
+            threads = pns._debug.LOAD_THREADS
+
+        await self._load_pending_contracts()
+        semaphore = asyncio.Semaphore(concurrency)
+        found = [
+            (name, d) for d in self._dir for _, name, _ in pkgutil.iter_modules([d])
+        ]
+        prepared = await asyncio.gather(
+            *(self._prep_mod(semaphore, name, d, threads) for name, d in found),
+            return_exceptions=True,
+        )
+
+        inits = []
+        for (name, d), result in zip(found, prepared):
+            if isinstance(result, NotImplementedError):
+                continue
+            if isinstance(result, Exception):
                 # When loading ALL modules, be forgiving
-                try:
-                    await self._load_mod(name, [d], merge=merge)
-                except Exception as e:
-                    if hard_fail:
-                        raise e
+                if hard_fail:
+                    raise result
+                continue
+            mod, loaded_mod = result
+            init = self._add_mod(d, mod, loaded_mod, merge=merge)
+            if init is not None:
+                inits.append(init)
+
+        results = await asyncio.gather(
+            *(self._bounded(semaphore, self._init(init)) for init in inits),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception) and hard_fail:
+                raise result
+
+    async def _prep_mod(
+        self, semaphore: asyncio.Semaphore, name: str, path: str, threads: bool
+    ):
+        """
+        Load and prepare a single module without registering it.
+
+        Args:
+            semaphore (asyncio.Semaphore): Bounds the number of modules being prepared at once.
+            name (str): The name of the module to load.
+            path (str): The directory containing the module.
+            threads (bool): Execute the module source in a worker thread.
+
+        Returns:
+            tuple: The python module and its prepared LoadedMod.
+        """
+        async with semaphore:
+            if threads:
+                mod = await asyncio.to_thread(
+                    pns.mod.load_from_path, name, path, ext=".py"
+                )
+            else:
+                mod = pns.mod.load_from_path(name, path, ext=".py")
+            if not mod:
+                raise AttributeError(f"Module '{name}' not found in {path}")
+            loaded_mod = await pns.mod.prep(self._root or self, self, name, mod)
+        return mod, loaded_mod
+
+    @staticmethod
+    async def _init(init):
+        """
+        Await the __init__ function of a module.
+        """
+        with pns.profile.span("__init__", init):
+            await init()
+
+    @staticmethod
+    async def _bounded(semaphore: asyncio.Semaphore, coro):
+        """
+        Await a coroutine while holding the semaphore.
+        """
+        async with semaphore:
+            return await coro
 
     async def _load_mod(
         self,
@@ -134,7 +285,11 @@ class DynamicNamespace(pns.data.Namespace):
         if not dirs:
             dirs = self._dir
 
+        await self._load_pending_contracts()
+        stem = name
         for path in dirs:
+            if self._lazy_files:
+                self._lazy_files.discard((stem, str(path)))
             mod = pns.mod.load_from_path(name, path, ext=ext)
             if not mod:
                 raise AttributeError(f"Module '{name}' not found in {path}")
@@ -146,31 +301,206 @@ class DynamicNamespace(pns.data.Namespace):
 
             # Account for a name change with a virtualname
             name = loaded_mod.__name__
-            if name not in self._mod:
-                self._mod[name] = loaded_mod
-            elif merge:
-                # Merge the two modules
-                old_mod = self._mod.pop(name)
-                loaded_mod._var.update(old_mod._var)
-                loaded_mod._func.update(old_mod._func)
-                loaded_mod._class.update(old_mod._class)
-                self._mod[name] = loaded_mod
-            else:
-                # Add the second module
-                loaded_mod._alias.add(name)
-                self._mod[str(path)] = loaded_mod
-
-            if hasattr(mod, SUB_ALIAS):
-                self._alias.update(getattr(mod, SUB_ALIAS))
-
-            # Execute the __init__ function if present
-            if hasattr(mod, INIT):
-                func = getattr(mod, INIT)
-                if asyncio.iscoroutinefunction(func):
-                    init = pns.contract.Contracted(
-                        name=INIT, func=func, parent=loaded_mod, root=self._
+            init = self._add_mod(path, mod, loaded_mod, merge=merge)
+            if init is not None:
+                await self._init(init)
+
+    async def _load_pending_contracts(self):
+        """
+        Load contracts that could apply to the modules of this namespace but haven't been loaded yet.
+        A plain DynamicNamespace has no contracts, see `pns.hub.Sub`.
+        """
+
+    def _scan_lazy(self):
+        """
+        Register the modules in the directories of this namespace without loading them,
+        each module is loaded the first time it is accessed.
+        """
+        self._lazy_mods = {}
+        self._lazy_alias = {}
+        self._lazy_files = set()
+        self._lazy_declared = None
+        for d in self._dir:
+            for _, name, _ in pkgutil.iter_modules([d]):
+                self._lazy_mods.setdefault(name, []).append((name, str(d), ".py"))
+                self._lazy_alias[name] = name
+                self._lazy_files.add((name, str(d)))
+        self._lazy_pending()
+
+    async def _load_lazy(self, *keys: str, hard_fail: bool = False):
+        """
+        Asynchronously loads modules that are known to exist but haven't been loaded yet.
+
+        Args:
+            keys (str): The names the modules are registered under, defaults to all of the lazy modules.
+            hard_fail (bool): If True, raise the first error instead of skipping the module.
+        """
+        lazy = self._lazy_mods
+        if not lazy:
+            return
+        for key in keys or list(lazy):
+            for stem, path, ext in lazy.pop(key, ()):
+                if (stem, path) not in self._lazy_files:
+                    continue
+                try:
+                    await self._load_mod(
+                        stem, [pathlib.Path(path)], merge=True, ext=ext
                     )
-                    await init()
+                except Exception as e:
+                    if hard_fail:
+                        raise e
+        if not lazy:
+            self._lazy_pending()
+
+    def _lazy_pending(self):
+        """
+        Tell the parent namespace whether this namespace has lazy modules left to load,
+        so that a lookup that misses the parent only checks the nested namespaces that do.
+        """
+        parent = self.__
+        if not isinstance(parent, DynamicNamespace):
+            return
+        if self._lazy_mods:
+            if parent._lazy_nest is None:
+                parent._lazy_nest = set()
+            parent._lazy_nest.add(self.__name__)
+        elif parent._lazy_nest:
+            parent._lazy_nest.discard(self.__name__)
+
+    def _lazy_declared_keys(self, attr: str, name: str) -> list[str]:
+        """
+        Find the lazy modules that declare a name in their source, see `pns.mod.declared_names`.
+        The sources of the lazy modules are read the first time this is called.
+
+        Args:
+            attr (str): The declaration, "__virtualname__" or "__sub_alias__".
+            name (str): The declared name to look for.
+
+        Returns:
+            list[str]: The names the modules that haven't been loaded yet are registered under.
+        """
+        if self._lazy_declared is None:
+            self._lazy_declared = {}
+            for key, files in self._lazy_mods.items():
+                for stem, path, ext in files:
+                    for decl, value in pns.mod.declared_names(stem, path, ext).items():
+                        names = [value] if isinstance(value, str) else value
+                        if not isinstance(names, (list, tuple, set)):
+                            continue
+                        for declared in names:
+                            self._lazy_declared.setdefault((decl, declared), []).append(
+                                key
+                            )
+        return [
+            key
+            for key in self._lazy_declared.get((attr, name), ())
+            if key in self._lazy_mods
+        ]
+
+    def _load_declared(self, name: str) -> bool:
+        """
+        Load the lazy modules that could provide an attribute that wasn't found.
+        These are the modules of this namespace that declare it as their __virtualname__,
+        the init module of this namespace, whose __init__ sets attributes on the namespace,
+        and the modules of nested namespaces that declare it as a __sub_alias__.
+        Any other name isn't loaded for, so looking up a missing attribute stays cheap.
+
+        Args:
+            name (str): The attribute that wasn't found.
+
+        Returns:
+            bool: True if any module was loaded, so the lookup can be retried.
+        """
+        pending = []
+        if self._lazy_mods:
+            keys = self._lazy_declared_keys(pns.mod.VIRTUAL_NAME, name)
+            if "init" in self._lazy_mods and "init" not in keys:
+                keys.append("init")
+            if keys:
+                pending.append((self, keys))
+        for child in tuple(self._lazy_nest or ()):
+            ns = self._nest.get(child)
+            if not isinstance(ns, DynamicNamespace) or not ns._lazy_mods:
+                self._lazy_nest.discard(child)
+                continue
+            keys = ns._lazy_declared_keys(SUB_ALIAS, name)
+            if keys:
+                pending.append((ns, keys))
+        for ns, keys in pending:
+            pns.loop.run(ns._load_lazy(*keys))
+        return bool(pending)
+
+    def _add_mod(self, path: str, mod, loaded_mod, *, merge: bool = False):
+        """
+        Register a prepared module on this namespace.
+
+        Args:
+            path (str): The directory the module was loaded from.
+            mod (ModuleType): The python module.
+            loaded_mod (LoadedMod): The prepared module.
+            merge (bool): Determines if modules with the same name should be merged.
+
+        Returns:
+            Contracted: The module's async __init__ function, if it has one.
+        """
+        name = loaded_mod.__name__
+        self._contract_index = None
+        # Remember where the module came from so the namespace can be restored, see `pns.snapshot`
+        loaded_mod._files = (
+            (mod.__name__, str(path), pathlib.Path(mod.__file__).suffix),
+        )
+        if name not in self._mod:
+            self._mod[name] = loaded_mod
+            self._index_alias(name, *loaded_mod._alias, mod=True)
+        elif merge:
+            # Merge the two modules
+            old_mod = self._mod.pop(name)
+            loaded_mod._var.update(old_mod._var)
+            loaded_mod._func.update(old_mod._func)
+            loaded_mod._class.update(old_mod._class)
+            loaded_mod._files = (*old_mod._files, *loaded_mod._files)
+            self._mod[name] = loaded_mod
+            self._index_alias(name, *loaded_mod._alias, mod=True)
+        else:
+            # Add the second module
+            loaded_mod._alias.add(name)
+            self._mod[str(path)] = loaded_mod
+            self._index_alias(str(path), *loaded_mod._alias, mod=True)
+
+        if hasattr(mod, SUB_ALIAS):
+            self._alias.update(getattr(mod, SUB_ALIAS))
+            # Let the parent resolve this sub by its new aliases
+            if self.__ is not None:
+                self.__._index_alias(self.__name__, *self._alias)
+
+        pns.data.invalidate_refs()
+
+        # Find the __init__ function if present
+        if hasattr(mod, INIT):
+            func = getattr(mod, INIT)
+            if asyncio.iscoroutinefunction(func):
+                return pns.contract.Contracted(
+                    name=INIT, func=func, parent=loaded_mod, root=self._
+                )
+
+    def __contains__(self, name: str) -> bool:
+        """
+        Check whether a nested namespace or module can be found by its name or alias.
+        A module that is known to exist but isn't loaded yet is loaded, so that its __virtual__ decides.
+
+        Args:
+            name (str): The name or alias to look for.
+
+        Returns:
+            bool: True if an active nested namespace or module is found.
+        """
+        if super().__contains__(name):
+            return True
+        if self._lazy_mods:
+            key = self._lazy_alias.get(name)
+            if key in self._lazy_mods:
+                pns.loop.run(self._load_lazy(key))
+        return pns.data.get_alias(name, self._mod, self._mod_alias_index) is not None
 
     def __iter__(self):
         """
@@ -179,6 +509,8 @@ class DynamicNamespace(pns.data.Namespace):
         Yields:
             object: Active loaded modules.
         """
+        if self._lazy_mods:
+            pns.loop.run(self._load_lazy())
         for name, item in self._mod.items():
             if getattr(item, "_active", True):
                 yield name
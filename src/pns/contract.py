@@ -6,28 +6,95 @@ contracts within the namespace architecture. It ensures that components adhere t
 behavioral rules through contracts, enhancing modularity and consistency across system components.
 
 Functions:
+    - index: Classifies the contracts of a contract sub once, so they can be matched without scanning every function.
     - walk: Traverses loaded modules to identify and yield relevant contracts.
     - match: Collects and organizes contracts applicable to specific functions or modules.
     - verify_sig: Validates that function implementations conform to their specified contracts, particularly in terms of signatures.
+    - check_sig: Verifies signatures according to the mode chosen with verify_sig_mode.
+    - verify_sig_mode: Chooses when signatures are verified; eagerly, in the background, on first call, or never.
+    - wait_verified: Waits for signature verifications running in the background.
 
 The contract enforcement mechanisms facilitated by this module are integral to maintaining a robust, secure,
 and compliant system architecture, ensuring that all components operate within predefined boundaries and conditions.
 """
 
 from ._debug import DEBUG_PNS_GETATTR
+import asyncio
 from collections import defaultdict
 from collections.abc import Generator
+from operator import itemgetter
+import pns._debug
 import pns.data
+import pns.profile
 import pns.verify
 
 if DEBUG_PNS_GETATTR:
-    from pns._contract import Contracted, ContractType
+    import pns._contract as _contract
 else:
-    from pns._ccontract import Contracted, ContractType
+    import pns._ccontract as _contract
+
+Contracted = _contract.Contracted
+ContractType = _contract.ContractType
+LAST_REF = _contract.LAST_REF
+LAST_CALL = _contract.LAST_CALL
+lean_call = _contract.lean_call
+call_metrics = _contract.call_metrics
+METRICS = _contract.METRICS
+sampling = _contract.sampling
+ACTIVE = _contract.ACTIVE
+last_ref = _contract.last_ref
 
 
 CONTRACTS = "__contracts__"
 
+VERIFY_SIG_MODES = ("eager", "deferred", "call", "off")
+VERIFY_SIG = pns._debug.VERIFY_SIG
+# Signature verifications running in the background
+VERIFYING = set()
+
+
+def index(
+    contract_sub: "pns.hub.Sub",
+) -> tuple[dict[str, tuple[int, ...]], list[tuple]]:
+    """
+    Classify the contracts of a contract sub, reusing the result until another contract module is added to it.
+
+    Parameters:
+        contract_sub (pns.hub.Sub): The sub containing contract modules.
+
+    Returns:
+        tuple: A tuple containing two elements:
+            - A dictionary mapping contract module names and aliases to the positions of those modules.
+            - A list with a tuple for each contract module, in load order, of its contracts.
+                Each contract is a tuple of the contract type, the contract function name, the contract function,
+                and the name of the function it targets; an empty string for universal contracts.
+    """
+    cached = contract_sub._contract_index
+    if cached is not None:
+        return cached
+
+    positions = defaultdict(list)
+    entries = []
+    for position, (contract_mod_name, contract_mod) in enumerate(
+        contract_sub._mod.items()
+    ):
+        for name in {contract_mod_name, *contract_mod._alias}:
+            positions[name].append(position)
+
+        contracts = []
+        for contract_func_name, contract_func in contract_mod._func.items():
+            contract_type, target = ContractType.classify(contract_func)
+            if not contract_type:
+                continue
+            contracts.append((contract_type, contract_func_name, contract_func, target))
+        entries.append(tuple(contracts))
+
+    contract_sub._contract_index = (
+        {name: tuple(p) for name, p in positions.items()},
+        entries,
+    )
+    return contract_sub._contract_index
+
 
 def walk(
     loaded: "pns.mod.LoadedMod",
@@ -49,10 +116,26 @@ def walk(
     Notes:
         - The function employs a 'first_pass' flag to differentiate initial contract gathering from recursive
             checks which only yield contracts marked as recursive.
+        - Contract modules are looked up by name in the index of each contract sub rather than scanned.
+    """
+    for contract_type, contract_func_name, contract_func, _ in _walk(
+        loaded, _matching_mods(loaded)
+    ):
+        yield (contract_type, contract_func_name, contract_func)
+
+
+def _matching_mods(loaded: "pns.mod.LoadedMod") -> frozenset[str]:
+    """
+    The names of the contract modules that apply to a loaded module.
     """
     explicit_contracts = getattr(loaded, CONTRACTS, ())
-    matching_mods = {"init", loaded.__name__, *explicit_contracts}
+    return frozenset(("init", loaded.__name__, *explicit_contracts))
 
+
+def _walk(loaded: "pns.mod.LoadedMod", matching_mods: frozenset[str]):
+    """
+    Yield the indexed contracts, including their target function name, that apply to a loaded module.
+    """
     # Ascend until we find a sub that has 'contract'
     current = loaded
     while not hasattr(current, "contract"):
@@ -62,26 +145,18 @@ def walk(
 
     first_pass = True
     while current is not None:
-        contract_mods = {} if not current.contract else current.contract._mod
-        for contract_mod_name, contract_mod in contract_mods.items():
-            # Must match the 'matching_mods' or alias
-            if not (
-                (contract_mod_name in matching_mods)
-                or (contract_mod._alias & matching_mods)
-            ):
-                continue
-
-            # Iterate all functions in that contract module
-            for contract_func_name, contract_func in contract_mod._func.items():
-                contract_type = ContractType.from_func(contract_func)
-                if not contract_type:
-                    continue
-
-                # After first pass, only yield 'recursive' contracts
-                if not first_pass and not contract_type.recursive:
-                    continue
-
-                yield (contract_type, contract_func_name, contract_func)
+        if current.contract:
+            positions, entries = index(current.contract)
+            # Must match the 'matching_mods' or alias, visit them in load order
+            matched = sorted(
+                {p for name in matching_mods for p in positions.get(name, ())}
+            )
+            for position in matched:
+                for contract in entries[position]:
+                    # After first pass, only yield 'recursive' contracts
+                    if not first_pass and not contract[0].recursive:
+                        continue
+                    yield contract
 
         first_pass = False
         current = current.__
@@ -91,8 +166,8 @@ def match(loaded: "pns.mod.Loaded", name: str) -> dict[ContractType, list[Contra
     """
     Collects and organizes contracts applicable to a specified function within a loaded module.
 
-    This function calls 'walk' to retrieve relevant contracts and then filters them based on the
-    function name, storing matches in a dictionary categorized by contract type.
+    The contracts that apply to the module are gathered once and grouped by the function they target,
+    so matching each function of a module only looks up its own name and the universal contracts.
 
     Parameters:
         loaded (pns.mod.Loaded): The loaded module containing the function.
@@ -101,15 +176,26 @@ def match(loaded: "pns.mod.Loaded", name: str) -> dict[ContractType, list[Contra
     Returns:
         dict: A dictionary mapping contract types to lists of callable contract functions.
     """
-    contracts = defaultdict(list)
-
-    for contract_type, contract_func_name, contract_func in walk(loaded):
-        # Only proceed if the contract_func_name matches the function name or is universal
-        if contract_func_name not in (
-            contract_type.value,
-            f"{contract_type.value}_{name}",
+    matching_mods = _matching_mods(loaded)
+    cached = getattr(loaded, "_contract_table", None)
+    if cached is None or cached[0] != matching_mods:
+        table = defaultdict(list)
+        for position, (contract_type, _, contract_func, target) in enumerate(
+            _walk(loaded, matching_mods)
         ):
-            continue
+            table[target].append((position, contract_type, contract_func))
+        cached = (matching_mods, dict(table))
+        loaded._contract_table = cached
+
+    table = cached[1]
+    # Universal contracts and the contracts for this function, in the order they were found
+    found = [*table.get("", ())]
+    if name:
+        found.extend(table.get(name, ()))
+        found.sort(key=itemgetter(0))
+
+    contracts = defaultdict(list)
+    for _, contract_type, contract_func in found:
         # If it meets that criterion, store it in the dict
         contracts[contract_type].append(contract_func)
 
@@ -134,7 +220,9 @@ def verify_sig(
     """
     errors = []
 
-    for contract_type, contract_func_name, contract_func in walk(loaded):
+    for contract_type, _, contract_func, check_name in _walk(
+        loaded, _matching_mods(loaded)
+    ):
         # Only care about Signature types
         if contract_type not in (
             pns.contract.ContractType.SIG,
@@ -142,9 +230,6 @@ def verify_sig(
         ):
             continue
 
-        # Derive the function name it references by stripping e.g. "sig_" or "r_sig_"
-        check_name = contract_func_name[len(f"{contract_type.value}_") :]
-
         # If that function doesn't exist in loaded._func, add to the errors
         # If check_name is empty, its a universal contract and we still match the signature
         if check_name and check_name not in loaded._func:
@@ -157,3 +242,121 @@ def verify_sig(
 
     if errors:
         raise SyntaxError("\n".join(errors))
+
+
+def verify_sig_mode(mode: str = None) -> str:
+    """
+    Choose when the signatures of newly loaded modules are verified against their contracts.
+
+    Modes:
+        - eager: Verify while the module is loaded, a mismatch raises a SyntaxError and the module fails to load.
+        - deferred: Verify in a background task once loading yields, a mismatch is reported through hub.log.
+        - call: Verify the first time one of the module's functions is called, a mismatch raises a SyntaxError
+            from that call and every call after it.
+        - off: Don't verify signatures.
+
+    Parameters:
+        mode (str): The new mode, None to keep the current one.
+
+    Returns:
+        str: The current mode.
+    """
+    global VERIFY_SIG
+    if mode is not None:
+        mode = str(mode).lower()
+        if mode not in VERIFY_SIG_MODES:
+            msg = f"Unknown signature verification mode '{mode}', expected one of {VERIFY_SIG_MODES}"
+            raise ValueError(msg)
+        VERIFY_SIG = mode
+    return VERIFY_SIG
+
+
+def check_sig(loaded: "pns.mod.LoadedMod"):
+    """
+    Verify the signatures of a loaded module according to the current signature verification mode.
+
+    Parameters:
+        loaded (pns.mod.LoadedMod): The module whose functions are to be verified against signature contracts.
+
+    Raises:
+        SyntaxError: In eager mode, if the signatures don't match.
+    """
+    if VERIFY_SIG == "off":
+        return
+    if VERIFY_SIG == "call":
+        _verify_on_call(loaded)
+        return
+    if VERIFY_SIG == "deferred":
+        try:
+            task = asyncio.get_running_loop().create_task(_verify_deferred(loaded))
+        except RuntimeError:
+            # There is no loop to run the verification in the background
+            ...
+        else:
+            VERIFYING.add(task)
+            task.add_done_callback(VERIFYING.discard)
+            return
+    with pns.profile.span("verify_sig", loaded):
+        verify_sig(loaded)
+
+
+async def wait_verified():
+    """
+    Wait for all the signature verifications running in the background to finish.
+    """
+    while VERIFYING:
+        await asyncio.gather(*VERIFYING)
+
+
+async def _verify_deferred(loaded: "pns.mod.LoadedMod"):
+    """
+    Verify signatures once loading yields, reporting mismatches through hub.log.
+    """
+    await asyncio.sleep(0)
+    try:
+        with pns.profile.span("verify_sig", loaded):
+            verify_sig(loaded)
+    except SyntaxError as e:
+        await loaded._.log.error(
+            f"Signature verification failed for '{loaded.__ref__}':\n{e}"
+        )
+
+
+def _verify_on_call(loaded: "pns.mod.LoadedMod"):
+    """
+    Install a pre contract on each function of a module that verifies the module's signatures.
+    Once verification passes the pre contract removes itself, so later calls are unaffected.
+    """
+    result = []
+
+    def verify():
+        if not result:
+            try:
+                verify_sig(loaded)
+            except SyntaxError as e:
+                result.append(e)
+            else:
+                result.append(None)
+                for func in funcs:
+                    func.contracts[ContractType.PRE] = [
+                        c
+                        for c in func.contracts[ContractType.PRE]
+                        if c not in (pre_verify, async_pre_verify)
+                    ]
+        if result[0] is not None:
+            raise result[0]
+
+    def pre_verify(ctx):
+        verify()
+
+    async def async_pre_verify(ctx):
+        verify()
+
+    funcs = [func for func in loaded._func.values() if isinstance(func, Contracted)]
+    for func in funcs:
+        pre = (
+            async_pre_verify
+            if isinstance(func, _contract.AsyncContracted)
+            else pre_verify
+        )
+        func.contracts[ContractType.PRE] = [pre, *func.contracts[ContractType.PRE]]
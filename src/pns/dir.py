@@ -10,20 +10,60 @@ Key Functions:
     - dynamic: Discovers dynamically configured directories specified in 'pyproject.toml' across Python package imports.
     - inline: Finds specific subdirectories within a given list of directories.
     - parse_config: Parses a YAML configuration file to extract dynamic namespaces, configuration settings, and Python imports.
+    - read_config: Reads a YAML configuration file without importing anything it names.
+    - register_imports: Records python imports from a configuration file to be imported on first access.
+
+Key Classes:
+    - LazyModules: A view of sys.modules, used by hub.lib, that performs registered imports on first access.
+
+The results of discovery are cached on disk in the file named by the 'PNS_DYNAMIC_CACHE' environment variable,
+"pns/dynamic.cache" under the user's cache directory by default, which is '$XDG_CACHE_HOME' or "~/.cache".
+Set 'PNS_DYNAMIC_CACHE' to an empty string to disable the cache.
+Each sys.path entry is only crawled again when its modification time changes,
+and each config.yaml is only parsed again when its modification time or size changes;
+a directory without a config.yaml is only checked for one again when its modification time changes.
+The cache file is ignored unless it is owned by the current user and can't be written by anyone else.
+The same file holds the snapshots `pns.mod.load_from_path` keeps of plugin files and the hub snapshot of `pns.snapshot`,
+they are written when `flush_cache` is called or the interpreter exits.
 
 These utilities are essential for configuring and extending the functionality of dynamic namespaces, enabling
 the system to adapt and configure itself based on directory and file-based configurations.
 """
 
+import atexit
 import importlib.resources
 import os
 import pathlib
+import pickle
+import stat
 import sys
 from collections import defaultdict
+from collections.abc import MutableMapping
 
 import yaml
 
 import pns.data
+import pns.profile
+
+CONFIG_FILE = "config.yaml"
+CACHE_FILE = os.environ.get(
+    "PNS_DYNAMIC_CACHE",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join("~", ".cache"),
+        "pns",
+        "dynamic.cache",
+    ),
+)
+CACHE_VERSION = 3
+
+# The discovery cache, loaded from CACHE_FILE on first use
+_CACHE = None
+# Whether the cache has changes that haven't been saved
+_CACHE_DIRTY = False
+_FLUSH_AT_EXIT = False
+
+# Top level module names mapped to the full imports waiting for their first access
+LAZY_IMPORTS: dict[str, set[str]] = {}
 
 
 def walk(locations: list[str]) -> list[pathlib.Path]:
@@ -88,22 +128,21 @@ def dynamic(dirs: set[str] = ()) -> pns.data.NamespaceDict:
         development or locally modified packages are included in the dynamic configuration. Regular directories
         within the Python path are also scanned for `config.yaml` files to load additional configurations.
     """
-    dirs = {x for x in dirs}
+    cache = load_cache()
+    changed = False
+
+    dirs = {pathlib.Path(x) for x in dirs}
     for dir_ in sys.path:
         if not dir_:
             continue
-        path = pathlib.Path(dir_)
-        if not path.is_dir():
+        entry = cache["entries"].get(dir_)
+        if not _entry_current(dir_, entry):
+            entry = _scan_entry(dir_)
+            cache["entries"][dir_] = entry
+            changed = True
+        if entry is None:
             continue
-        for sub in path.iterdir():
-            full = path / sub
-            if str(sub).endswith(".egg-link"):
-                with full.open() as rfh:
-                    dirs.add(pathlib.Path((rfh.read()).strip()))
-            elif full.is_dir():
-                dirs.add(full)
-            else:
-                ...
+        dirs.update(entry["dirs"])
 
     # Set up the _dynamic return
     ret = pns.data.NamespaceDict(
@@ -113,22 +152,219 @@ def dynamic(dirs: set[str] = ()) -> pns.data.NamespaceDict:
 
     # Iterate over namespaces in sys.path
     for dir_ in dirs:
-        # Prefer msgpack configuration if available
-        config_yaml = dir_ / "config.yaml"
-
-        if not config_yaml.is_file():
-            # No configuration found, continue with the next directory
+        config_yaml = dir_ / CONFIG_FILE
+        key = str(config_yaml)
+        parsed = cache["configs"].get(key)
+        if parsed is not None and parsed["stat"] is None:
+            # Adding a config.yaml to a directory without one changes the modification time of the directory
+            try:
+                if os.stat(dir_).st_mtime_ns == parsed["dir_mtime"]:
+                    continue
+            except OSError:
+                continue
+        try:
+            st = config_yaml.stat()
+        except OSError:
+            # No configuration found, remember that until the directory changes
+            try:
+                dir_mtime = os.stat(dir_).st_mtime_ns
+            except OSError:
+                continue
+            cache["configs"][key] = {"stat": None, "dir_mtime": dir_mtime}
+            changed = True
             continue
 
-        dynes, configs = parse_config(config_yaml)
-        if dynes:
-            pns.data.update(ret.dyne, dynes, merge_lists=True)
-        if configs:
-            pns.data.update(ret.config, configs, merge_lists=True)
+        if parsed is None or parsed["stat"] != (st.st_mtime_ns, st.st_size):
+            with pns.profile.span("parse_config", config_yaml):
+                dynes, configs, imports = read_config(config_yaml)
+            parsed = {
+                "stat": (st.st_mtime_ns, st.st_size),
+                "dyne": dynes,
+                "config": configs,
+                "import": imports,
+            }
+            cache["configs"][key] = parsed
+            changed = True
+
+        register_imports(parsed["import"])
+        if parsed["dyne"]:
+            pns.data.update(ret.dyne, _copy(parsed["dyne"]), merge_lists=True)
+        if parsed["config"]:
+            pns.data.update(ret.config, _copy(parsed["config"]), merge_lists=True)
+
+    if changed:
+        save_cache(cache)
 
     return ret
 
 
+def _copy(data: dict) -> pns.data.NamespaceDict:
+    """
+    Copy cached config data so that merging it into the _dynamic return can't modify the cache.
+    """
+    return pns.data.NamespaceDict(
+        {
+            key: (
+                _copy(value)
+                if isinstance(value, dict)
+                else list(value) if isinstance(value, list) else value
+            )
+            for key, value in data.items()
+        }
+    )
+
+
+def _entry_current(dir_: str, entry: dict) -> bool:
+    """
+    Check whether the cached crawl of a sys.path entry is still valid.
+    """
+    if entry is None:
+        return False
+    try:
+        if os.stat(dir_).st_mtime_ns != entry["mtime"]:
+            return False
+        for egg_link, mtime in entry["egg_links"].items():
+            if os.stat(egg_link).st_mtime_ns != mtime:
+                return False
+    except OSError:
+        return False
+    return True
+
+
+def _scan_entry(dir_: str) -> dict | None:
+    """
+    Crawl a sys.path entry for directories that might contain a config.yaml.
+
+    Every child directory is a candidate, whether or not it has a config.yaml yet;
+    adding a config.yaml to an existing directory doesn't change the modification time of the entry.
+
+    Returns:
+        dict: The candidate directories, the modification time of the entry, and the modification times
+            of any .egg-link files; None if the entry is not a directory.
+    """
+    path = pathlib.Path(dir_)
+    try:
+        mtime = path.stat().st_mtime_ns
+        children = list(os.scandir(path))
+    except OSError:
+        return None
+
+    candidates = []
+    egg_links = {}
+    for child in children:
+        full = path / child.name
+        if child.name.endswith(".egg-link"):
+            with full.open() as rfh:
+                # Linked packages live outside of the entry, always check them for a config
+                candidates.append(pathlib.Path((rfh.read()).strip()))
+            egg_links[str(full)] = child.stat().st_mtime_ns
+        elif child.is_dir():
+            candidates.append(full)
+
+    return {"mtime": mtime, "dirs": candidates, "egg_links": egg_links}
+
+
+def load_cache() -> dict:
+    """
+    Load the dynamic discovery cache from disk, or start a new one.
+
+    Returns:
+        dict: The cached sys.path entry crawls and parsed config files.
+    """
+    global _CACHE
+    if _CACHE is not None:
+        return _CACHE
+
+    cache = None
+    if CACHE_FILE:
+        try:
+            with open(os.path.expanduser(CACHE_FILE), "rb") as fh:
+                if _trusted(os.fstat(fh.fileno())):
+                    cache = pickle.load(fh)
+        except Exception:
+            cache = None
+
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        cache = {
+            "version": CACHE_VERSION,
+            "entries": {},
+            "configs": {},
+            "mods": {},
+            "hub": None,
+        }
+
+    _CACHE = cache
+    return _CACHE
+
+
+def _trusted(st: os.stat_result) -> bool:
+    """
+    Check that only the current user could have written the cache file, since loading it can run arbitrary code.
+    """
+    getuid = getattr(os, "getuid", None)
+    if getuid is not None and st.st_uid != getuid():
+        return False
+    return not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def cache_changed():
+    """
+    Mark the cache as changed, so it is saved by `flush_cache` or when the interpreter exits.
+    """
+    global _CACHE_DIRTY, _FLUSH_AT_EXIT
+    _CACHE_DIRTY = True
+    if not _FLUSH_AT_EXIT:
+        _FLUSH_AT_EXIT = True
+        atexit.register(flush_cache)
+
+
+def flush_cache():
+    """
+    Save the cache if it has changed since it was last saved.
+    """
+    if _CACHE_DIRTY and _CACHE is not None:
+        save_cache(_CACHE)
+
+
+def _prune_cache(cache: dict):
+    """
+    Drop the crawls of sys.path entries, the config files, and the snapshots of plugin files that no longer exist.
+    The cache is shared by every environment of the user, so it would otherwise only grow.
+    """
+    for section, exists in (
+        ("entries", os.path.isdir),
+        # Directories without a config.yaml are cached as well
+        ("configs", lambda key: os.path.isdir(os.path.dirname(key))),
+        ("mods", os.path.isfile),
+    ):
+        for key in [key for key in cache[section] if not exists(key)]:
+            del cache[section][key]
+
+
+def save_cache(cache: dict):
+    """
+    Atomically write the dynamic discovery cache to disk, ignoring any failure to do so.
+    Entries for paths that have been removed are dropped first.
+
+    Parameters:
+        cache (dict): The cached sys.path entry crawls and parsed config files.
+    """
+    global _CACHE_DIRTY
+    _CACHE_DIRTY = False
+    if not CACHE_FILE:
+        return
+    _prune_cache(cache)
+    path = pathlib.Path(CACHE_FILE).expanduser()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as fh:
+            pickle.dump(cache, fh)
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+
+
 def inline(dirs: list[str], subdir: str) -> list[str]:
     """
     Search for a specific subdirectory within each directory in a list and return the paths where it exists.
@@ -163,6 +399,29 @@ def parse_config(
         tuple: A tuple containing three elements:
             - A dictionary of dynamic namespace configurations.
             - A NamespaceDict of general configurations.
+
+    Note:
+        Python imports are not performed here, they are registered to be imported on first access through hub.lib.
+    """
+    dyne, config, imports = read_config(config_file)
+    register_imports(imports)
+    return dyne, config
+
+
+def read_config(
+    config_file: pathlib.Path,
+) -> tuple[dict[str, object], dict[str, object], list[str]]:
+    """
+    Read a YAML configuration file without importing the python modules it names.
+
+    Parameters:
+        config_file (pathlib.Path): The path to the configuration file to read.
+
+    Returns:
+        tuple: A tuple containing three elements:
+            - A dictionary of dynamic namespace configurations.
+            - A NamespaceDict of general configurations.
+            - A list of python imports.
     """
     dyne = defaultdict(lambda: pns.data.NamespaceDict(paths=set()))
     config = pns.data.NamespaceDict(
@@ -170,10 +429,9 @@ def parse_config(
         cli_config=pns.data.NamespaceDict(),
         subcommands=pns.data.NamespaceDict(),
     )
-    imports = pns.data.NamespaceDict()
 
     if not config_file.is_file():
-        return dyne, config
+        return dict(dyne), config, []
 
     with config_file.open("rb") as f:
         file_contents = f.read()
@@ -199,21 +457,72 @@ def parse_config(
                 continue
             config[section].setdefault(namespace, pns.data.NamespaceDict()).update(data)
 
-    # Handle python imports
-    for imp in pop_config.get("import", []):
-        base = imp.split(".", 1)[0]
-        if base not in imports:
-            try:
-                imports[base] = importlib.import_module(base)
-            except ModuleNotFoundError:
-                ...
-        if "." in imp:
-            try:
-                importlib.import_module(imp)
-            except ModuleNotFoundError:
-                ...
-
     for name in dyne:
         dyne[name]["paths"] = sorted(dyne[name]["paths"])
 
-    return dyne, config
+    return dict(dyne), config, list(pop_config.get("import", []))
+
+
+def register_imports(imports: list[str]):
+    """
+    Register the python modules named in the "import" section of a config file.
+    They are imported the first time their top level module is accessed through hub.lib.
+
+    Parameters:
+        imports (list[str]): The python imports from a config file.
+    """
+    for imp in imports:
+        base = imp.split(".", 1)[0]
+        LAZY_IMPORTS.setdefault(base, set()).add(imp)
+
+
+def import_lazy(base: str):
+    """
+    Perform the registered imports for a top level module name, ignoring modules that aren't installed.
+
+    Parameters:
+        base (str): The top level module name.
+    """
+    for imp in sorted(LAZY_IMPORTS.pop(base, ()), key=len):
+        if imp in sys.modules:
+            continue
+        try:
+            importlib.import_module(imp)
+        except ModuleNotFoundError:
+            ...
+
+
+class LazyModules(MutableMapping):
+    """
+    A view of sys.modules that performs the imports registered in LAZY_IMPORTS the first time a name is looked up.
+    """
+
+    def __init__(self, modules: dict[str, object] = None):
+        self._modules = sys.modules if modules is None else modules
+
+    def __getitem__(self, name: str):
+        if name in LAZY_IMPORTS:
+            import_lazy(name)
+        return self._modules[name]
+
+    def get(self, name: str, default=None):
+        if name in LAZY_IMPORTS:
+            import_lazy(name)
+        return self._modules.get(name, default)
+
+    def __contains__(self, name: str) -> bool:
+        if name in LAZY_IMPORTS:
+            import_lazy(name)
+        return name in self._modules
+
+    def __setitem__(self, name: str, value):
+        self._modules[name] = value
+
+    def __delitem__(self, name: str):
+        del self._modules[name]
+
+    def __iter__(self):
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
@@ -19,10 +19,11 @@ between development and production-ready code paths.
 """
 
 import builtins
-import contextvars
-import sys
 
+import pns.contract
+import pns.data
 import pns.dir
+import pns.profile
 import pns.ref
 from ._debug import DEBUG_PNS_GETATTR
 
@@ -45,8 +46,12 @@ class Sub(DynamicNamespace):
     Attributes:
         hub (Hub): Reference to the root Hub instance, facilitating access to global state and utilities.
         contracts (list): A list of contract definitions associated with this Sub for managing interactions.
+        _lazy_contracts (bool): The contracts haven't been loaded yet,
+            they are loaded before this Sub or one underneath it loads a module.
     """
 
+    _lazy_contracts = False
+
     def __init__(
         self,
         name: str,
@@ -67,12 +72,14 @@ class Sub(DynamicNamespace):
         self._contract_dir.extend(pns.dir.inline(self._dir, CONTRACTS_DIR))
         self.contract = None
 
-    async def add_sub(self, name: str, **kwargs):
+    async def add_sub(self, name: str, *, lazy: bool = False, **kwargs):
         """
         Adds a sub-component or module to this Sub.
 
         Args:
             name (str): The name of the sub-component to add.
+            lazy (bool): Register the modules and contracts of the new Sub without loading them,
+                they are loaded when they are first accessed.
 
         Returns:
             Sub: The newly added sub-component or None if the sub-component already exists.
@@ -93,13 +100,30 @@ class Sub(DynamicNamespace):
         # Only in the last iteration, use locations
         last_part = parts[-1]
 
-        sub = Sub(last_part, root=self._root or self, parent=self, **kwargs)
-        await sub.load_contracts()
+        with pns.profile.span("add_sub", current, last_part):
+            sub = Sub(last_part, root=self._root or self, parent=current, **kwargs)
+            if lazy:
+                sub._lazy_contracts = bool(sub._contract_dir)
+                sub._scan_lazy()
+            else:
+                await sub.load_contracts()
 
-        current._nest[last_part] = sub
+        current._set_nest(last_part, sub)
 
         return sub
 
+    async def _load_pending_contracts(self):
+        """
+        Load the contracts of this Sub and its parents that were registered lazily,
+        since any of them could apply to a module that is about to be loaded.
+        """
+        current = self
+        while current is not None:
+            if getattr(current, "_lazy_contracts", False):
+                current._lazy_contracts = False
+                await current.load_contracts()
+            current = current.__
+
     async def load_contracts(self):
         """
         Loads and initializes contract definitions for this Sub.
@@ -120,8 +144,8 @@ class Sub(DynamicNamespace):
         self.contract = contract_sub
 
 
-_LAST_REF = contextvars.ContextVar("_last_ref", default=None)
-_LAST_CALL = contextvars.ContextVar("_last_call", default=None)
+_LAST_REF = pns.contract.LAST_REF
+_LAST_CALL = pns.contract.LAST_CALL
 
 
 class Hub(Sub):
@@ -144,10 +168,11 @@ class Hub(Sub):
         """
         super().__init__(name="hub", parent=None, root=None)
 
-        # Add a place for sys modules to live
+        # Add a place for sys modules to live, config imports happen on first access
         hub += "lib"
-        hub.lib._nest = sys.modules
-        hub._dynamic = hub.lib.pns.dir.dynamic()
+        hub.lib._nest = pns.dir.LazyModules()
+        with pns.profile.span("dynamic"):
+            hub._dynamic = hub.lib.pns.dir.dynamic()
 
     @classmethod
     async def new(cls):
@@ -172,7 +197,7 @@ class Hub(Sub):
         """
         Property to access the coroutine-local _last_ref value using the context variable.
         """
-        return _LAST_REF.get()
+        return pns.contract.last_ref()
 
     @_last_ref.setter
     def _last_ref(self, value):
@@ -8,19 +8,90 @@ and converting synchronous functions to asynchronous ones.
 
 Functions:
     - run: Executes an asynchronous coroutine synchronously by managing the event loop.
+    - bridge_loop: Returns the persistent event loop used by `run` when another loop is already running.
     - make_async: Transforms a synchronous function into an asynchronous function, which can then be executed
         within an asynchronous event loop.
 
+Coroutines that are run synchronously from inside a running event loop, such as lazily loaded modules,
+are handed to a long-lived event loop on a dedicated daemon thread instead of a new thread and loop per call.
+How often that happened and how long the calling loop was blocked is tracked in `METRICS`.
+
 These utilities are crucial for applications that need to bridge traditional synchronous operations with
 modern asynchronous programming models, particularly in environments where both styles coexist.
 """
 
 import asyncio
+import contextvars
 import functools
+import threading
+import time
 import concurrent.futures as fut
 from typing import Any
 from collections.abc import Callable
 
+# Counters for coroutines that were run synchronously from inside a running event loop
+METRICS = {
+    # Coroutines run on the bridge loop
+    "bridged": 0,
+    # Coroutines run from inside the bridge loop itself, which needed a throwaway thread
+    "nested": 0,
+    # Total time running loops were blocked waiting for bridged coroutines
+    "blocked_seconds": 0.0,
+}
+
+_BRIDGE_LOCK = threading.Lock()
+_BRIDGE_LOOP: asyncio.AbstractEventLoop = None
+
+
+def bridge_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the long-lived event loop used to run coroutines synchronously from inside other event loops.
+
+    The loop runs forever on a daemon thread that is started on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: The bridge event loop.
+    """
+    global _BRIDGE_LOOP
+    if _BRIDGE_LOOP is not None:
+        return _BRIDGE_LOOP
+
+    with _BRIDGE_LOCK:
+        if _BRIDGE_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="pns-loop-bridge", daemon=True
+            )
+            thread.start()
+            _BRIDGE_LOOP = loop
+    return _BRIDGE_LOOP
+
+
+def _bridge(coroutine, context: contextvars.Context) -> fut.Future:
+    """
+    Schedule a coroutine on the bridge loop, within the given context.
+    """
+    loop = bridge_loop()
+    future = fut.Future()
+
+    def _done(task: asyncio.Task):
+        if task.cancelled():
+            future.set_exception(asyncio.CancelledError())
+        elif task.exception() is not None:
+            future.set_exception(task.exception())
+        else:
+            future.set_result(task.result())
+
+    def _start():
+        if not future.set_running_or_notify_cancel():
+            coroutine.close()
+            return
+        task = loop.create_task(coroutine, context=context)
+        task.add_done_callback(_done)
+
+    loop.call_soon_threadsafe(_start)
+    return future
+
 
 def run(coroutine):
     """
@@ -28,6 +99,8 @@ def run(coroutine):
 
     This function checks if an asyncio event loop is already running; if not, it creates a new one
     and runs the given coroutine, ensuring that the coroutine's execution completes before returning.
+    If a loop is already running, the coroutine is run on the persistent bridge loop with a copy
+    of the caller's context, and the calling loop blocks until it finishes.
 
     Parameters:
         coroutine (coroutine): The asyncio coroutine to be executed.
@@ -39,17 +112,26 @@ def run(coroutine):
         RuntimeError: If called from a running event loop and the coroutine could not be executed.
     """
     try:
-        asyncio.get_running_loop()
+        running = asyncio.get_running_loop()
     except RuntimeError:
         # Create a new loop, run the coroutine and return the result
         return asyncio.run(coroutine)
 
-    # Prepare the executor
-    with fut.ThreadPoolExecutor() as executor:
-        # Submit the coroutine to the executor
-        future = executor.submit(functools.partial(asyncio.run, coroutine))
+    start = time.perf_counter()
+    try:
+        if running is _BRIDGE_LOOP:
+            # The bridge loop can't block on itself, fall back on a throwaway thread and loop
+            METRICS["nested"] += 1
+            with fut.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(functools.partial(asyncio.run, coroutine))
+                return future.result()
+
+        METRICS["bridged"] += 1
+        future = _bridge(coroutine, contextvars.copy_context())
         # Block until the coroutine finishes
         return future.result()
+    finally:
+        METRICS["blocked_seconds"] += time.perf_counter() - start
 
 
 def make_async(
@@ -13,14 +13,19 @@ Key Components:
 - prep: Function to prepare a loaded module with necessary transformations and to evaluate its eligibility via virtual conditions.
 - populate: Function to populate a loaded module with its components while applying any necessary aliases or transformations.
 - load_from_path: Function to load a module from a specific filesystem path.
+- declared_names: Function to read the __virtualname__ and __sub_alias__ of a module from its source without loading it.
 """
 
+import ast
 import pathlib
+import stat
 import sys
 import asyncio
 import inspect
 import pns.contract
 import pns.data
+import pns.dir
+import pns.profile
 import os.path
 from types import ModuleType
 
@@ -29,6 +34,7 @@ import importlib.machinery
 
 VIRTUAL = "__virtual__"
 VIRTUAL_NAME = "__virtualname__"
+SUB_ALIAS = "__sub_alias__"
 CONFIG = "conf.yaml"
 FUNC_ALIAS = "__func_alias__"
 OMIT_FUNC = False
@@ -38,6 +44,64 @@ OMIT_START = ("_",)
 OMIT_END = ()
 
 
+class ModAttrs(dict):
+    """
+    A category of module attributes that mirrors every change into the lookup table of its LoadedMod.
+
+    Attribute resolution on a LoadedMod only consults its `_nest`, so the categories write through to it.
+    When the same name exists in several categories, functions win over variables, which win over classes.
+
+    Attributes:
+        _mod (LoadedMod): The module whose lookup table is kept in sync.
+    """
+
+    def __init__(self, mod: "LoadedMod"):
+        super().__init__()
+        self._mod = mod
+
+    def _sync(self, key: str):
+        """Point the lookup table at the highest priority category that still holds the key."""
+        nest = self._mod._nest
+        for category in self._mod._categories:
+            if key in category:
+                nest[key] = dict.__getitem__(category, key)
+                return
+        nest.pop(key, None)
+
+    def __setitem__(self, key: str, value):
+        super().__setitem__(key, value)
+        self._sync(key)
+
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        self._sync(key)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key: str, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key: str, *default):
+        ret = super().pop(key, *default)
+        self._sync(key)
+        return ret
+
+    def popitem(self):
+        key, value = super().popitem()
+        self._sync(key)
+        return key, value
+
+    def clear(self):
+        keys = list(self)
+        super().clear()
+        for key in keys:
+            self._sync(key)
+
+
 class LoadedMod(pns.data.Namespace):
     """
     Represents a dynamically loaded module within the namespace, encapsulating various module components.
@@ -46,24 +110,24 @@ class LoadedMod(pns.data.Namespace):
     and classes, categorizing them under respective dictionaries for easy access and manipulation.
 
     Attributes:
-        _var (dict): Dictionary to hold module variables.
-        _func (dict): Dictionary to hold module functions.
-        _class (dict): Dictionary to hold module classes.
+        _var (ModAttrs): Dictionary to hold module variables.
+        _func (ModAttrs): Dictionary to hold module functions.
+        _class (ModAttrs): Dictionary to hold module classes.
+        _nest (dict): The combined lookup table of variables, functions, and classes, kept in sync by each category.
+        _contract_table (tuple): The contracts matched to this module while it is populated, see `pns.contract.match`.
+        _files (tuple): The (name, directory, extension) of each source file merged into this module, in load order.
     """
 
+    _contract_table = None
+    _files = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._var = {}
-        self._func = {}
-        self._class = {}
-
-    @property
-    def _nest(self):
-        """Combines variables, functions, and classes into a single dictionary for unified access."""
-        return {**self._class, **self._var, **self._func}
-
-    @_nest.setter
-    def _nest(self, value): ...
+        self._var = ModAttrs(self)
+        self._func = ModAttrs(self)
+        self._class = ModAttrs(self)
+        # Categories in order of priority when names collide
+        self._categories = (self._func, self._var, self._class)
 
 
 def load(path: str):
@@ -118,9 +182,10 @@ async def prep(hub, sub: pns.hub.Sub, name: str, mod: ModuleType) -> LoadedMod:
             parent=loaded,
             root=hub,
         )
-        ret = virtual()
-        if asyncio.iscoroutine(ret):
-            ret = await ret
+        with pns.profile.span("__virtual__", sub, name):
+            ret = virtual()
+            if asyncio.iscoroutine(ret):
+                ret = await ret
 
         error = None
         if ret is True:
@@ -171,8 +236,8 @@ async def populate(loaded, mod: ModuleType, *, implicit_alias: bool = True):
         loaded._func.update(funcs)
         __func_alias__ = {}
 
-    if implicit_alias:
-        pns.data.update(__func_alias__, BUILTIN_ALIAS)
+    # Builtin aliases take precedence, they are looked up directly rather than merged into every module's aliases
+    builtin_alias = BUILTIN_ALIAS if implicit_alias else {}
 
     # Iterate over all attributes in the module
     for attr in getattr(mod, "__load__", mod.__dict__.keys()):
@@ -180,7 +245,7 @@ async def populate(loaded, mod: ModuleType, *, implicit_alias: bool = True):
 
         orig_name = attr
         # Get the function alias if available
-        name = __func_alias__.get(attr, attr)
+        name = builtin_alias.get(attr) or __func_alias__.get(attr, attr)
         obj = getattr(mod, orig_name)
 
         if inspect.isfunction(obj):
@@ -191,7 +256,8 @@ async def populate(loaded, mod: ModuleType, *, implicit_alias: bool = True):
             func = obj
 
             # Make sure the aliased func name gets in there
-            matched_contracts = pns.contract.match(loaded, name)
+            with pns.profile.span("contract.match", loaded, name):
+                matched_contracts = pns.contract.match(loaded, name)
             contracted_func = pns.contract.Contracted(
                 func=func,
                 name=name,
@@ -217,7 +283,7 @@ async def populate(loaded, mod: ModuleType, *, implicit_alias: bool = True):
 
     # Make sure that the signature of functions in the module match the contracts
     if __debug__:
-        pns.contract.verify_sig(loaded)
+        pns.contract.check_sig(loaded)
     return loaded
 
 
@@ -235,24 +301,69 @@ def load_from_path(modname: str, path: pathlib.Path, ext: str) -> ModuleType:
 
     Details:
         - The function attempts to resolve the full path of the module file from the given directory.
+        - The resolved path and module key are kept in a snapshot keyed by the file's path, modification time,
+            and size, so unchanged files aren't resolved again on the next start, see `pns.dir.load_cache`.
+            No snapshot is kept when the cache is disabled.
         - If the module is already loaded (present in `sys.modules`), it returns the existing module.
         - Otherwise, it loads the module using the `importlib` utilities and adds it to `sys.modules`.
     """
     # Convert the given path to a Path object and resolve the module file path
     module_path = path / (modname.replace(".", "/") + ext)
 
-    if not module_path.is_file():
+    if not pns.dir.CACHE_FILE:
+        # Snapshots are only worth keeping when they are saved for the next start
+        if not module_path.is_file():
+            return None
+        module_abs_path = module_path.resolve()
+        return _exec_module(
+            modname, module_abs_path, _module_key(modname, module_abs_path)
+        )
+
+    snapshots = pns.dir.load_cache()["mods"]
+    snapshot_key = str(module_path)
+    try:
+        st = os.stat(module_path)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        # Forget the snapshot of a file that was removed
+        if snapshots.pop(snapshot_key, None) is not None:
+            pns.dir.cache_changed()
         return None
 
-    # Using the absolute path for the module
-    module_abs_path = module_path.resolve()
-    # Create a unique module key with its full path
-    module_key = (
+    # Reuse the resolved path and module key of an unchanged file
+    snapshot = snapshots.get(snapshot_key)
+    if snapshot is None or snapshot[0] != (st.st_mtime_ns, st.st_size):
+        # Using the absolute path for the module
+        module_abs_path = module_path.resolve()
+        module_key = _module_key(modname, module_abs_path)
+        snapshots[snapshot_key] = (
+            (st.st_mtime_ns, st.st_size),
+            str(module_abs_path),
+            module_key,
+        )
+        pns.dir.cache_changed()
+    else:
+        _, module_abs_path, module_key = snapshot
+
+    return _exec_module(modname, module_abs_path, module_key)
+
+
+def _module_key(modname: str, module_abs_path: pathlib.Path) -> str:
+    """
+    Create a unique module key with the full path of the module.
+    """
+    return (
         str(module_abs_path.parent).replace(os.path.sep, ".").lstrip(".")
         + "."
         + modname
     )
 
+
+def _exec_module(modname: str, module_abs_path, module_key: str) -> ModuleType:
+    """
+    Load a module from its absolute path under its unique key, unless it is already in `sys.modules`.
+    """
     # If this unique module path is already in sys.modules, return it
     if module_key in sys.modules:
         return sys.modules[module_key]
@@ -267,7 +378,50 @@ def load_from_path(modname: str, path: pathlib.Path, ext: str) -> ModuleType:
     # Store the module in sys.modules with the unique key
     sys.modules[module_key] = module
     try:
-        spec.loader.exec_module(module)
+        with pns.profile.span("exec_module", module_key):
+            spec.loader.exec_module(module)
     except (Exception, SyntaxError) as e:
         sys.modules.pop(module_key)
     return module
+
+
+def declared_names(modname: str, path: pathlib.Path, ext: str) -> dict[str, object]:
+    """
+    Read the names a module declares for itself from its source, without loading it.
+
+    Parameters:
+        modname (str): The name of the module.
+        path (pathlib.Path): The directory path where the module file is expected to be.
+        ext (str): The file extension of the module, only ".py" files can be read.
+
+    Returns:
+        dict: The literal values assigned to __virtualname__ and __sub_alias__ at the top of the module.
+    """
+    ret = {}
+    if ext != ".py":
+        return ret
+    try:
+        source = (pathlib.Path(path) / (modname.replace(".", "/") + ext)).read_text()
+    except (OSError, UnicodeDecodeError):
+        return ret
+    # Most modules declare neither, don't parse them
+    if VIRTUAL_NAME not in source and SUB_ALIAS not in source:
+        return ret
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return ret
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets = node.targets
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets = [node.target]
+        else:
+            continue
+        for target in targets:
+            if isinstance(target, ast.Name) and target.id in (VIRTUAL_NAME, SUB_ALIAS):
+                try:
+                    ret[target.id] = ast.literal_eval(node.value)
+                except ValueError:
+                    continue
+    return ret
@@ -0,0 +1,182 @@
+"""
+Wall time profiling of hub startup.
+
+When profiling is enabled, the steps of building a hub record how long they took; discovering the dynes,
+parsing each config.yaml, adding each sub, executing each module, running each __virtual__ and __init__,
+matching contracts, verifying signatures, and loading the config.
+Profiling is enabled by the 'PNS_PROFILE_STARTUP' environment variable, which covers the whole startup,
+or by the "pns.profile_startup" config option, which only covers what happens after the config is loaded.
+When it is disabled, each step only pays for checking a flag.
+
+The recorded times are inclusive; the time spent adding a sub includes the time spent loading its modules.
+
+Functions:
+    - enable: Turns profiling on or off.
+    - span: Records the wall time of a block of code.
+    - report: Summarizes the recorded spans, slowest first.
+    - trace: Converts the recorded spans to the Chrome trace event format.
+    - emit: Renders the report with an outputter, or writes the trace to a file, then discards the spans.
+    - reset: Discards the recorded spans.
+"""
+
+import contextlib
+import os
+import threading
+import time
+
+import pns._debug
+
+# Whether spans are being recorded
+ENABLED = bool(pns._debug.PROFILE_STARTUP)
+# The recorded spans, as tuples of (category, name, start ns, duration ns, thread id)
+EVENTS = []
+# The start of profiling, trace timestamps are relative to it
+ORIGIN = time.perf_counter_ns()
+
+_NULL = contextlib.nullcontext()
+
+
+def enable(on: bool = True):
+    """
+    Turn the recording of spans on or off.
+
+    Parameters:
+        on (bool): Whether spans should be recorded.
+    """
+    global ENABLED
+    ENABLED = bool(on)
+
+
+def reset():
+    """
+    Discard the recorded spans, later trace timestamps are relative to now.
+    """
+    global ORIGIN
+    EVENTS.clear()
+    ORIGIN = time.perf_counter_ns()
+
+
+def span(category: str, *names) -> contextlib.AbstractContextManager:
+    """
+    Record the wall time of a block of code when profiling is enabled.
+
+    Parameters:
+        category (str): The kind of step, i.e. "exec_module" or "__init__".
+        names: Identify the step within its category, they are joined with "." only when profiling is enabled.
+            Namespaces are represented by their __ref__.
+
+    Returns:
+        contextlib.AbstractContextManager: A context manager around the block to time.
+    """
+    if not ENABLED:
+        return _NULL
+    parts = (str(getattr(n, "__ref__", n)) for n in names)
+    return _span(category, ".".join(p for p in parts if p))
+
+
+@contextlib.contextmanager
+def _span(category: str, name: str):
+    """
+    Time a block of code and record it as a span.
+    """
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        EVENTS.append(
+            (
+                category,
+                name,
+                start,
+                time.perf_counter_ns() - start,
+                threading.get_ident(),
+            )
+        )
+
+
+def report(limit: int = 25) -> dict:
+    """
+    Summarize the recorded spans.
+
+    Parameters:
+        limit (int): The number of individual spans to list.
+
+    Returns:
+        dict: The count, total and maximum milliseconds of each category, largest total first,
+            and the slowest individual spans.
+    """
+    categories = {}
+    for category, _, _, duration, _ in EVENTS:
+        stats = categories.setdefault(
+            category, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        ms = duration / 1e6
+        stats["count"] += 1
+        stats["total_ms"] += ms
+        stats["max_ms"] = max(stats["max_ms"], ms)
+
+    for stats in categories.values():
+        stats["total_ms"] = round(stats["total_ms"], 3)
+        stats["max_ms"] = round(stats["max_ms"], 3)
+
+    slowest = sorted(EVENTS, key=lambda e: e[3], reverse=True)[:limit]
+    return {
+        "categories": dict(
+            sorted(categories.items(), key=lambda i: i[1]["total_ms"], reverse=True)
+        ),
+        "slowest": [
+            {"category": category, "name": name, "ms": round(duration / 1e6, 3)}
+            for category, name, _, duration, _ in slowest
+        ],
+    }
+
+
+def trace() -> dict:
+    """
+    Convert the recorded spans to the Chrome trace event format,
+    which can be opened in chrome://tracing or https://ui.perfetto.dev.
+
+    Returns:
+        dict: The trace, with a complete event for each span.
+    """
+    pid = os.getpid()
+    return {
+        "traceEvents": [
+            {
+                "name": name or category,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - ORIGIN) / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": tid,
+            }
+            for category, name, start, duration, tid in EVENTS
+        ],
+        "displayTimeUnit": "ms",
+    }
+
+
+async def emit(hub, dest: str, outputter: str = None):
+    """
+    Render the profile of the startup.
+    The recorded spans are discarded afterwards, so a later profile only covers what happens after this one.
+
+    Parameters:
+        hub (pns.hub.Hub): The loaded hub, its outputters render the profile.
+        dest (str): A path ending in ".json" to write a Chrome trace to, anything else prints the report to stderr.
+        outputter (str): The outputter for the report, defaults to the "rend.output" config option or "yaml".
+    """
+    try:
+        if str(dest).endswith(".json"):
+            formatted = await hub.output.json.display(trace())
+            with open(os.path.expanduser(dest), "w") as fh:
+                fh.write(formatted)
+            return
+
+        if outputter is None:
+            outputter = hub.OPT.get("rend", {}).get("output") or "yaml"
+        formatted = await hub.output[outputter].display(report())
+        print(formatted, file=hub.lib.sys.stderr)
+    finally:
+        reset()
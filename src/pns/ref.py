@@ -11,12 +11,16 @@ Functions:
     - path: Provides a list of all objects from the hub up to a specified reference, enabling traceability of the access path.
     - find: Parses a dot-separated reference string and retrieves the corresponding object from the hub, handling nested structures.
 
+Resolved references are cached on the namespace they were resolved from, see `pns.data.Namespace._cached_ref`.
+
 These functions are typically used in systems where components are dynamically managed and accessed through a centralized hub,
 enabling flexible and maintainable access patterns across a pluggably-structured application.
 """
 
 from collections.abc import Iterable
 
+import pns.data
+
 
 def last(hub, ref) -> object:
     """
@@ -52,15 +56,22 @@ def path(hub, ref) -> list[object]:
         >>> path(hub, "system.network.adapter")
         >>> # Returns a list: [hub, system, network, adapter]
     """
-    ret = [hub]
+    if not isinstance(ref, str):
+        ref = ".".join(ref)
 
-    if isinstance(ref, str):
-        ref = ref.split(".")
+    if isinstance(hub, pns.data.Namespace):
+        cached = hub._cached_ref(ref)
+        if cached is not None:
+            return [hub, *cached]
 
+    ret = [hub]
     root = hub
-    for chunk in ref:
+    for chunk in ref.split("."):
         root = getattr(root, chunk)
         ret.append(root)
+
+    if isinstance(hub, pns.data.Namespace):
+        hub._cache_ref(ref, ret[1:])
     return ret
 
 
@@ -77,16 +88,30 @@ def find(hub, ref: str) -> object:
         any: The object found on the hub
     """
     # Get the named reference from the hub
+    parts = [p for p in ref.split(".") if p]
+    if not parts:
+        return hub
+    ref = ".".join(parts)
+
+    cacheable = isinstance(hub, pns.data.Namespace)
+    if cacheable:
+        cached = hub._cached_ref(ref)
+        if cached is not None:
+            return cached[-1]
+
     finder = hub
-    parts = ref.split(".")
+    path = []
     for p in parts:
         if not p:
             continue
         try:
             # Grab the next attribute in the reference
             finder = getattr(finder, p)
+            path.append(finder)
             continue
         except AttributeError:
+            # Items are not attributes, changes to them can't be tracked
+            cacheable = False
             try:
                 # It might be a dict-like object, try getitem
                 finder = finder.__getitem__(p)
@@ -97,4 +122,7 @@ def find(hub, ref: str) -> object:
                     finder = tuple(finder).__getitem__(int(p))
                     continue
             raise
+
+    if cacheable:
+        hub._cache_ref(ref, path)
     return finder
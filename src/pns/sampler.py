@@ -0,0 +1,160 @@
+"""
+A sampling profiler for the calls made through the hub.
+
+While the sampler runs, a background thread periodically snapshots the stack of contracted calls that each task,
+or each thread outside of an event loop, is in the middle of. Stacks are made of hub references instead of Python
+frames, and every call in flight is sampled, including calls that are awaiting something,
+so the samples show where wall time goes in terms of the hub namespace.
+A task started from within a contracted call is sampled underneath the call that started it,
+and the call that started it isn't sampled again on its own while the task is running.
+
+Samples are exported in the folded stack format, one "outer;inner count" line per stack,
+which flamegraph.pl, speedscope, and similar tools turn into a flame graph.
+
+Functions:
+    - start: Starts sampling the active calls in a background thread.
+    - stop: Stops sampling.
+    - sample: Takes a single sample of the active calls.
+    - reset: Discards the samples taken so far.
+    - folded: Exports the samples in the folded stack format.
+    - write: Writes the folded samples to a file.
+    - record: Samples until the interpreter exits, then writes the folded samples to a file.
+"""
+
+import atexit
+import collections
+import os
+import threading
+
+import pns.contract
+
+# Seconds between samples
+INTERVAL = 0.01
+
+# The number of times each stack of refs has been sampled, outermost call first
+SAMPLES = collections.Counter()
+
+_THREAD = None
+_STOP = threading.Event()
+# The file that record writes the samples to at exit, its exit handler is only registered once
+_RECORD_PATH = None
+
+
+def start(interval: float = INTERVAL):
+    """
+    Start sampling the active calls in a background thread.
+
+    Parameters:
+        interval (float): Seconds between samples.
+    """
+    global _THREAD
+    if _THREAD is not None:
+        return
+    pns.contract.sampling(True)
+    _STOP.clear()
+    _THREAD = threading.Thread(
+        target=_run, args=(interval,), name="pns-sampler", daemon=True
+    )
+    _THREAD.start()
+
+
+def stop():
+    """
+    Stop sampling, the samples taken so far are kept.
+    """
+    global _THREAD
+    if _THREAD is None:
+        return
+    _STOP.set()
+    _THREAD.join()
+    _THREAD = None
+    pns.contract.sampling(False)
+
+
+def _run(interval: float):
+    """
+    Take samples until the sampler is stopped.
+    """
+    while not _STOP.wait(interval):
+        sample()
+
+
+def sample() -> int:
+    """
+    Take a single sample of the stacks of the active calls.
+
+    Returns:
+        int: The number of stacks that were sampled.
+    """
+    stacks = []
+    # The calls that other active calls were made from, such as the call that started a task
+    outer = set()
+    for call in list(pns.contract.ACTIVE.values()):
+        stack = []
+        while call is not None:
+            stack.append(call)
+            call = call.last_call
+        outer.update(id(call) for call in stack[1:])
+        stacks.append(stack)
+
+    count = 0
+    for stack in stacks:
+        # A call that is waiting on another active call is already part of that call's stack
+        if not stack or id(stack[0]) in outer:
+            continue
+        SAMPLES[";".join(call.contract.__ref__ for call in reversed(stack))] += 1
+        count += 1
+    return count
+
+
+def reset():
+    """
+    Discard the samples taken so far.
+    """
+    SAMPLES.clear()
+
+
+def folded() -> str:
+    """
+    Export the samples in the folded stack format.
+
+    Returns:
+        str: A line of "outer;inner count" for each sampled stack.
+    """
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(SAMPLES.items()))
+
+
+def write(path: str):
+    """
+    Write the samples in the folded stack format to a file.
+
+    Parameters:
+        path (str): The file to write.
+    """
+    with open(os.path.expanduser(path), "w") as fh:
+        fh.write(folded())
+
+
+def record(path: str, interval: float = INTERVAL):
+    """
+    Sample until the interpreter exits, then write the folded samples to a file.
+    Recording again only changes the file, the samples are written once.
+
+    Parameters:
+        path (str): The file to write.
+        interval (float): Seconds between samples.
+    """
+    global _RECORD_PATH
+    start(interval)
+    if _RECORD_PATH is None:
+        atexit.register(_write_record)
+    _RECORD_PATH = path
+
+
+def _write_record():
+    """
+    Stop sampling and write the samples to the file given to record.
+    """
+    stop()
+    if _RECORD_PATH is not None:
+        write(_RECORD_PATH)
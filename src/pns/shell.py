@@ -59,7 +59,7 @@ class CMD(pns.hub.Sub):
 
         Examples:
             To create an instance without any initial commands, which will be specified later dynamically:
-            >>> hub._nest["sh"] = CMD(hub, parent=hub)
+            >>> hub._set_nest("sh", CMD(hub, parent=hub))
 
             To execute a command directly:
             >>> await hub.sh.ls('-la')  # Executes 'ls -la' in the shell and returns the output.
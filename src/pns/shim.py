@@ -11,8 +11,14 @@ to be used in POP-based applications, handling everything from setting up basic
 interactions to loading complex subsystems with custom configurations.
 """
 
+import pns._debug
+import pns.contract
+import pns.dir
 import pns.hub
+import pns.profile
+import pns.sampler
 import pns.shell
+import pns.snapshot
 
 
 async def pop_hub():
@@ -43,6 +49,8 @@ async def loaded_hub(
     logs: bool = True,
     load_config: bool = True,
     shell: bool = True,
+    snapshot: bool = None,
+    lazy: bool = None,
 ):
     """
     Initializes a new hub with a comprehensive setup including dynamic modules, configuration, and logging.
@@ -59,6 +67,11 @@ async def loaded_hub(
         logs (bool): Enables logging setup.
         load_config (bool): Enables configuration loading from specified paths.
         shell (bool): Enables the ability to execute shell commands from the hub.
+        snapshot (bool): Restore the dynes from a snapshot of the last start instead of loading them,
+            see `pns.snapshot`. Defaults to the "pns.snapshot" config option or the PNS_SNAPSHOT environment variable.
+        lazy (bool): Register the modules of the dynes and their subdirectories without loading them,
+            each module is loaded and its __init__ function run when it is first accessed.
+            Defaults to the "pns.lazy_load" config option or the PNS_LAZY_LOAD environment variable.
 
     Returns:
         pns.hub.Hub: A fully loaded hub instance ready for use in cPOP projects.
@@ -75,26 +88,65 @@ async def loaded_hub(
     await hub.config._load_all()
 
     if load_config:
-        opt = await hub.config.init.load(cli=cli, **hub._dynamic.config)
+        with pns.profile.span("config.load", cli):
+            opt = await hub.config.init.load(cli=cli, **hub._dynamic.config)
         hub.OPT = opt
+        # Profile the rest of the startup when the option is given on the cli
+        if opt.pns.get("profile_startup"):
+            pns.profile.enable()
+        # Opt in to lean contracted calls
+        if str(opt.pns.get("lean_call")).lower() in ("1", "true", "yes"):
+            pns.contract.lean_call()
+        # Opt in to recording call metrics
+        if str(opt.pns.get("call_metrics")).lower() in ("1", "true", "yes"):
+            pns.contract.call_metrics()
+        if opt.pns.get("verify_sig"):
+            pns.contract.verify_sig_mode(opt.pns.verify_sig)
     else:
         hub.OPT = {}
 
+    # Sample the hub call stacks until exit
+    sample = pns._debug.SAMPLE or hub.OPT.get("pns", {}).get("sample")
+    if sample:
+        pns.sampler.record(sample)
+
     # Setup the logger
     if load_config and logs:
         await hub.log.init.setup(**hub.OPT.log.copy())
 
     # Add the ability to shell out from the hub
     if shell:
-        hub._nest["sh"] = pns.shell.CMD(hub, parent=hub)
+        hub._set_nest("sh", pns.shell.CMD(hub, parent=hub))
+
+    if snapshot is None:
+        snapshot = pns._debug.SNAPSHOT or str(
+            hub.OPT.get("pns", {}).get("snapshot")
+        ).lower() in ("1", "true", "yes")
+
+    if lazy is None:
+        lazy = pns._debug.LAZY_LOAD or str(
+            hub.OPT.get("pns", {}).get("lazy_load")
+        ).lower() in ("1", "true", "yes")
 
     if load_all_dynes:
-        await load_all(hub, load_all_subdirs)
+        await load_all(hub, load_all_subdirs, snapshot=snapshot, lazy=lazy)
+
+    # Keep the snapshots of what was loaded for the next start
+    pns.dir.flush_cache()
+
+    profile = pns._debug.PROFILE_STARTUP or hub.OPT.get("pns", {}).get(
+        "profile_startup"
+    )
+    if profile and pns.profile.ENABLED:
+        pns.profile.enable(False)
+        await pns.profile.emit(hub, profile)
 
     return hub
 
 
-async def load_all(hub, load_all_subdirs: bool):
+async def load_all(
+    hub, load_all_subdirs: bool, *, snapshot: bool = False, lazy: bool = False
+):
     """
     Load all dynamic subs onto the hub.
 
@@ -105,15 +157,39 @@ async def load_all(hub, load_all_subdirs: bool):
     Parameters:
         hub (pns.hub.Hub): The hub instance to which the dynamic modules are to be loaded.
         load_all_subdirs (bool): If True, loads all subdirectories for each dyne module.
+        snapshot (bool): If True, restore the dynes from a valid snapshot of an earlier load,
+            otherwise load them and save a snapshot for next time.
+        lazy (bool): If True, register the dynes and their subdirectories without loading their modules,
+            each module is loaded when it is first accessed or when its sub is loaded with `hub.pop.sub.load`.
 
     Note:
         This function does not return a value; it modifies the hub instance in place.
     """
+    # The snapshot is only valid for the same dynes loaded in the same way
+    key = (
+        load_all_subdirs,
+        tuple(
+            sorted(
+                (name, tuple(str(p) for p in dyne.paths))
+                for name, dyne in hub._dynamic.dyne.items()
+            )
+        ),
+    )
+    if snapshot and pns.snapshot.restore(hub, key):
+        return
+
+    # A snapshot can only be taken of modules that have been loaded
+    lazy = lazy and not snapshot
+
     for dyne in hub._dynamic.dyne:
         if dyne in hub._nest:
             continue
-        await hub.add_sub(name=dyne, locations=hub._dynamic.dyne[dyne].paths)
-        await hub[dyne]._load_all()
+        await hub.add_sub(name=dyne, locations=hub._dynamic.dyne[dyne].paths, lazy=lazy)
+        if not lazy:
+            await hub[dyne]._load_all()
         if not load_all_subdirs:
             continue
-        await hub.pop.sub.load_subdirs(hub._nest[dyne], recurse=True)
+        await hub.pop.sub.load_subdirs(hub._nest[dyne], recurse=True, lazy=lazy)
+
+    if snapshot:
+        pns.snapshot.save(hub, key)
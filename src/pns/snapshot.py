@@ -0,0 +1,158 @@
+"""
+Snapshots of the structure of a loaded hub, used to start a process without loading every module.
+
+A snapshot records the subs of a hub, recursively, with their locations, contract locations, aliases,
+and, for each loaded module, the source files it was loaded from and the aliases it can be found by.
+Restoring a snapshot recreates the subs without importing anything; each module is loaded the first time
+it is accessed, and contracts are loaded before the first module they could apply to.
+
+Snapshots are stored in the `pns.dir` cache file and are only restored while they are still valid;
+the dynes they were taken from must be unchanged and none of the directories or files they list may have been modified.
+
+Functions:
+    - dump: Records the structure of the subs of a hub.
+    - save: Stores a snapshot of a hub in the cache.
+    - restore: Recreates the subs of a hub from the cached snapshot, if it is still valid.
+"""
+
+import os
+import pathlib
+
+import pns.data
+import pns.dir
+import pns.hub
+
+SNAPSHOT_VERSION = 1
+
+
+def dump(hub: pns.hub.Hub, names: list[str]) -> dict:
+    """
+    Record the structure of the named subs of a hub.
+
+    Parameters:
+        hub (pns.hub.Hub): The loaded hub.
+        names (list[str]): The names of the subs on the hub to record.
+
+    Returns:
+        dict: The structure of each sub by name, and the modification time of every directory and file it uses.
+    """
+    stats = {}
+    subs = {}
+    for name in names:
+        sub = hub._nest.get(name)
+        if isinstance(sub, pns.hub.Sub):
+            subs[name] = _dump_sub(sub, stats)
+    return {"version": SNAPSHOT_VERSION, "subs": subs, "stats": stats}
+
+
+def _dump_sub(sub: pns.hub.Sub, stats: dict) -> dict:
+    """
+    Record the structure of a sub and the subs underneath it.
+    """
+    dirs = [str(d) for d in sub._dir]
+    contract_dirs = [str(d) for d in sub._contract_dir]
+    for path in (*dirs, *contract_dirs):
+        stats[path] = _stat(path)
+
+    mods = {}
+    for key, loaded in sub._mod.items():
+        for name, path, ext in loaded._files:
+            source = os.path.join(path, name + ext)
+            stats[source] = _stat(source)
+        mods[key] = {
+            "files": list(loaded._files),
+            "alias": sorted({loaded.__name__, *loaded._alias}),
+        }
+
+    return {
+        "dir": dirs,
+        "contract_dir": contract_dirs,
+        "alias": sorted(sub._alias),
+        "active": sub._active,
+        "mods": mods,
+        "subs": {
+            name: _dump_sub(child, stats)
+            for name, child in sub._nest.items()
+            if isinstance(child, pns.hub.Sub)
+        },
+    }
+
+
+def _stat(path: str) -> tuple[int, int]:
+    """
+    The modification time and size of a path, None if it doesn't exist.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def save(hub: pns.hub.Hub, key: tuple):
+    """
+    Store a snapshot of the dynes of a hub in the cache.
+
+    Parameters:
+        hub (pns.hub.Hub): The loaded hub.
+        key (tuple): Identifies how the hub was loaded, the snapshot is only restored for the same key.
+    """
+    cache = pns.dir.load_cache()
+    cache["hub"] = {"key": key, **dump(hub, list(hub._dynamic.dyne))}
+    pns.dir.cache_changed()
+
+
+def restore(hub: pns.hub.Hub, key: tuple) -> bool:
+    """
+    Recreate the dynes of a hub from the cached snapshot without loading any modules.
+
+    Parameters:
+        hub (pns.hub.Hub): The hub to restore the subs onto; subs that it already has are kept.
+        key (tuple): Identifies how the hub is being loaded, it must match the key the snapshot was saved with.
+
+    Returns:
+        bool: True if the snapshot was valid and restored.
+    """
+    snapshot = pns.dir.load_cache().get("hub")
+    if not snapshot or snapshot.get("version") != SNAPSHOT_VERSION:
+        return False
+    if snapshot["key"] != key:
+        return False
+    for path, stat in snapshot["stats"].items():
+        if _stat(path) != stat:
+            return False
+
+    for name, data in snapshot["subs"].items():
+        if name not in hub._nest:
+            _restore_sub(hub, hub, name, data)
+
+    pns.data.invalidate_refs()
+    return True
+
+
+def _restore_sub(hub: pns.hub.Hub, parent: pns.hub.Sub, name: str, data: dict):
+    """
+    Recreate a sub and the subs underneath it, its modules are loaded when they are first accessed.
+    """
+    sub = pns.hub.Sub(name, root=hub, parent=parent)
+    sub._dir = [pathlib.Path(d) for d in data["dir"]]
+    sub._contract_dir = [pathlib.Path(d) for d in data["contract_dir"]]
+    sub._lazy_contracts = bool(sub._contract_dir)
+    sub._alias.update(data["alias"])
+
+    sub._lazy_mods = {}
+    sub._lazy_alias = {}
+    sub._lazy_files = set()
+    for key, mod in data["mods"].items():
+        sub._lazy_mods[key] = [tuple(f) for f in mod["files"]]
+        sub._lazy_files.update((f[0], f[1]) for f in mod["files"])
+        for alias in (key, *mod["alias"]):
+            sub._lazy_alias.setdefault(alias, key)
+    sub._lazy_pending()
+
+    parent._set_nest(name, sub)
+
+    for child_name, child in data["subs"].items():
+        _restore_sub(hub, sub, child_name, child)
+
+    sub._active = data["active"]
@@ -3,11 +3,58 @@ from collections.abc import Callable
 
 NO_TYPE_ANNOTATION = object()
 
+# Signature maps of contract functions, by cache key
+SIG_MAPS = {}
+# Signature verification errors, by the cache keys of the function and the contract function
+SIGS = {}
+
+
+def cache_key(func: Callable) -> tuple:
+    """
+    Identify a function by the code object it runs, along with its defaults and annotations,
+    seeing through wrappers such as Contracted and decorators that set __wrapped__.
+    Functions made by the same decorator share the code object of the wrapper, so the function it wraps is used.
+    Returns None if the function has no code object to identify it by, or part of the key isn't hashable.
+    """
+    target = func
+    if getattr(target, "__code__", None) is None:
+        target = getattr(target, "func", None)
+    try:
+        target = inspect.unwrap(target)
+    except ValueError:
+        return None
+    code = getattr(target, "__code__", None)
+    if code is None:
+        return None
+    key = (
+        type(func),
+        getattr(func, "__name__", None),
+        code,
+        getattr(target, "__defaults__", None),
+        tuple((getattr(target, "__kwdefaults__", None) or {}).items()),
+        tuple((getattr(target, "__annotations__", None) or {}).items()),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
 
 def sig_map(ver: Callable) -> dict[str, object]:
     """
-    Generates the map dict for the signature verification
+    Generates the map dict for the signature verification, memoised per contract function
     """
+    key = cache_key(ver)
+    if key is None:
+        return _sig_map(ver)
+    vdat = SIG_MAPS.get(key)
+    if vdat is None:
+        vdat = SIG_MAPS[key] = _sig_map(ver)
+    return vdat
+
+
+def _sig_map(ver: Callable) -> dict[str, object]:
     vsig = inspect.signature(ver)
     vparams = list(vsig.parameters.values())
     vdat = {
@@ -42,8 +89,21 @@ def sig_map(ver: Callable) -> dict[str, object]:
 def sig(func: Callable, sig_func: Callable) -> list[str]:
     """
     Takes 2 functions, the first function is verified to have a parameter signature
-    compatible with the second function
+    compatible with the second function.
+    Results are cached by the code objects, defaults, and annotations of both functions
     """
+    func_key = cache_key(func)
+    sig_key = cache_key(sig_func)
+    if func_key is None or sig_key is None:
+        return _sig(func, sig_func)
+    key = (func_key, sig_key)
+    errors = SIGS.get(key)
+    if errors is None:
+        errors = SIGS[key] = tuple(_sig(func, sig_func))
+    return list(errors)
+
+
+def _sig(func: Callable, sig_func: Callable) -> list[str]:
     errors = []
     fsig = inspect.signature(func)
     fparams = list(fsig.parameters.values())
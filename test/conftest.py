@@ -0,0 +1,35 @@
+import pytest
+
+import pns.dir
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--bench",
+        action="store_true",
+        help="Run the benchmarks that start fresh interpreters",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--bench"):
+        return
+    skip = pytest.mark.skip(reason="Benchmark, run with --bench")
+    for item in items:
+        if "bench" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def dynamic_cache(tmp_path_factory):
+    """
+    Keep the dynamic discovery cache of the test run out of the user's cache directory
+    """
+    path = str(tmp_path_factory.mktemp("pns") / "dynamic.cache")
+    with pytest.MonkeyPatch.context() as mp:
+        # Subprocesses started by tests pick up the environment variable
+        mp.setenv("PNS_DYNAMIC_CACHE", path)
+        mp.setattr(pns.dir, "CACHE_FILE", path)
+        mp.setattr(pns.dir, "_CACHE", None)
+        yield path
+        pns.dir.flush_cache()
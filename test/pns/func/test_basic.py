@@ -1,5 +1,12 @@
+import sys
+
 import pytest
 
+import pns._debug
+import pns.dir
+import pns.ref
+import pns.shim
+
 
 async def test_sub_alias(hub):
     await hub.pop.sub.add(locations=["test.pns.alias"])
@@ -219,3 +226,132 @@ async def test_reload(hub):
 
 async def test_reload_fail(hub):
     assert not await hub.pop.sub.reload("nonexistant")
+
+
+async def test_load_all_concurrent(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"], name="serial")
+    await hub.serial._load_all()
+    await hub.pop.sub.add(locations=["test.pns.mods"], name="concurrent")
+    await hub.concurrent._load_all(concurrency=4, threads=True)
+
+    # Modules are registered in the same order as a serial load
+    assert list(hub.concurrent._mod) == list(hub.serial._mod)
+    assert await hub.concurrent.test.ping() == {}
+
+
+async def test_load_all_concurrent_virtualname(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods.same_vname"], name="vnames")
+    await hub.vnames._load_all(concurrency=2)
+    assert await hub.vnames.vname.func() == "wha? Yep!"
+
+
+async def test_lazy_sub(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"], lazy=True)
+    assert not hub.mods._mod
+    assert await hub.mods.test.ping() == {}
+    assert list(hub.mods._mod) == ["test"]
+
+    # Virtual names are found by loading the rest of the sub
+    await hub.pop.sub.add(
+        locations=["test.pns.mods.same_vname"], name="vnames", lazy=True
+    )
+    assert await hub.vnames.vname.func() == "wha? Yep!"
+
+
+async def test_lazy_sub_alias(hub):
+    await hub.pop.sub.add(locations=["test.pns.alias"], lazy=True)
+    assert await hub.red.init.ping() is True
+
+
+async def test_lazy_missing_attr(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"], lazy=True)
+    pending = set(hub.mods._lazy_mods)
+    # Only the nested namespaces with lazy modules are checked when a lookup misses
+    assert hub._lazy_nest == {"mods"}
+
+    # Looking for a name that no module declares doesn't load anything
+    assert not hasattr(hub.mods, "does_not_exist")
+    assert not hasattr(hub, "does_not_exist")
+    assert set(hub.mods._lazy_mods) == pending
+    assert not hub.mods._mod
+
+    await hub.pop.sub.load(hub.mods)
+    assert not hub._lazy_nest
+
+
+async def test_loaded_hub_lazy(monkeypatch):
+    monkeypatch.setattr(pns._debug, "LAZY_LOAD", False)
+    # Every module is loaded at startup by default
+    hub = await pns.shim.loaded_hub(load_config=False, logs=False)
+    assert "init" in hub.dyne1._mod
+    assert not hub.dyne1._lazy_mods
+    assert not hub._lazy_nest
+    assert hub.dyne1.INIT is True
+
+    hub = await pns.shim.loaded_hub(load_config=False, logs=False, lazy=True)
+    assert not hub.dyne1._mod
+    # The __init__ of the init module sets attributes on the sub before they are looked up
+    assert hub.dyne1.INIT is True
+    assert list(hub.dyne1._mod) == ["init"]
+
+
+async def test_lazy_subdirs(hub):
+    await hub.pop.sub.add(locations=["test.pns.sdirs"], lazy=True)
+    await hub.pop.sub.load_subdirs(hub.sdirs, recurse=True, lazy=True)
+    assert not hub.sdirs.l11.l2._mod
+    assert await hub.sdirs.l11.l2.test.ping()
+
+    await hub.pop.sub.load(hub.sdirs, recurse=True)
+    assert "test" in hub.sdirs.l13.l2._mod
+    assert not hub.sdirs.l13._lazy_mods
+
+
+async def test_lazy_contract(hub):
+    await hub.pop.sub.add(
+        locations=["test.pns.mods"],
+        contract_locations=["test.pns.contract"],
+        lazy=True,
+    )
+    assert not hub.mods.contract
+    with hub.lib.pytest.raises(ValueError):
+        await hub.mods.test.ping(4)
+
+
+async def test_ref_last_mod_not_cached(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    # "_" resolves to the module of the last call, so it can't be cached
+    hub._last_ref = "mods.test.ping"
+    assert pns.ref.find(hub, "_") is hub.mods.test
+    assert hub["_"] is hub.mods.test
+    hub._last_ref = "mods.foo.bar"
+    assert pns.ref.find(hub, "_") is hub.mods.foo
+    assert hub["_"] is hub.mods.foo
+
+
+async def test_virtual_lib_import(hub, tmp_path, monkeypatch):
+    (tmp_path / "pns_lazy_virtual_dep.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "pns_lazy_virtual_dep", raising=False)
+    pns.dir.register_imports(["pns_lazy_virtual_dep"])
+
+    # Checking hub.lib for a registered import performs it
+    await hub.pop.sub.add(locations=["test.pns.mods.lib_virtual"], name="lib_virtual")
+    assert await hub.lib_virtual.dep.value() == 1
+    assert "dep" in hub.lib_virtual
+    assert "missing" not in hub.lib
+
+
+async def test_load_all_concurrent_lazy_contract(hub):
+    for name, concurrency in (("serial", 1), ("concurrent", 4)):
+        await hub.pop.sub.add(
+            locations=["test.pns.mods"],
+            contract_locations=["test.pns.rcontract"],
+            name=name,
+            lazy=True,
+        )
+        await hub[name].add_sub("child", locations=["test.pns.mods"])
+        await hub[name].child._load_all(concurrency=concurrency)
+
+    # The parent's contracts are loaded before the modules underneath it either way
+    assert await hub.serial.child.test.ping() == {"recursive": True}
+    assert await hub.concurrent.child.test.ping() == {"recursive": True}
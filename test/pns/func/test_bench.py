@@ -1,3 +1,10 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
 repeats = 10000
 
 
@@ -17,3 +24,24 @@ async def test_via_fqn(hub):
     await hub.pop.sub.add(locations=["test.pns.mods"])
     for i in range(repeats):
         await hub.mods.test.fqn()
+
+
+@pytest.mark.bench
+def test_startup_cold_warm(tmp_path, record_property):
+    code = (
+        "import asyncio, pns.shim; "
+        "asyncio.run(pns.shim.loaded_hub(load_config=False, logs=False))"
+    )
+    env = {**os.environ, "PNS_DYNAMIC_CACHE": str(tmp_path / "dynamic.cache")}
+
+    timings = {}
+    for run in ("cold", "warm"):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=env, check=True)
+        timings[run] = time.perf_counter() - start
+
+    assert (tmp_path / "dynamic.cache").is_file()
+    # The warm start reuses what the cold start cached
+    assert timings["warm"] <= timings["cold"]
+    for run, seconds in timings.items():
+        record_property(f"loaded_hub_{run}", seconds)
@@ -64,3 +64,348 @@ async def test_critical(hub, opts):
     await hub.log.critical(message)
     await hub.log.init.close()
     assert message in hub.log.test.LOGS
+
+
+async def test_file(hub, opts):
+    opts.update(log_level="info", log_plugin="file")
+    await hub.log.init.setup(**opts)
+    for i in range(3):
+        await hub.log.info(f"message {i}")
+    await hub.log.init.close()
+
+    text = hub.lib.pathlib.Path(opts["log_file"]).read_text()
+    # Each message is written on its own line
+    assert text.endswith("message 2\n")
+    lines = text.splitlines()
+    assert len(lines) == 3
+    assert [line.split()[-1] for line in lines] == ["0", "1", "2"]
+    assert hub.log.file.HANDLE is None
+
+
+async def test_file_rotate_interval(hub, opts):
+    opts.update(
+        log_level="info",
+        log_plugin="file",
+        log_file_flush_size=1,
+        log_file_rotate_interval="0.05",
+    )
+    await hub.log.init.setup(**opts)
+    await hub.log.info("message 0")
+    await hub.lib.asyncio.sleep(0.1)
+    await hub.log.info("message 1")
+    await hub.log.init.close()
+
+    # A fractional interval isn't truncated to 0, which would never rotate
+    path = hub.lib.pathlib.Path(opts["log_file"])
+    assert path.read_text().split()[-1] == "1"
+    assert path.with_name(f"{path.name}.1").read_text().split()[-1] == "0"
+
+
+async def test_file_lock_loops(hub, opts):
+    opts.update(log_level="info", log_plugin="file")
+    await hub.log.init.setup(**opts)
+
+    async def flush(msg: str):
+        await hub.log.file.process_batch([msg])
+        # Waiting on the lock binds it to the running loop
+        await hub.lib.asyncio.gather(hub.log.file.flush(), hub.log.file.flush())
+
+    await flush("message 0")
+    # The buffer can be flushed on another loop, as by a "thread" log worker
+    await hub.lib.asyncio.to_thread(hub.lib.asyncio.run, flush("message 1"))
+    await hub.log.init.close()
+
+    lines = hub.lib.pathlib.Path(opts["log_file"]).read_text().splitlines()
+    assert [line.split()[-1] for line in lines] == ["0", "1"]
+
+
+async def test_file_flush_size(hub, opts):
+    opts.update(log_level="info", log_plugin="file", log_file_flush_size=1)
+    await hub.log.init.setup(**opts)
+    await hub.log.info("message")
+    # Let the listener process the message
+    for _ in range(10):
+        await hub.lib.asyncio.sleep(0.01)
+
+    assert not hub.log.file.BUFFER
+    assert "message" in hub.lib.pathlib.Path(opts["log_file"]).read_text()
+    await hub.log.init.close()
+
+
+async def test_file_flush_interval(hub, opts):
+    opts.update(log_level="info", log_plugin="file", log_file_flush_interval=0.01)
+    await hub.log.init.setup(**opts)
+    await hub.log.info("message")
+    for _ in range(10):
+        await hub.lib.asyncio.sleep(0.01)
+
+    assert "message" in hub.lib.pathlib.Path(opts["log_file"]).read_text()
+    await hub.log.init.close()
+
+
+async def test_file_rotate(hub, opts):
+    opts.update(
+        log_level="info",
+        log_plugin="file",
+        log_file_flush_size=1,
+        log_file_max_bytes=1,
+        log_file_backups=2,
+    )
+    await hub.log.init.setup(**opts)
+    for i in range(4):
+        await hub.log.info(f"message {i}")
+        await hub.lib.asyncio.sleep(0.01)
+    await hub.log.init.close()
+
+    path = hub.lib.pathlib.Path(opts["log_file"])
+    assert path.read_text().split()[-1] == "3"
+    assert path.with_name(f"{path.name}.1").read_text().split()[-1] == "2"
+    assert path.with_name(f"{path.name}.2").read_text().split()[-1] == "1"
+    assert not path.with_name(f"{path.name}.3").exists()
+
+
+async def test_filtered(hub, opts):
+    opts["log_level"] = "info"
+    await hub.log.init.setup(**opts)
+    tasks = len(hub.lib.asyncio.all_tasks())
+    ret = hub.log.debug("message")
+    # Filtered messages don't schedule anything on the loop
+    assert ret is hub.log.info("other")
+    assert len(hub.lib.asyncio.all_tasks()) == tasks
+    await ret
+    await hub.log.init.close()
+    assert "message" not in hub.log.test.LOGS
+    assert "other" in hub.log.test.LOGS
+
+
+async def test_no_logger(hub):
+    await hub.log.debug("message")
+    await hub.log.critical("message")
+
+
+async def test_queue_block(hub, opts):
+    opts.update(log_level="info", log_queue_size=1)
+    await hub.log.init.setup(**opts)
+    hub.log.info("message 0")
+    # The queue is full, so this message waits for the listener to make room
+    pending = hub.log.info("message 1")
+    assert hub.log.QUEUE.full()
+    await pending
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == ["message 0", "message 1"]
+    assert not hub.log.DROPPED
+
+
+async def test_queue_block_limit(hub, opts):
+    opts.update(log_level="info", log_queue_size=1)
+    await hub.log.init.setup(**opts)
+    hub.log.info("message 0")
+    pending = hub.log.info("message 1")
+    # As many records wait as the queue holds, past that the oldest record is dropped
+    assert hub.log.info("message 2") is hub.log.init.DONE
+    assert hub.log.HANDLER.waiting == 1
+    await pending
+    assert hub.log.HANDLER.waiting == 0
+    await hub.log.init.close()
+    assert sorted(hub.log.test.LOGS) == ["message 1", "message 2"]
+    assert hub.log.DROPPED == {"INFO": 1}
+
+
+async def test_queue_block_own_record(hub, opts):
+    opts.update(log_level="info", log_queue_size=1)
+    await hub.log.init.setup(**opts)
+    hub.log.info("message 0")
+    # A record logged outside of the hub waits for room on its own
+    hub.lib.logging.getLogger("other").info("message 1")
+    assert hub.log.HANDLER.waiting == 1
+    while hub.log.HANDLER.waiting:
+        await hub.lib.asyncio.sleep(0)
+
+    # A log call only returns the wait of its own record
+    assert hub.log.info("message 2") is hub.log.init.DONE
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == ["message 0", "message 1", "message 2"]
+
+
+async def test_queue_block_other_loop(hub, opts):
+    opts.update(log_level="info", log_queue_size=1)
+    await hub.log.init.setup(**opts)
+
+    async def produce():
+        for i in range(3):
+            # The queue belongs to the hub's loop, records can't wait for room in it here
+            await hub.log.info(f"message {i}")
+
+    await hub.lib.asyncio.to_thread(hub.lib.asyncio.run, produce())
+    await hub.log.init.close()
+    assert hub.log.test.LOGS
+    assert len(hub.log.test.LOGS) + hub.log.DROPPED["INFO"] == 3
+    assert hub.log.test.LOGS[-1] == "message 2"
+
+
+async def test_queue_drop_oldest(hub, opts):
+    opts.update(log_level="info", log_queue_size=2, log_overflow="drop_oldest")
+    await hub.log.init.setup(**opts)
+    for i in range(5):
+        hub.log.info(f"message {i}")
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == ["message 3", "message 4"]
+    assert hub.log.DROPPED == {"INFO": 3}
+
+
+async def test_queue_drop_level(hub, opts):
+    opts.update(log_level="info", log_queue_size=2, log_overflow="drop_level")
+    await hub.log.init.setup(**opts)
+    for i in range(3):
+        hub.log.info(f"message {i}")
+    hub.log.error("error")
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == ["message 1", "error"]
+    assert hub.log.DROPPED == {"INFO": 2}
+
+
+async def test_queue_sample(hub, opts):
+    opts.update(
+        log_level="info", log_queue_size=1, log_overflow="sample", log_overflow_sample=2
+    )
+    await hub.log.init.setup(**opts)
+    for i in range(5):
+        hub.log.info(f"message {i}")
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == ["message 4"]
+    assert hub.log.DROPPED == {"INFO": 4}
+
+
+async def test_queue_overflow_unknown(hub, opts):
+    opts.update(log_level="info", log_overflow="nope")
+    with pytest.raises(ValueError):
+        await hub.log.init.setup(**opts)
+
+
+async def test_worker_thread(hub, opts):
+    opts.update(log_level="info", log_worker="thread")
+    await hub.log.init.setup(**opts)
+    for i in range(3):
+        await hub.log.info(f"message {i}")
+    assert hub.log.LISTENER.name == "pns-log"
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == ["message 0", "message 1", "message 2"]
+
+
+async def test_worker_thread_exit(hub):
+    code = (
+        "import asyncio, pns.shim\n"
+        "async def main():\n"
+        "    hub = await pns.shim.loaded_hub(load_config=False, logs=False)\n"
+        "    await hub.log.init.setup(log_level='info', log_worker='thread')\n"
+        "    await hub.log.info('message')\n"
+        "    await asyncio.sleep(0.1)\n"
+        "asyncio.run(main())\n"
+    )
+    # The interpreter exits without closing the log listener, which is waiting for the next record
+    result = hub.lib.subprocess.run(
+        [hub.lib.sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "message" in result.stderr
+
+
+async def test_worker_thread_file(hub, opts):
+    opts.update(
+        log_level="info",
+        log_plugin="file",
+        log_worker="thread",
+        log_file_flush_interval=0.01,
+    )
+    await hub.log.init.setup(**opts)
+    await hub.log.info("message")
+    for _ in range(20):
+        await hub.lib.asyncio.sleep(0.01)
+
+    # The flush timer runs on the worker's loop
+    assert "message" in hub.lib.pathlib.Path(opts["log_file"]).read_text()
+    await hub.log.init.close()
+
+
+async def test_worker_thread_block(hub, opts):
+    opts.update(log_level="info", log_worker="thread", log_queue_size=1)
+    await hub.log.init.setup(**opts)
+    for i in range(5):
+        await hub.log.info(f"message {i}")
+    await hub.log.init.close()
+    assert hub.log.test.LOGS == [f"message {i}" for i in range(5)]
+    assert not hub.log.DROPPED
+
+
+async def test_worker_unknown(hub, opts):
+    opts.update(log_level="info", log_worker="nope")
+    with pytest.raises(ValueError):
+        await hub.log.init.setup(**opts)
+
+
+@pytest.fixture
+async def structured(hub, opts, tmp_path):
+    opts.update(
+        log_level="info",
+        log_plugin="structured",
+        log_structured_file=str(tmp_path / "pns.log.jsonl"),
+    )
+    return opts
+
+
+async def test_structured(hub, structured):
+    await hub.log.init.setup(**structured)
+    await hub.log.info("message %s", 1)
+    try:
+        raise ValueError("oops")
+    except ValueError:
+        await hub.log.error("error", exc_info=True)
+    await hub.log.init.close()
+
+    records = hub.log.structured.read(path=structured["log_structured_file"])
+    assert [(r["level"], r["message"]) for r in records] == [
+        ("INFO", "message 1"),
+        ("ERROR", "error"),
+    ]
+    assert records[0]["exc"] is None
+    assert "ValueError: oops" in records[1]["exc"]
+    assert isinstance(records[0]["time"], float)
+
+
+async def test_structured_filter(hub, structured):
+    await hub.log.init.setup(**structured)
+    await hub.log.info("info")
+    await hub.log.warning("warning")
+    await hub.log.init.close()
+
+    path = structured["log_structured_file"]
+    records = hub.log.structured.read(path=path, level="warning")
+    assert [r["message"] for r in records] == ["warning"]
+    assert not hub.log.structured.read(path=path, ref="nope")
+
+
+async def test_structured_render(hub, structured):
+    await hub.log.init.setup(**structured)
+    await hub.log.warning("message")
+    await hub.log.init.close()
+
+    rendered = hub.log.structured.render(
+        path=structured["log_structured_file"], log_fmt="[%(levelname)s] %(message)s"
+    )
+    assert rendered == "[WARNING] message"
+
+
+async def test_structured_msgpack(hub, structured):
+    pytest.importorskip("msgpack")
+    structured["log_structured_format"] = "msgpack"
+    await hub.log.init.setup(**structured)
+    await hub.log.info("message")
+    await hub.log.init.close()
+
+    records = hub.log.structured.read(
+        path=structured["log_structured_file"], fmt="msgpack"
+    )
+    assert [r["message"] for r in records] == ["message"]
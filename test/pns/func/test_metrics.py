@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+
+import pns.contract
+
+
+@pytest.fixture
+async def metrics(hub):
+    enabled = pns.contract._contract.CALL_METRICS
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    hub.pop.metrics.reset()
+    hub.pop.metrics.enable()
+    yield hub.pop.metrics
+    hub.pop.metrics.enable(enabled)
+    hub.pop.metrics.reset()
+
+
+async def test_disabled(hub, metrics):
+    pns.contract.call_metrics(False)
+    pns.contract.METRICS.clear()
+    await hub.mods.test.ping()
+    assert not pns.contract.METRICS
+
+
+async def test_calls(hub, metrics):
+    for _ in range(3):
+        await hub.mods.test.ping()
+
+    ret = metrics.get()
+    assert ret["mods.test.ping"]["calls"] == 3
+    assert ret["mods.test.ping"]["errors"] == 0
+    assert ret["mods.test.ping"]["peak"] == 1
+
+
+async def test_errors(hub, metrics):
+    with pytest.raises(Exception):
+        hub.pop.test.nest()
+
+    ret = metrics.get(sort="errors")
+    for ref in ("nest", "foo", "bar", "baz"):
+        assert ret[f"pop.test.{ref}"]["errors"] == 1
+
+
+async def test_own_time(hub, metrics):
+    await hub.pop.sub.add(locations=["test.pns.mods.metrics"], name="metrics")
+    await hub.metrics.slow.outer(0.05)
+
+    ret = metrics.get()
+    # The time spent in the functions it called is not its own
+    assert ret["metrics.slow.outer"]["total_ms"] >= 50
+    assert ret["metrics.slow.outer"]["own_ms"] < 50
+    assert ret["metrics.slow.sleep"]["own_ms"] >= 50
+    assert list(ret)[0] == "metrics.slow.sleep"
+
+
+async def test_peak(hub, metrics):
+    await hub.pop.sub.add(locations=["test.pns.mods.metrics"], name="metrics")
+    await asyncio.gather(*(hub.metrics.slow.sleep(0.01) for _ in range(4)))
+    assert metrics.get()["metrics.slow.sleep"]["peak"] == 4
+
+
+async def test_dump(hub, metrics, tmp_path):
+    await hub.pop.sub.add(name="output")
+    await hub.mods.test.ping()
+
+    path = tmp_path / "metrics.json"
+    formatted = await metrics.dump(path=str(path))
+    ret = hub.lib.json.loads(path.read_text())
+    assert formatted == path.read_text()
+    assert ret["mods.test.ping"]["calls"] == 1
+
+
+async def test_sort(hub, metrics):
+    with pytest.raises(ValueError):
+        metrics.get(sort="nope")
@@ -28,3 +28,46 @@ def test_find(hub):
     assert pns.ref.find(hub, "test.subtest.list_attr.0") == "list_value"
     with pytest.raises(AttributeError):
         pns.ref.find(hub, "test.subtest.nonexistent")
+
+
+async def test_find_cached(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    ping = pns.ref.find(hub, "mods.test.ping")
+    assert hub._cached_ref("mods.test.ping")[-1] is ping
+    assert pns.ref.find(hub, "mods.test.ping") is ping
+    assert hub["mods.test.ping"] is ping
+    assert pns.ref.path(hub, "mods.test.ping") == [
+        hub,
+        hub.mods,
+        hub.mods.test,
+        ping,
+    ]
+
+
+async def test_cache_not_for_values(hub):
+    assert pns.ref.find(hub, "test.subtest.attr") == "value"
+    assert hub._cached_ref("test.subtest.attr") is None
+    hub.test.subtest.attr = "new_value"
+    assert pns.ref.find(hub, "test.subtest.attr") == "new_value"
+
+
+async def test_cache_invalidated(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    old = hub["mods.test"]
+    assert await hub.pop.sub.reload("mods")
+    assert hub._cached_ref("mods.test") is None
+    new = hub["mods.test"]
+    assert new is not old
+    assert hub["mods.test"] is new
+
+
+async def test_cache_shadowed(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    assert hub["mods.test"] is hub.mods.test
+    # Plain state doesn't invalidate the cache
+    hub.mods.STATE = True
+    assert hub._cached_ref("mods.test") is not None
+    # Shadowing a child does
+    hub.mods.test = "shadow"
+    assert hub._cached_ref("mods.test") is None
+    assert hub["mods.test"] == "shadow"
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+import pns.contract
+import pns.sampler
+
+
+@pytest.fixture
+async def sampler(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods.metrics"], name="metrics")
+    pns.sampler.reset()
+    yield pns.sampler
+    pns.sampler.stop()
+    pns.contract.sampling(False)
+    pns.sampler.reset()
+
+
+async def test_sample(hub, sampler):
+    pns.contract.sampling(True)
+    tasks = [
+        asyncio.create_task(hub.metrics.slow.outer(0.05)),
+        asyncio.create_task(hub.metrics.slow.sleep(0.05)),
+    ]
+    await asyncio.sleep(0.01)
+    assert sampler.sample() == 2
+    await asyncio.gather(*tasks)
+
+    # Finished calls are no longer active
+    assert not pns.contract.ACTIVE
+    assert sampler.sample() == 0
+    assert sampler.folded() == (
+        "metrics.slow.outer;metrics.slow.sleep 1\nmetrics.slow.sleep 1\n"
+    )
+
+
+async def test_nested_task(hub, sampler):
+    pns.contract.sampling(True)
+
+    async def spawn():
+        # A task started within a call is sampled underneath it
+        async with pns.contract._contract.CALL_STACK(hub.metrics.slow.outer):
+            return asyncio.create_task(hub.metrics.slow.sleep(0.05))
+
+    task = await spawn()
+    await asyncio.sleep(0.01)
+    sampler.sample()
+    await task
+    assert "metrics.slow.outer;metrics.slow.sleep" in sampler.SAMPLES
+
+
+async def test_nested_task_leaf(hub, sampler):
+    pns.contract.sampling(True)
+
+    async with pns.contract._contract.CALL_STACK(hub.metrics.slow.outer):
+        task = asyncio.create_task(hub.metrics.slow.sleep(0.05))
+        await asyncio.sleep(0.01)
+        # The call that started the task is only sampled as part of the task's stack
+        assert sampler.sample() == 1
+        await task
+    assert sampler.folded() == "metrics.slow.outer;metrics.slow.sleep 1\n"
+
+
+async def test_start_stop(hub, sampler, tmp_path):
+    sampler.start(interval=0.001)
+    await hub.metrics.slow.outer(0.05)
+    sampler.stop()
+    assert not pns.contract._contract.SAMPLING
+    assert sampler.SAMPLES["metrics.slow.outer;metrics.slow.sleep"] > 0
+
+    path = tmp_path / "stacks.folded"
+    await hub.pop.sampler.dump(str(path))
+    assert path.read_text() == sampler.folded()
+
+
+async def test_record_once(sampler, monkeypatch, tmp_path):
+    registered = []
+    monkeypatch.setattr(sampler.atexit, "register", registered.append)
+    monkeypatch.setattr(sampler, "_RECORD_PATH", None)
+
+    # Recording again only changes the file the samples are written to
+    sampler.record(str(tmp_path / "first.folded"))
+    sampler.record(str(tmp_path / "second.folded"))
+    assert registered == [sampler._write_record]
+
+    sampler._write_record()
+    assert not (tmp_path / "first.folded").exists()
+    assert (tmp_path / "second.folded").is_file()
@@ -0,0 +1,83 @@
+import os
+import pathlib
+
+import pytest
+
+import pns.dir
+import pns.shim
+import pns.snapshot
+
+
+@pytest.fixture
+async def snapshot(hub, tmp_path, monkeypatch):
+    monkeypatch.setattr(pns.dir, "CACHE_FILE", str(tmp_path / "dynamic.cache"))
+    monkeypatch.setattr(pns.dir, "_CACHE", None)
+
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    await hub.mods._load_all()
+    await hub.pop.sub.add(locations=["test.pns.mods.same_vname"], name="vnames")
+    await hub.vnames._load_all()
+    await hub.pop.sub.add(locations=["test.pns.cmods"])
+    await hub.cmods._load_all()
+    await hub.pop.sub.add(locations=["test.pns.sdirs"])
+    await hub.pop.sub.load_subdirs(hub.sdirs, recurse=True)
+
+    names = ["mods", "vnames", "cmods", "sdirs"]
+    pns.dir.load_cache()["hub"] = {"key": "test", **pns.snapshot.dump(hub, names)}
+
+    return await pns.shim.loaded_hub(
+        load_all_dynes=False,
+        load_all_subdirs=False,
+        logs=False,
+        load_config=False,
+    )
+
+
+async def test_restore(snapshot):
+    hub = snapshot
+    assert pns.snapshot.restore(hub, "test")
+
+    # Nothing is loaded until it is used
+    assert not hub.mods._mod
+    assert await hub.mods.test.ping() == {}
+    assert "test" in hub.mods._mod
+    assert "foo" not in hub.mods._mod
+
+    assert await hub.vnames.vname.func() == "wha? Yep!"
+    assert await hub.sdirs.l11.l2.test.ping()
+
+    # Contracts are loaded before the modules they apply to
+    assert not hub.cmods.contract
+    assert await hub.cmods.ctest.cping()
+    assert hub.CPING
+
+    # Iterating a sub loads the rest of it
+    assert "foo" in list(hub.mods)
+
+
+async def test_restore_key(snapshot):
+    assert not pns.snapshot.restore(snapshot, "other")
+    assert "mods" not in snapshot._nest
+
+
+async def test_restore_stale(hub, tmp_path, monkeypatch):
+    monkeypatch.setattr(pns.dir, "CACHE_FILE", str(tmp_path / "dynamic.cache"))
+    monkeypatch.setattr(pns.dir, "_CACHE", None)
+
+    # Work on a copy so a failure can't leave the tracked sources modified
+    source = tmp_path / "stale"
+    source.mkdir()
+    module = source / "foo.py"
+    module.write_text(
+        (pathlib.Path(__file__).parent.parent / "mods" / "foo.py").read_text()
+    )
+    await hub.pop.sub.add(locations=[str(source)], name="stale")
+    await hub.stale._load_all()
+    pns.dir.load_cache()["hub"] = {"key": "test", **pns.snapshot.dump(hub, ["stale"])}
+
+    new_hub = await pns.shim.loaded_hub(
+        load_all_dynes=False, load_all_subdirs=False, logs=False, load_config=False
+    )
+    st = os.stat(module)
+    os.utime(module, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+    assert not pns.snapshot.restore(new_hub, "test")
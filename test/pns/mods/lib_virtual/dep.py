@@ -0,0 +1,6 @@
+def __virtual__(hub):
+    return "pns_lazy_virtual_dep" in hub.lib, "Missing pns_lazy_virtual_dep library"
+
+
+async def value(hub):
+    return hub.lib.pns_lazy_virtual_dep.VALUE
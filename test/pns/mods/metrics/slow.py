@@ -0,0 +1,6 @@
+async def sleep(hub, seconds: float):
+    await hub.lib.asyncio.sleep(seconds)
+
+
+async def outer(hub, seconds: float):
+    await hub._.sleep(seconds)
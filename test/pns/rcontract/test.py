@@ -0,0 +1,8 @@
+"""
+A recursive contract, it applies to the "test" modules of the subs underneath the sub it belongs to
+"""
+
+
+async def r_call_ping(hub, ctx):
+    ret = await ctx.func(*ctx.args, **ctx.kwargs)
+    return {**ret, "recursive": True}
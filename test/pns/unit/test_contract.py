@@ -1,5 +1,9 @@
 import inspect
 
+import pytest
+
+import pns._debug
+import pns.contract
 from pns.contract import Contracted, ContractType
 
 
@@ -14,3 +18,223 @@ async def test_contracted_shortcut(hub):
 
     with hub.lib.pytest.raises(TypeError):
         await c()
+
+
+async def test_contracted_chains(hub):
+    calls = []
+
+    def pre(ctx):
+        calls.append("pre")
+
+    def r_pre(ctx):
+        calls.append("r_pre")
+
+    def post(ctx):
+        calls.append("post")
+        return ctx.return_value
+
+    def r_post(ctx):
+        calls.append("r_post")
+        return ctx.return_value
+
+    def f(hub):
+        calls.append("call")
+        return True
+
+    c = Contracted(root=hub, func=f, name="f", parent=None)
+    assert c._uncontracted
+    assert c() is True
+    assert calls == ["call"]
+
+    calls.clear()
+    c.contracts = {
+        ContractType.PRE: [pre],
+        ContractType.R_PRE: [r_pre],
+        ContractType.POST: [post],
+        ContractType.R_POST: [r_post],
+    }
+    assert not c._uncontracted
+    assert c() is True
+    assert calls == ["pre", "r_pre", "call", "r_post", "post"]
+
+    del c.contracts[ContractType.PRE]
+    calls.clear()
+    c()
+    assert calls == ["r_pre", "call", "r_post", "post"]
+
+
+async def test_contracted_chains_in_place(hub):
+    calls = []
+
+    def pre(ctx):
+        calls.append("pre")
+
+    def post(ctx):
+        calls.append("post")
+        return ctx.return_value
+
+    def f(hub):
+        calls.append("call")
+
+    c = Contracted(root=hub, func=f, name="f", parent=None)
+    # Changing a list in place, including one that didn't exist yet, recompiles the chains
+    c.contracts[ContractType.PRE].append(pre)
+    assert not c._uncontracted
+    c()
+    assert calls == ["pre", "call"]
+
+    calls.clear()
+    c.contracts[ContractType.POST].extend([post, post])
+    c.contracts[ContractType.POST].pop()
+    c.contracts[ContractType.PRE].remove(pre)
+    c()
+    assert calls == ["call", "post"]
+
+
+async def test_contracted_gen_shortcut(hub):
+    async def agen(hub, n):
+        for i in range(n):
+            yield i
+
+    def gen(hub, n):
+        yield from range(n)
+
+    assert [i async for i in Contracted(root=hub, func=agen, name="a")(3)] == [0, 1, 2]
+    assert list(Contracted(root=hub, func=gen, name="g")(3)) == [0, 1, 2]
+
+
+@pytest.fixture
+def lean():
+    pns.contract.lean_call()
+    yield
+    pns.contract.lean_call(pns._debug.LEAN_CALL)
+
+
+async def test_lean_call(hub, lean):
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    assert await hub.pop.test.func(1, a=2) == ((1,), {"a": 2})
+    # hub._ resolves through the lean call stack
+    with pytest.raises(hub.pop.test.TestError):
+        hub.pop.test.nest()
+    assert hub._last_ref is None
+    assert hub._last_call is None
+
+
+def test_call_stack_selected(lean):
+    _contract = pns.contract._contract
+    # The call stack is picked when a mode is switched, not on every call
+    modes = (_contract.CALL_METRICS, _contract.SAMPLING)
+    assert _contract.CALL_STACK is _contract.CALL_STACKS[(True, *modes)]
+    pns.contract.lean_call(False)
+    assert _contract.CALL_STACK is _contract.CALL_STACKS[(False, *modes)]
+    assert "__new__" not in vars(_contract.CallStack)
+
+
+async def test_lean_context(hub, lean):
+    await hub.pop.sub.add(
+        locations=["test.pns.mods.contract_ctx"],
+        name="mods",
+        contract_locations=["test.pns.contract"],
+    )
+    # The contracts use the lazily created cache
+    assert await hub.mods.ctx.test() == "contract executed"
+    ctx = pns.contract._contract.LeanContext(hub, None, None)
+    assert ctx._cache is None
+    ctx.cache["key"] = "value"
+    assert ctx.cache == {"key": "value"}
+    with pytest.raises(AttributeError):
+        ctx.other = True
+
+
+async def test_contract_index(hub):
+    await hub.pop.sub.add(
+        locations=["test.pns.mods"], contract_locations=["test.pns.contract"]
+    )
+    positions, entries = pns.contract.index(hub.mods.contract)
+    assert pns.contract.index(hub.mods.contract) is hub.mods.contract._contract_index
+
+    contracts = entries[positions["test"][0]]
+    targets = {name: target for _, name, _, target in contracts}
+    assert targets["pre_ping"] == "ping"
+    assert "functions" not in targets
+
+    # The index is rebuilt when another contract module is added
+    await hub.mods.contract._load_mod("many")
+    assert hub.mods.contract._contract_index is None
+
+    matched = pns.contract.match(hub.mods.test, "ping")
+    assert [f.__name__ for f in matched[ContractType.PRE]] == ["pre_ping"]
+    assert [f.__name__ for f in matched[ContractType.POST]] == ["post_ping"]
+    assert not pns.contract.match(hub.mods.test, "demo")[ContractType.PRE]
+
+
+def test_contract_type_parse():
+    assert ContractType.parse("pre") == (ContractType.PRE, "")
+    assert ContractType.parse("r_sig_func") == (ContractType.R_SIG, "func")
+    assert ContractType.parse("call_r_func") == (ContractType.CALL, "r_func")
+    assert ContractType.parse("presence") == (None, None)
+    assert ContractType.parse("r_prefix") == (None, None)
+    assert ContractType.parse("") == (None, None)
+
+    def post_func(): ...
+
+    c = Contracted(name="r_post_func", func=post_func, parent=None, root=None)
+    assert c._contract_class == (ContractType.R_POST, "func")
+    assert ContractType.from_func(c) is ContractType.R_POST
+    assert ContractType.from_func(post_func) is ContractType.POST
+
+
+@pytest.fixture
+def verify_mode():
+    mode = pns.contract.verify_sig_mode()
+    yield pns.contract.verify_sig_mode
+    pns.contract.verify_sig_mode(mode)
+
+
+async def _fail_sigs(hub):
+    hub.LOAD_FAIL = True
+    await hub.pop.sub.add(locations=["test.pns.mods.contract_sig"], name="sigs")
+    await hub.sigs._load_mod("fail_sigs")
+
+
+async def test_verify_sig_eager(hub, verify_mode):
+    verify_mode("eager")
+    with pytest.raises(SyntaxError, match="missing_func"):
+        await _fail_sigs(hub)
+
+
+async def test_verify_sig_deferred(hub, verify_mode):
+    verify_mode("deferred")
+    errors = []
+    hub.log.error = lambda msg: errors.append(msg) or hub.lib.asyncio.sleep(0)
+
+    await _fail_sigs(hub)
+    assert "fail_sigs" in hub.sigs._mod
+
+    await pns.contract.wait_verified()
+    assert "missing_func" in errors[0]
+
+
+async def test_verify_sig_call(hub, verify_mode):
+    verify_mode("call")
+    await _fail_sigs(hub)
+    for _ in range(2):
+        with pytest.raises(SyntaxError, match="missing_func"):
+            await hub.sigs.fail_sigs.async_func()
+
+    # Verification passes once, then the check is removed
+    hub.LOAD_PASS = True
+    await hub.sigs._load_mod("pass_sigs")
+    func = hub.sigs.pass_sigs.async_func
+    assert not func._uncontracted
+    assert await func() is None
+    assert func._uncontracted
+
+
+async def test_verify_sig_off(hub, verify_mode):
+    verify_mode("off")
+    await _fail_sigs(hub)
+    assert await hub.sigs.fail_sigs.async_func() is None
+
+    with pytest.raises(ValueError):
+        verify_mode("sometimes")
@@ -0,0 +1,105 @@
+import pns._data
+from pns.data import Namespace, get_alias
+
+
+def test_get_alias_index():
+    root = Namespace("root")
+    child = root._add_child("child")
+    child._alias.add("alias")
+    root._index_alias("child", *child._alias)
+
+    assert get_alias("child", root._nest, root._alias_index) is child
+    assert get_alias("alias", root._nest, root._alias_index) is child
+    assert get_alias("missing", root._nest, root._alias_index) is None
+    # Without an index the collection is scanned
+    assert get_alias("alias", root._nest) is child
+
+
+def test_get_alias_inactive():
+    root = Namespace("root")
+    child = root._add_child("child")
+    child._alias.add("alias")
+    root._index_alias("child", "alias")
+
+    child._active = False
+    assert get_alias("child", root._nest, root._alias_index) is None
+    assert get_alias("alias", root._nest, root._alias_index) is None
+
+    child._active = True
+    assert get_alias("alias", root._nest, root._alias_index) is child
+
+
+def test_get_alias_stale():
+    root = Namespace("root")
+    child = root._add_child("child")
+    child._alias.add("alias")
+    root._index_alias("child", "alias")
+
+    # Replacing the child must not resolve the alias to the replacement
+    root._nest.pop("child")
+    assert get_alias("alias", root._nest, root._alias_index) is None
+    replacement = root._add_child("child")
+    assert get_alias("alias", root._nest, root._alias_index) is None
+    assert get_alias("child", root._nest, root._alias_index) is replacement
+
+
+def test_get_alias_mod_index():
+    root = Namespace("root")
+    child = root._add_child("child")
+    child._alias.add("alias")
+    root._index_alias("child", "alias")
+    mod = Namespace("mod", parent=root, root=root)
+    mod._alias.add("alias")
+    root._mod["mod"] = mod
+    root._index_alias("mod", "alias", mod=True)
+
+    # A module sharing an alias with a nested namespace doesn't take over its index entry
+    assert get_alias("alias", root._nest, root._alias_index) is child
+    assert get_alias("alias", root._mod, root._mod_alias_index) is mod
+
+
+def test_add_child_parent():
+    root = Namespace("root")
+    leaf = root._add_child("a.b")
+    assert leaf.__ is root.a
+    assert leaf.__ref__ == "a.b"
+
+
+def test_ref_cached():
+    root = Namespace("root")
+    leaf = root._add_child("a.b")
+    assert leaf.__ref__ == "a.b"
+    assert leaf._ref_name[1] == "a.b"
+
+    # Renaming a parent changes the ref of its children
+    root.a.__name__ = "c"
+    assert leaf.__ref__ == "c.b"
+
+    # Re-parenting does too
+    other = root._add_child("d")
+    leaf.__ = other
+    assert leaf.__ref__ == "d.b"
+
+
+def test_new_namespace_keeps_refs():
+    root = Namespace("root")
+    leaf = root._add_child("a.b")
+    assert root["a.b"] is leaf
+
+    # Constructing namespaces doesn't invalidate the references cached so far
+    generation = pns._data.GENERATION
+    Namespace("other", parent=root, root=root)
+    assert pns._data.GENERATION == generation
+    assert root._cached_ref("a.b")[-1] is leaf
+
+
+def test_set_pop_nest():
+    root = Namespace("root")
+    child = Namespace("child", parent=root, root=root)
+    child._alias.add("alias")
+    root._set_nest("child", child)
+    assert root["alias"] is child
+
+    assert root._pop_nest("child") is child
+    assert root._cached_ref("alias") is None
+    assert get_alias("alias", root._nest, root._alias_index) is None
@@ -0,0 +1,142 @@
+import pathlib
+import sys
+
+import pytest
+
+import pns.dir
+import pns.mod
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(pns.dir, "CACHE_FILE", str(tmp_path / "dynamic.cache"))
+    monkeypatch.setattr(pns.dir, "_CACHE", None)
+    site = tmp_path / "site"
+    pkg = site / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "config.yaml").write_text("dyne:\n  foo:\n    - foo\n")
+    (site / "other").mkdir()
+    monkeypatch.setattr(sys, "path", [str(site)])
+    return pkg
+
+
+def test_dynamic_cache(cache, monkeypatch):
+    ret = pns.dir.dynamic()
+    assert ret.dyne.foo.paths == [cache / "foo"]
+
+    # A warm start doesn't parse config files again
+    monkeypatch.setattr(pns.dir, "_CACHE", None)
+    monkeypatch.setattr(pns.dir, "read_config", None)
+    ret = pns.dir.dynamic()
+    assert ret.dyne.foo.paths == [cache / "foo"]
+
+    # Changing the results doesn't change the cache
+    ret.dyne.foo.paths.append("bar")
+    assert pns.dir.dynamic().dyne.foo.paths == [cache / "foo"]
+
+
+def test_dynamic_cache_changed(cache):
+    pns.dir.dynamic()
+
+    (cache / "config.yaml").write_text("dyne:\n  foo:\n    - foo\n    - bar\n")
+    assert pns.dir.dynamic().dyne.foo.paths == [cache / "bar", cache / "foo"]
+
+    # A new package in the sys.path entry is discovered
+    new = cache.parent / "new"
+    new.mkdir()
+    (new / "config.yaml").write_text("dyne:\n  baz:\n    - baz\n")
+    assert pns.dir.dynamic().dyne.baz.paths == [new / "baz"]
+
+    # So is a config added to an existing directory
+    (cache.parent / "other" / "config.yaml").write_text("dyne:\n  qux:\n    - qux\n")
+    assert pns.dir.dynamic().dyne.qux.paths == [cache.parent / "other" / "qux"]
+
+
+def test_lazy_imports(tmp_path, monkeypatch):
+    (tmp_path / "lazy_pkg").mkdir()
+    (tmp_path / "lazy_pkg" / "__init__.py").write_text("")
+    (tmp_path / "lazy_pkg" / "sub.py").write_text("VALUE = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(pns.dir, "LAZY_IMPORTS", {})
+    monkeypatch.delitem(sys.modules, "lazy_pkg", raising=False)
+    monkeypatch.delitem(sys.modules, "lazy_pkg.sub", raising=False)
+
+    pns.dir.register_imports(["lazy_pkg.sub", "missing_lazy_pkg"])
+    assert "lazy_pkg" not in sys.modules
+
+    modules = pns.dir.LazyModules()
+    assert modules["lazy_pkg"].sub.VALUE == 1
+    assert "missing_lazy_pkg" not in modules
+    assert not pns.dir.LAZY_IMPORTS
+
+
+def test_mod_snapshots_pruned(cache, monkeypatch):
+    plugin = cache / "plugin_snapshot.py"
+    plugin.write_text("VALUE = 1\n")
+    monkeypatch.delitem(sys.modules, "plugin_snapshot", raising=False)
+    assert pns.mod.load_from_path("plugin_snapshot", cache, ext=".py").VALUE == 1
+    assert str(plugin) in pns.dir.load_cache()["mods"]
+
+    # Snapshots of removed files aren't saved
+    gone = cache / "gone.py"
+    pns.dir.load_cache()["mods"][str(gone)] = ((0, 0), str(gone), "gone")
+    pns.dir.flush_cache()
+    monkeypatch.setattr(pns.dir, "_CACHE", None)
+    assert list(pns.dir.load_cache()["mods"]) == [str(plugin)]
+
+    # A removed file's snapshot is forgotten when it is looked for
+    plugin.unlink()
+    assert pns.mod.load_from_path("plugin_snapshot", cache, ext=".py") is None
+    assert not pns.dir.load_cache()["mods"]
+
+
+def test_dynamic_cache_negative(cache, monkeypatch):
+    other = cache.parent / "other"
+    pns.dir.dynamic()
+    assert pns.dir.load_cache()["configs"][str(other / "config.yaml")]["stat"] is None
+
+    # A directory without a config.yaml isn't checked for one again until it changes
+    real_stat = pathlib.Path.stat
+    checked = []
+
+    def stat(self, *args, **kwargs):
+        checked.append(self)
+        return real_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(pathlib.Path, "stat", stat)
+    pns.dir.dynamic()
+    assert other / "config.yaml" not in checked
+
+
+def test_cache_pruned(cache):
+    pns.dir.dynamic()
+    gone = cache.parent / "gone"
+    data = pns.dir.load_cache()
+    data["entries"][str(gone)] = None
+    data["configs"][str(gone / "config.yaml")] = {"stat": None, "dir_mtime": 0}
+    pns.dir.save_cache(data)
+
+    # Entries for paths that were removed aren't saved
+    assert str(gone) not in data["entries"]
+    assert str(gone / "config.yaml") not in data["configs"]
+    assert str(cache / "config.yaml") in data["configs"]
+
+
+def test_cache_untrusted(cache, monkeypatch):
+    pns.dir.dynamic()
+    pathlib.Path(pns.dir.CACHE_FILE).chmod(0o666)
+
+    # A cache file that others could have written isn't loaded
+    monkeypatch.setattr(pns.dir, "_CACHE", None)
+    assert not pns.dir.load_cache()["configs"]
+
+
+def test_mod_snapshots_disabled(cache, monkeypatch):
+    monkeypatch.setattr(pns.dir, "CACHE_FILE", "")
+    plugin = cache / "plugin_no_snapshot.py"
+    plugin.write_text("VALUE = 1\n")
+    monkeypatch.delitem(sys.modules, "plugin_no_snapshot", raising=False)
+
+    # Without a cache file to save them in, no snapshots are kept
+    assert pns.mod.load_from_path("plugin_no_snapshot", cache, ext=".py").VALUE == 1
+    assert pns.dir._CACHE is None
@@ -0,0 +1,54 @@
+import asyncio
+import contextvars
+
+import pytest
+
+import pns.data
+import pns.loop
+
+VAR = contextvars.ContextVar("var", default=None)
+
+
+async def _get_var():
+    await asyncio.sleep(0)
+    return VAR.get()
+
+
+async def _raise():
+    raise ValueError("bridged")
+
+
+async def test_run_bridged():
+    bridged = pns.loop.METRICS["bridged"]
+    VAR.set("value")
+    # The caller's context is visible to the bridged coroutine
+    assert pns.loop.run(_get_var()) == "value"
+    assert pns.loop.run(_get_var()) == "value"
+    assert pns.loop.METRICS["bridged"] == bridged + 2
+    assert pns.loop.bridge_loop() is pns.loop.bridge_loop()
+
+    with pytest.raises(ValueError, match="bridged"):
+        pns.loop.run(_raise())
+
+
+async def _nested():
+    return pns.loop.run(_get_var())
+
+
+async def test_run_nested():
+    nested = pns.loop.METRICS["nested"]
+    assert pns.loop.run(_nested()) is None
+    assert pns.loop.METRICS["nested"] == nested + 1
+
+
+def test_run_sync():
+    assert pns.loop.run(_get_var()) is None
+
+
+async def test_lazy_load(hub):
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    bridged = pns.loop.METRICS["bridged"]
+    hub.mods._mod.clear()
+    pns.data.invalidate_refs()
+    assert await hub.mods.test.ping() == {}
+    assert pns.loop.METRICS["bridged"] == bridged + 1
@@ -0,0 +1,32 @@
+from pns.mod import LoadedMod
+
+
+def test_nest_priority():
+    mod = LoadedMod(name="mod")
+    mod._class["name"] = "class"
+    assert mod._nest["name"] == "class"
+    mod._var["name"] = "var"
+    assert mod._nest["name"] == "var"
+    mod._func["name"] = "func"
+    assert mod._nest["name"] == "func"
+
+    # Lower priority categories don't mask higher ones
+    mod._class["name"] = "new_class"
+    assert mod._nest["name"] == "func"
+
+    # Removing a name falls back to the next category
+    mod._func.pop("name")
+    assert mod._nest["name"] == "var"
+    del mod._var["name"]
+    assert mod._nest["name"] == "new_class"
+    mod._class.clear()
+    assert "name" not in mod._nest
+
+
+def test_nest_update():
+    mod = LoadedMod(name="mod")
+    mod._func.update({"a": 1}, b=2)
+    mod._var.setdefault("c", 3)
+    assert mod._nest == {"a": 1, "b": 2, "c": 3}
+    assert mod.a == 1
+    assert mod._nest is mod._nest
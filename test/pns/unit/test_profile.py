@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+import pns.profile
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    monkeypatch.setattr(pns.profile, "EVENTS", [])
+    monkeypatch.setattr(pns.profile, "ENABLED", False)
+    pns.profile.enable()
+    return pns.profile
+
+
+def test_span_disabled(monkeypatch):
+    monkeypatch.setattr(pns.profile, "EVENTS", [])
+    monkeypatch.setattr(pns.profile, "ENABLED", False)
+    with pns.profile.span("exec_module", "test"):
+        ...
+    assert not pns.profile.EVENTS
+
+
+def test_report(profile):
+    with profile.span("load_all", "mods"):
+        with profile.span("exec_module", "mods", "test"):
+            ...
+        with profile.span("exec_module", "mods", "foo"):
+            ...
+
+    report = profile.report()
+    assert list(report["categories"]) == ["load_all", "exec_module"]
+    assert report["categories"]["exec_module"]["count"] == 2
+    assert report["slowest"][0]["name"] == "mods"
+    assert {s["name"] for s in report["slowest"]} == {"mods", "mods.test", "mods.foo"}
+
+
+def test_trace(profile):
+    with profile.span("__init__", "mods.init"):
+        ...
+
+    (event,) = profile.trace()["traceEvents"]
+    assert event["name"] == "mods.init"
+    assert event["cat"] == "__init__"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+
+
+async def test_startup(hub, profile, tmp_path):
+    await hub.pop.sub.add(name="output")
+    await hub.pop.sub.add(locations=["test.pns.mods"])
+    await hub.mods._load_all()
+    profile.enable(False)
+
+    categories = profile.report()["categories"]
+    assert {"add_sub", "load_all", "contract.match"} <= set(categories)
+
+    dest = tmp_path / "trace.json"
+    count = len(profile.EVENTS)
+    await profile.emit(hub, str(dest))
+    trace = json.loads(dest.read_text())
+    assert len(trace["traceEvents"]) == count
+
+    # Emitting discards the spans, so the next profile doesn't repeat them
+    assert not profile.EVENTS
@@ -1,3 +1,6 @@
+import functools
+import inspect
+
 from pns.verify import sig
 
 
@@ -60,3 +63,67 @@ async def test_sig_error_shows_sig_path():
     assert "Enforcing signature: " in result[1]
     assert result[1].endswith("test_sigs.py::sig_test")
     assert len(result[1]) > 46
+
+
+async def test_sig_cache():
+    def sig_func(hub, name):
+        pass
+
+    def func(hub, name=None):
+        pass
+
+    result = sig(func, sig_func)
+    assert result == sig(func, sig_func)
+    # Callers may modify the errors without changing the cache
+    result.clear()
+    assert (
+        'func: Parameter "name" cannot have a default value' in sig(func, sig_func)[0]
+    )
+
+    def func(hub, name):  # noqa: F811
+        pass
+
+    # A new code object is verified again
+    assert sig(func, sig_func) == []
+
+
+async def test_sig_cache_wrapped():
+    def sig_func(hub, name):
+        pass
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    @decorator
+    def func(hub, name):
+        pass
+
+    assert sig(func, sig_func) == []
+
+    # The wrappers share a code object and name, the wrapped functions tell them apart
+    @decorator
+    def func(hub, name=None):  # noqa: F811
+        pass
+
+    assert (
+        'func: Parameter "name" cannot have a default value' in sig(func, sig_func)[0]
+    )
+
+
+async def test_sig_cache_defaults():
+    def sig_func(hub, name=None):
+        pass
+
+    def factory(default):
+        def func(hub, name=default):
+            pass
+
+        return func
+
+    assert sig(factory(None), sig_func) == []
+    # The same code object with different defaults is verified again
+    assert sig(factory(inspect._empty), sig_func)